@@ -40,9 +40,10 @@ def build_executable(target_platform=None):
             "--name=JavaSearchTool",        # 실행 파일 이름
             "--add-data=assets;assets",    # Windows 경로 구분자 사용
             "--hidden-import=customtkinter",
-            "--hidden-import=pandas",
             "--hidden-import=openpyxl",
             "--hidden-import=PIL",
+            "--hidden-import=pyarrow",          # Parquet 내보내기 (빌드 환경에 설치된 경우 포함)
+            "--hidden-import=pyarrow.parquet",
             "--hidden-import=src.gui.main_window",
             "--hidden-import=src.gui.search_panel",
             "--hidden-import=src.gui.results_panel",
@@ -50,8 +51,25 @@ def build_executable(target_platform=None):
             "--hidden-import=src.gui.settings_manager",
             "--hidden-import=src.core.search_engine",
             "--hidden-import=src.core.config_manager",
-            "--exclude-module=matplotlib",  # 불필요한 모듈 제외
-            "--exclude-module=numpy",       # pandas에서 자동으로 포함됨
+            "--hidden-import=src.core.trigram_index",
+            "--hidden-import=src.core.matching",
+            "--hidden-import=src.core.process_backend",
+            "--hidden-import=src.core.scheduler",
+            "--hidden-import=src.core.file_walker",
+            "--hidden-import=src.core.multi_keyword",
+            "--hidden-import=src.core.result_store",
+            "--hidden-import=src.core.file_filter",
+            "--hidden-import=src.core.literal_search",
+            "--hidden-import=src.core.regex_prefilter",
+            "--hidden-import=src.core.result_feed",
+            "--hidden-import=src.core.result_export",
+            "--hidden-import=src.core.listing_cache",
+            "--hidden-import=src.core.result_cache",
+            "--hidden-import=src.core.content_dedupe",
+            "--hidden-import=src.core.search_daemon",
+            "--hidden-import=src.cli.search_cli",
+            "--hidden-import=src.cli.daemon_cli",
+            "--exclude-module=matplotlib",  # 불필요한 모듈 제외 (numpy는 pyarrow가 사용하므로 제외하지 않음)
             "--exclude-module=scipy",       # 불필요한 모듈 제외
             "--exclude-module=IPython",     # 불필요한 모듈 제외
             "--exclude-module=jupyter",     # 불필요한 모듈 제외
@@ -71,9 +89,10 @@ def build_executable(target_platform=None):
             "--name=JavaSearchTool",        # 실행 파일 이름
             "--add-data=assets:assets",    # assets 폴더 포함
             "--hidden-import=customtkinter",
-            "--hidden-import=pandas",
             "--hidden-import=openpyxl",
             "--hidden-import=PIL",
+            "--hidden-import=pyarrow",          # Parquet 내보내기 (빌드 환경에 설치된 경우 포함)
+            "--hidden-import=pyarrow.parquet",
             "--hidden-import=src.gui.main_window",
             "--hidden-import=src.gui.search_panel",
             "--hidden-import=src.gui.results_panel",
@@ -81,8 +100,25 @@ def build_executable(target_platform=None):
             "--hidden-import=src.gui.settings_manager",
             "--hidden-import=src.core.search_engine",
             "--hidden-import=src.core.config_manager",
-            "--exclude-module=matplotlib",  # 불필요한 모듈 제외
-            "--exclude-module=numpy",       # pandas에서 자동으로 포함됨
+            "--hidden-import=src.core.trigram_index",
+            "--hidden-import=src.core.matching",
+            "--hidden-import=src.core.process_backend",
+            "--hidden-import=src.core.scheduler",
+            "--hidden-import=src.core.file_walker",
+            "--hidden-import=src.core.multi_keyword",
+            "--hidden-import=src.core.result_store",
+            "--hidden-import=src.core.file_filter",
+            "--hidden-import=src.core.literal_search",
+            "--hidden-import=src.core.regex_prefilter",
+            "--hidden-import=src.core.result_feed",
+            "--hidden-import=src.core.result_export",
+            "--hidden-import=src.core.listing_cache",
+            "--hidden-import=src.core.result_cache",
+            "--hidden-import=src.core.content_dedupe",
+            "--hidden-import=src.core.search_daemon",
+            "--hidden-import=src.cli.search_cli",
+            "--hidden-import=src.cli.daemon_cli",
+            "--exclude-module=matplotlib",  # 불필요한 모듈 제외 (numpy는 pyarrow가 사용하므로 제외하지 않음)
             "--exclude-module=scipy",       # 불필요한 모듈 제외
             "--exclude-module=IPython",     # 불필요한 모듈 제외
             "--exclude-module=jupyter",     # 불필요한 모듈 제외
@@ -4,10 +4,13 @@ Java Search Tool - Eclipse Style
 메인 실행 파일 (최적화된 버전)
 
 Eclipse의 검색 기능과 유사한 GUI를 제공하는 Java 프로젝트 검색 도구입니다.
+GUI 없이 검색하려면: python main.py --cli <키워드> [디렉토리] [옵션] (python main.py --cli -h 로 옵션 확인)
+검색 데몬을 실행하려면: python main.py --daemon [미리 로드할 디렉토리...] (실행 중이면 GUI/CLI가 자동으로 사용)
 """
 
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
 # 프로젝트 루트를 sys.path에 추가
@@ -15,7 +18,15 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 def main():
-    """메인 함수 (지연 로딩 적용)"""
+    """메인 함수 (지연 로딩 적용, --cli이면 GUI 없이 명령줄 검색, --daemon이면 검색 데몬)"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--cli":
+        # GUI 모듈(tkinter, customtkinter)은 로드하지 않음
+        from src.cli import run_cli
+        sys.exit(run_cli(sys.argv[2:]))
+    if len(sys.argv) > 1 and sys.argv[1] == "--daemon":
+        from src.cli import run_daemon
+        sys.exit(run_daemon(sys.argv[2:]))
+    
     try:
         # GUI 애플리케이션 시작 (지연 로딩)
         print("Java Search Tool을 시작합니다...")
@@ -41,5 +52,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # 프로세스 풀 검색 백엔드가 실행 파일(PyInstaller)에서도 동작하도록 설정
+    multiprocessing.freeze_support()
     main()
 
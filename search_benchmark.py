@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Java Search Tool 검색 엔진 벤치마크 스크립트
+검색 백엔드와 검색 방식별 소요 시간을 측정합니다.
+
+사용법:
+    python search_benchmark.py <검색 디렉토리> [정규식] [리터럴 키워드] [사전 필터 비교 정규식...]
+
+내보내기 형식별 처리량은 리터럴 키워드 검색 결과로 측정합니다 (Parquet는 pyarrow가 설치된 경우만).
+"""
+
+import io
+import re
+import sys
+import time
+import contextlib
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+# CPU를 많이 사용하는 기본 정규식 (필수 리터럴이 없어 인덱스로 후보를 줄일 수 없음)
+DEFAULT_CPU_HEAVY_PATTERN = r"(?:[a-z]+\s+){3}[A-Z]\w*\("
+# 리터럴 검색 비교용 기본 키워드
+DEFAULT_LITERAL_KEYWORD = "String"
+# 필수 리터럴 사전 필터 비교용 기본 정규식
+DEFAULT_PREFILTER_PATTERNS = (r"@Transactional\(.*readOnly", r"class \w+Service", r"\w+Service\(")
+REPEAT = 3
+
+
+def measure(search_fn, repeat: int = REPEAT):
+    """검색 함수를 반복 실행하여 (최소 소요 시간, 결과 수) 반환"""
+    best = None
+    count = 0
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            results = search_fn()
+            elapsed = time.perf_counter() - start
+        count = len(results)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+
+def benchmark_backends(search_dir: str, keyword: str):
+    """스레드 풀과 프로세스 풀 백엔드의 검색 시간을 비교합니다."""
+    from src.core.search_engine import SearchEngine, SEARCH_BACKENDS
+
+    print("\n⚙️ 검색 백엔드 비교")
+    print("-" * 30)
+
+    timings = {}
+    for backend in SEARCH_BACKENDS:
+        engine = SearchEngine(backend=backend)
+        try:
+            # 프로세스 풀 시작 비용은 첫 검색에서 한 번만 발생하므로 측정에서 제외
+            measure(lambda: engine.search(search_dir, keyword, use_index=False), repeat=1)
+            elapsed, count = measure(lambda: engine.search(search_dir, keyword, use_index=False))
+        finally:
+            engine.shutdown()
+        timings[backend] = elapsed
+        print(f"{backend:>8}: {elapsed:.2f}초 ({count}건)")
+
+    if timings.get("process"):
+        print(f"프로세스 풀 가속: {timings['thread'] / timings['process']:.2f}배")
+
+
+def benchmark_literal(search_dir: str, keyword: str):
+    """리터럴 검색(find 기반)과 같은 키워드의 정규식 검색 시간을 비교합니다."""
+    from src.core.search_engine import SearchEngine
+
+    print("\n🔤 리터럴 검색 비교")
+    print("-" * 30)
+
+    engine = SearchEngine()
+    try:
+        for case_sensitive in (False, True):
+            for whole_word in (False, True):
+                options = dict(case_sensitive=case_sensitive, use_index=False)
+                literal_time, literal_count = measure(
+                    lambda: engine.search(search_dir, keyword, use_regex=False, whole_word=whole_word, **options))
+                regex_keyword = rf"\b{re.escape(keyword)}\b" if whole_word else re.escape(keyword)
+                regex_time, regex_count = measure(
+                    lambda: engine.search(search_dir, regex_keyword, use_regex=True, **options))
+                label = f"{'대소문자 구분' if case_sensitive else '대소문자 무시'}{', 단어 단위' if whole_word else ''}"
+                print(f"{label}: 리터럴 {literal_time:.2f}초 ({literal_count}건) / "
+                      f"정규식 {regex_time:.2f}초 ({regex_count}건) → {regex_time / literal_time:.2f}배")
+    finally:
+        engine.shutdown()
+
+
+def benchmark_prefilter(search_dir: str, patterns):
+    """필수 리터럴 사전 필터를 켜고 끈 정규식 검색 시간을 비교합니다."""
+    from src.core.search_engine import SearchEngine
+
+    print("\n🧹 필수 리터럴 사전 필터 비교")
+    print("-" * 30)
+
+    engine = SearchEngine()
+    try:
+        for pattern in patterns:
+            engine.use_prefilter = True
+            on_time, on_count = measure(lambda: engine.search(search_dir, pattern, use_index=False))
+            stats = engine.last_search_stats
+            engine.use_prefilter = False
+            off_time, off_count = measure(lambda: engine.search(search_dir, pattern, use_index=False))
+            print(f"{pattern}: 리터럴 {stats.get('prefilter_literals')}, "
+                  f"제외 {stats.get('prefilter_skipped_files', 0)}/{stats.get('files_total', 0)}개 파일")
+            print(f"  필터 사용 {on_time:.2f}초 ({on_count}건) / 미사용 {off_time:.2f}초 ({off_count}건) "
+                  f"→ {off_time / on_time:.2f}배")
+    finally:
+        engine.shutdown()
+
+
+def benchmark_export(search_dir: str, keyword: str):
+    """검색 결과를 형식별로 내보내 처리량(초당 행 수)과 파일 크기를 비교합니다."""
+    from src.core.search_engine import SearchEngine
+    from src.core.result_export import EXPORT_EXTENSIONS, EXPORT_FORMAT_LABELS
+
+    print("\n💾 내보내기 형식 비교")
+    print("-" * 30)
+
+    engine = SearchEngine()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = engine.search(search_dir, keyword, use_regex=False, use_index=False)
+        print(f"내보낼 결과: {len(results)}건")
+        if not results:
+            return
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for extension, export_format in EXPORT_EXTENSIONS.items():
+                if extension == ".ndjson":
+                    continue
+                output_file = Path(temp_dir) / f"results{extension}"
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    success = engine.export_results(results, str(output_file))
+                    elapsed = time.perf_counter() - start
+                label = EXPORT_FORMAT_LABELS[export_format]
+                if not success:
+                    print(f"{label:>10}: 건너뜀 (필요한 패키지 없음)")
+                    continue
+                size_mb = output_file.stat().st_size / 1024 / 1024
+                print(f"{label:>10}: {elapsed:.2f}초, {len(results) / elapsed:,.0f}행/초, {size_mb:.1f}MB")
+    finally:
+        engine.shutdown()
+
+
+def main():
+    """메인 함수"""
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    search_dir = sys.argv[1]
+    keyword = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_CPU_HEAVY_PATTERN
+    literal_keyword = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_LITERAL_KEYWORD
+    prefilter_patterns = sys.argv[4:] or DEFAULT_PREFILTER_PATTERNS
+
+    print("🔍 검색 엔진 벤치마크를 시작합니다...")
+    print(f"💻 시스템: {sys.platform}")
+    print(f"📁 검색 디렉토리: {search_dir}")
+    print(f"🔤 검색 패턴: {keyword}")
+
+    benchmark_backends(search_dir, keyword)
+    benchmark_literal(search_dir, literal_keyword)
+    benchmark_prefilter(search_dir, prefilter_patterns)
+    benchmark_export(search_dir, literal_keyword)
+
+    print("\n✅ 벤치마크 완료!")
+
+
+if __name__ == "__main__":
+    main()
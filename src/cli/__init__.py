@@ -0,0 +1,10 @@
+# CLI 패키지 (GUI 모듈 없이 검색 엔진만 사용)
+from .search_cli import build_parser, run_cli
+from .daemon_cli import build_daemon_parser, run_daemon
+
+__all__ = [
+    'build_parser',
+    'run_cli',
+    'build_daemon_parser',
+    'run_daemon'
+]
@@ -0,0 +1,16 @@
+"""python -m src.cli 로 실행하는 명령줄 검색 (--daemon이면 검색 데몬)"""
+
+import sys
+import multiprocessing
+
+from .daemon_cli import run_daemon
+from .search_cli import run_cli
+
+
+if __name__ == "__main__":
+    # 프로세스 풀 검색 백엔드가 실행 파일(PyInstaller)에서도 동작하도록 설정
+    multiprocessing.freeze_support()
+    # python -m src.cli --daemon ... 이면 검색 데몬
+    if len(sys.argv) > 1 and sys.argv[1] == "--daemon":
+        sys.exit(run_daemon(sys.argv[2:]))
+    sys.exit(run_cli())
@@ -0,0 +1,79 @@
+import argparse
+import json
+import signal
+import sys
+from typing import Optional, Sequence
+
+from ..core.search_daemon import DEFAULT_EXTENSIONS, DaemonClient, SearchDaemon
+from ..core.search_engine import BACKEND_THREAD, SEARCH_BACKENDS, SearchEngine
+from .search_cli import EXIT_ERROR, EXIT_FOUND, EXIT_NOT_FOUND, split_list
+
+
+def build_daemon_parser() -> argparse.ArgumentParser:
+    """검색 데몬 명령줄 파서"""
+    parser = argparse.ArgumentParser(
+        prog="main.py --daemon",
+        description="검색 엔진과 캐시/인덱스를 메모리에 유지하는 로컬 검색 데몬을 실행합니다. "
+                    "실행 중이면 GUI와 명령줄 검색이 자동으로 데몬을 사용합니다.",
+    )
+    parser.add_argument("roots", nargs="*", help="시작할 때 미리 로드할 검색 디렉토리")
+    parser.add_argument("-e", "--ext", action="append",
+                        help=f"미리 로드할 확장자 (쉼표 구분, 반복 가능, 기본: {', '.join(DEFAULT_EXTENSIONS)})")
+    parser.add_argument("-x", "--exclude", action="append", help="미리 로드할 때의 제외 패턴 (쉼표 구분, 반복 가능)")
+    parser.add_argument("--port", type=int, default=0, help="수신 포트 (기본: 사용 가능한 포트 자동 선택)")
+    parser.add_argument("--backend", choices=SEARCH_BACKENDS, default=BACKEND_THREAD, help="검색 백엔드")
+    parser.add_argument("--status", action="store_true", help="실행 중인 데몬의 상태를 JSON으로 출력")
+    parser.add_argument("--register", metavar="DIR", help="실행 중인 데몬에 검색 디렉토리를 등록하고 미리 로드")
+    parser.add_argument("--clear-cache", action="store_true", help="실행 중인 데몬의 결과 캐시 비우기")
+    parser.add_argument("--stop", action="store_true", help="실행 중인 데몬 종료")
+    return parser
+
+
+def run_daemon(argv: Optional[Sequence[str]] = None) -> int:
+    """검색 데몬 실행 또는 실행 중인 데몬 제어 (--status, --register, --clear-cache, --stop)
+
+    Returns:
+        종료 코드 (성공 0, 실행 중인 데몬 없음 1, 오류 2)
+    """
+    args = build_daemon_parser().parse_args(argv)
+    file_extensions = tuple(split_list(args.ext) or DEFAULT_EXTENSIONS)
+    exclude_patterns = split_list(args.exclude)
+
+    if args.status or args.register or args.clear_cache or args.stop:
+        client = DaemonClient.discover()
+        if client is None:
+            print("실행 중인 검색 데몬이 없습니다.", file=sys.stderr)
+            return EXIT_NOT_FOUND
+        try:
+            if args.register:
+                print(json.dumps(client.register_root(args.register, file_extensions, exclude_patterns),
+                                 ensure_ascii=False, indent=2))
+            if args.clear_cache:
+                freed = client.clear_result_cache()
+                print(f"검색 데몬의 결과 캐시를 비웠습니다. ({freed / (1024 * 1024):.1f} MB)", file=sys.stderr)
+            if args.status:
+                print(json.dumps(client.status(), ensure_ascii=False, indent=2))
+            if args.stop:
+                client.shutdown_daemon()
+                print("검색 데몬을 종료했습니다.", file=sys.stderr)
+        except (OSError, ValueError) as e:
+            print(f"오류: {e}", file=sys.stderr)
+            return EXIT_ERROR
+        return EXIT_FOUND
+
+    if DaemonClient.discover() is not None:
+        print("검색 데몬이 이미 실행 중입니다. (--stop으로 종료)", file=sys.stderr)
+        return EXIT_ERROR
+
+    try:
+        daemon = SearchDaemon(SearchEngine(backend=args.backend), port=args.port)
+    except OSError as e:
+        print(f"검색 데몬을 시작할 수 없습니다: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    # 종료 신호를 받아도 상태 파일을 정리하고 끝나도록 함
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.serve_forever(args.roots, file_extensions, exclude_patterns)
+    except KeyboardInterrupt:
+        pass
+    return EXIT_FOUND
@@ -0,0 +1,206 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+from typing import List, Optional, Sequence, TextIO
+
+from ..core.file_filter import DEFAULT_MAX_FILE_SIZE_MB
+from ..core.multi_keyword import load_keywords
+from ..core.result_export import KEYWORD_COLUMN, export_columns, iter_export_rows
+from ..core.result_store import ResultRow
+from ..core.search_daemon import DaemonClient
+from ..core.search_engine import BACKEND_THREAD, SEARCH_BACKENDS, SearchEngine
+
+
+# 결과 출력 형식 (grep: 경로:라인:내용, jsonl: JSON Lines 내보내기와 같은 키의 객체)
+OUTPUT_FORMAT_GREP = "grep"
+OUTPUT_FORMAT_JSONL = "jsonl"
+OUTPUT_FORMATS = (OUTPUT_FORMAT_GREP, OUTPUT_FORMAT_JSONL)
+DEFAULT_EXTENSIONS = (".java", ".xml", ".properties")
+
+# 종료 코드 (grep과 같이 결과 있음 0, 없음 1, 오류 2)
+EXIT_FOUND = 0
+EXIT_NOT_FOUND = 1
+EXIT_ERROR = 2
+EXIT_INTERRUPTED = 130
+
+
+class HitPrinter:
+    """result_callback: 검색 중 추가된 결과 행을 배치마다 바로 출력
+
+    출력을 받는 프로세스가 먼저 끝나면(head 등) 검색을 취소하고 더 이상 쓰지 않습니다.
+    """
+
+    def __init__(self, out: TextIO, output_format: str, searcher):
+        self.out = out
+        self.output_format = output_format
+        # 검색을 실행하는 SearchEngine 또는 DaemonClient (취소용)
+        self.searcher = searcher
+        self.printed = 0
+        self.broken = False
+
+    def __call__(self, rows: List[ResultRow]):
+        if self.broken or not rows:
+            return
+        try:
+            if self.output_format == OUTPUT_FORMAT_JSONL:
+                columns = export_columns(rows[0].store)
+                names = [name for name, _ in columns]
+                for row in iter_export_rows(rows, KEYWORD_COLUMN in columns, content_limit=None):
+                    self.out.write(json.dumps(dict(zip(names, row)), ensure_ascii=False))
+                    self.out.write("\n")
+            else:
+                for row in rows:
+                    self.out.write(f"{row.file_path}:{row.line_number}:{row.content}\n")
+            self.out.flush()
+            self.printed += len(rows)
+        except BrokenPipeError:
+            self.broken = True
+            self.searcher.cancel_current_search()
+
+
+def split_list(values: Optional[Sequence[str]]) -> List[str]:
+    """쉼표로 구분된 값(옵션 반복 가능)을 목록으로 (GUI 입력란과 같은 형식)"""
+    items = []
+    for value in values or []:
+        items.extend(item.strip() for item in value.split(",") if item.strip())
+    return items
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """검색 패널(SearchPanel.get_search_config)과 같은 검색 옵션의 명령줄 파서"""
+    parser = argparse.ArgumentParser(
+        prog="main.py --cli",
+        description="GUI 없이 Java 프로젝트를 검색하고 결과를 표준 출력으로 바로 내보냅니다.",
+    )
+    parser.add_argument("keyword", nargs="?", help="검색할 키워드 (--keyword-file을 쓰면 생략)")
+    parser.add_argument("search_dir", nargs="?", default=".", help="검색할 디렉토리 (기본: 현재 디렉토리)")
+    parser.add_argument("-F", "--fixed-strings", action="store_true", help="정규표현식을 쓰지 않고 리터럴로 검색")
+    parser.add_argument("-s", "--case-sensitive", action="store_true", help="대소문자 구분")
+    parser.add_argument("-w", "--word", action="store_true", help="단어 단위 검색")
+    parser.add_argument("-m", "--multi-keyword", action="store_true", help="키워드를 쉼표로 나눠 한 번에 검색")
+    parser.add_argument("-f", "--keyword-file", help="키워드 파일 (한 줄에 하나, 첫 위치 인자는 디렉토리)")
+    parser.add_argument("--no-recursive", action="store_true", help="하위 디렉토리를 검색하지 않음")
+    parser.add_argument("--max-depth", type=int, help="최대 하위 디렉토리 깊이 (기본: 제한 없음)")
+    parser.add_argument("--include-binary", action="store_true", help="바이너리 파일도 검색")
+    parser.add_argument("--dedupe", action="store_true", help="동일 내용 파일은 한 번만 검색")
+    parser.add_argument("-e", "--ext", action="append",
+                        help=f"검색할 확장자 (쉼표 구분, 반복 가능, 기본: {', '.join(DEFAULT_EXTENSIONS)})")
+    parser.add_argument("-x", "--exclude", action="append", help="제외 패턴 (쉼표 구분, 반복 가능, 예: */target/*)")
+    parser.add_argument("--encoding", default="utf-8", help="파일 인코딩 (기본: utf-8)")
+    parser.add_argument("--max-results", type=int, help="최대 결과 수 (기본: 제한 없음)")
+    parser.add_argument("--max-file-size", type=float, default=DEFAULT_MAX_FILE_SIZE_MB,
+                        help=f"검색할 최대 파일 크기 MB (0이면 제한 없음, 기본: {DEFAULT_MAX_FILE_SIZE_MB})")
+    parser.add_argument("-o", "--output", help="결과 파일 (.xlsx, .csv, .jsonl, .parquet 확장자로 형식 결정)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default=OUTPUT_FORMAT_GREP,
+                        help="표준 출력 형식 (기본: grep)")
+    parser.add_argument("--backend", choices=SEARCH_BACKENDS,
+                        help=f"검색 백엔드 (지정하면 데몬 대신 이 프로세스에서 검색, 기본: {BACKEND_THREAD})")
+    parser.add_argument("--no-index", action="store_true", help="트라이그램 인덱스를 사용하지 않음")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="디렉토리 목록/결과 캐시를 사용하지 않음 (데몬 대신 이 프로세스에서 검색)")
+    parser.add_argument("--no-daemon", action="store_true", help="실행 중인 검색 데몬을 사용하지 않음")
+    parser.add_argument("--stats", action="store_true", help="검색 통계를 표준 오류로 출력")
+    return parser
+
+
+def _print_stats(stats: dict, printed: int):
+    """검색 통계 요약을 표준 오류로 출력"""
+    print(f"결과 {printed}건, 파일 {stats.get('files_total', 0)}개, {stats.get('elapsed_time', 0):.2f}초",
+          file=sys.stderr)
+    if stats.get("daemon"):
+        print(f"  검색 데몬 사용: 왕복 {stats['round_trip_time']:.3f}초"
+              f" (대기 {stats.get('daemon_queue_time', 0):.3f}초)", file=sys.stderr)
+    for key in ("bytes_scanned", "index_skipped_files", "prefilter_skipped_files", "binary_skipped_files",
+                "result_cache_hits", "result_cache_misses", "duplicate_skipped_files", "duplicate_skipped_bytes",
+                "listing_reused_dirs", "listing_relisted_dirs"):
+        if key in stats:
+            print(f"  {key}: {stats[key]}", file=sys.stderr)
+
+
+def run_cli(argv: Optional[Sequence[str]] = None) -> int:
+    """명령줄 검색 실행 (tkinter/customtkinter를 로드하지 않음)
+
+    결과는 검색 중 배치마다 표준 출력으로 내보내고, 검색 엔진의 진행 메시지는 표준 오류로 보냅니다.
+    검색 데몬이 실행 중이면 데몬에서 검색합니다. (--no-daemon, --no-cache, --backend를 지정하면 이 프로세스에서 검색)
+
+    Returns:
+        종료 코드 (결과 있음 0, 없음 1, 오류 2, 중단 130)
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    keyword = args.keyword or ""
+    search_dir = args.search_dir
+    keywords = None
+    try:
+        if args.keyword_file:
+            # 키워드 파일을 쓰면 첫 위치 인자는 디렉토리
+            if args.keyword:
+                search_dir = args.keyword
+            keywords = load_keywords(args.keyword_file, args.encoding)
+            keyword = ""
+        elif args.multi_keyword:
+            keywords = split_list([keyword])
+    except OSError as e:
+        print(f"키워드 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return EXIT_ERROR
+
+    if not keyword and not keywords:
+        parser.print_usage(sys.stderr)
+        print("오류: 검색할 키워드를 입력해주세요.", file=sys.stderr)
+        return EXIT_ERROR
+
+    # 내보내기와 로컬 검색용 엔진 (프로세스 풀은 검색할 때 생성)
+    engine = SearchEngine(backend=args.backend or BACKEND_THREAD)
+    if args.no_cache:
+        engine.use_listing_cache = False
+        engine.use_result_cache = False
+    local_only = args.no_daemon or args.no_cache or args.backend is not None
+    searcher = (None if local_only else DaemonClient.discover()) or engine
+    printer = HitPrinter(sys.stdout, args.format, searcher)
+    try:
+        # 검색 엔진의 진행/오류 메시지는 결과 출력과 섞이지 않도록 표준 오류로 보냄
+        with contextlib.redirect_stdout(sys.stderr):
+            results = searcher.search(
+                search_dir=search_dir,
+                keyword=keyword,
+                use_regex=not args.fixed_strings,
+                case_sensitive=args.case_sensitive,
+                whole_word=args.word,
+                keywords=keywords or None,
+                max_results=args.max_results,
+                # 하위 디렉토리 검색을 끄면 검색 디렉토리만 탐색
+                max_depth=0 if args.no_recursive else args.max_depth,
+                include_binary=args.include_binary,
+                # 0 이하면 파일 크기 제한 없음
+                max_file_size=int(args.max_file_size * 1024 * 1024) if args.max_file_size > 0 else None,
+                dedupe_content=args.dedupe,
+                file_extensions=tuple(split_list(args.ext) or DEFAULT_EXTENSIONS),
+                exclude_patterns=split_list(args.exclude),
+                file_encoding=args.encoding,
+                use_index=not args.no_index,
+                result_callback=printer,
+            )
+            if args.output and results and not printer.broken:
+                if not engine.export_results(results, args.output):
+                    return EXIT_ERROR
+    except (ValueError, ConnectionError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return EXIT_ERROR
+    except KeyboardInterrupt:
+        searcher.cancel_current_search()
+        return EXIT_INTERRUPTED
+    finally:
+        engine.shutdown()
+
+    if printer.broken:
+        # 닫힌 파이프에 종료 시 남은 버퍼를 쓰지 않도록 표준 출력을 /dev/null로 교체
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return EXIT_FOUND
+
+    if args.stats:
+        _print_stats(searcher.last_search_stats, printer.printed)
+    return EXIT_FOUND if results else EXIT_NOT_FOUND
@@ -20,7 +20,14 @@ class ConfigManager:
             "file_extensions": [".java", ".xml", ".properties"],
             "exclude_patterns": ["*/target/*", "*/build/*", "*/.git/*", "*/node_modules/*"],
             "file_encoding": "utf-8",
+            "include_binary": False,
+            "dedupe_content": False,
+            "use_daemon": True,
+            "max_file_size_mb": 20,
+            "search_backend": "thread",
             "output_file": "search_results.xlsx",
+            "export_split": "file",
+            "result_cache_mb": 256,
             "recent_searches": [],
             "recent_directories": [],
             "window_geometry": "800x600+100+100",
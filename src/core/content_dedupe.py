@@ -0,0 +1,69 @@
+import hashlib
+import threading
+from typing import Dict, List, Optional
+
+from .matching import Match
+
+
+# 파일 내용 해시 길이 (바이트)
+CONTENT_DIGEST_SIZE = 16
+
+
+class ContentDedupe:
+    """검색 1회 동안 파일 내용 해시별 매칭 목록 (바이트가 같은 파일은 한 번만 검색)
+
+    scan_file()이 파일을 읽은 뒤 내용 해시를 계산해 이미 검색한 내용이면 정규식을 실행하지 않고
+    저장된 매칭 목록을 그대로 돌려줍니다. 파일별 해시는 결과 보기에서 같은 내용의 파일을 접을 때 사용합니다.
+    검색 워커 스레드에서 동시에 사용하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self):
+        self._matches: Dict[bytes, List[Match]] = {}
+        self._digests: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        # 같은 내용이 이미 검색되어 건너뛴 파일 수/바이트 수
+        self.duplicate_files = 0
+        self.duplicate_bytes = 0
+
+    @staticmethod
+    def digest(data, length: int) -> bytes:
+        """읽어 둔 버퍼(bytearray/mmap) 앞 length 바이트의 내용 해시"""
+        with memoryview(data) as view, view[:length] as content:
+            return hashlib.blake2b(content, digest_size=CONTENT_DIGEST_SIZE).digest()
+
+    def lookup(self, file_path: str, digest: bytes, length: int) -> Optional[List[Match]]:
+        """파일 해시를 기록하고, 같은 내용을 이미 검색했으면 그 매칭 목록을 반환 (처음이면 None)"""
+        with self._lock:
+            self._digests[file_path] = digest
+            matches = self._matches.get(digest)
+            if matches is not None:
+                self.duplicate_files += 1
+                self.duplicate_bytes += length
+            return matches
+
+    def store(self, digest: bytes, matches: List[Match]):
+        """새로 검색한 내용의 매칭 목록 저장 (동시에 검색한 경우 먼저 저장된 목록 유지)"""
+        with self._lock:
+            self._matches.setdefault(digest, matches)
+
+    def record(self, file_path: str, digest: bytes, matches: Optional[List[Match]] = None):
+        """다른 곳(프로세스 워커, 결과 캐시)에서 얻은 파일 해시와 매칭 목록 기록"""
+        with self._lock:
+            self._digests[file_path] = digest
+            if matches is not None:
+                self._matches.setdefault(digest, matches)
+
+    def add_duplicates(self, files: int, length: int):
+        """프로세스 워커가 건너뛴 중복 파일 수/바이트 수 합산"""
+        with self._lock:
+            self.duplicate_files += files
+            self.duplicate_bytes += length
+
+    def digest_of(self, file_path: str) -> Optional[bytes]:
+        """파일의 내용 해시 (읽지 않은 파일이면 None)"""
+        return self._digests.get(file_path)
+
+    def pop_digest(self, file_path: str) -> Optional[bytes]:
+        """파일의 내용 해시를 꺼내고 기록에서 제거 (프로세스 워커에서 메인 프로세스로 넘길 때)"""
+        with self._lock:
+            return self._digests.pop(file_path, None)
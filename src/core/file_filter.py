@@ -0,0 +1,49 @@
+import threading
+from typing import Dict
+
+
+# 바이너리 판별에 사용할 파일 앞부분 크기
+SNIFF_BYTES = 8192
+# 제어 문자 비율이 이 값을 넘으면 바이너리로 판단
+BINARY_CONTROL_RATIO = 0.3
+# 기본 최대 파일 크기 (MB)
+DEFAULT_MAX_FILE_SIZE_MB = 20
+
+# 텍스트로 취급하는 바이트 (\b \t \n \f \r ESC, 출력 가능한 ASCII, 0x80 이상은 멀티바이트 인코딩)
+TEXT_BYTES = bytes({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x7f)) | set(range(0x80, 0x100)))
+
+
+def is_binary_data(head: bytes) -> bool:
+    """파일 앞부분으로 바이너리 여부 판별 (NUL 바이트가 있거나 제어 문자가 많으면 바이너리)"""
+    if not head:
+        return False
+    if b"\x00" in head:
+        return True
+    control_bytes = head.translate(None, TEXT_BYTES)
+    return len(control_bytes) / len(head) > BINARY_CONTROL_RATIO
+
+
+class BinaryCache:
+    """바이너리로 판별된 파일 캐시 (수정 시간이 바뀌면 다시 판별)
+
+    텍스트 파일은 어차피 전체를 읽어야 하므로 바이너리 판별 결과만 보관합니다.
+    """
+
+    def __init__(self):
+        self._binary_files: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def is_binary(self, file_path: str, mtime_ns: int) -> bool:
+        """같은 수정 시간으로 바이너리 판별된 적이 있는지 확인"""
+        return self._binary_files.get(file_path) == mtime_ns
+
+    def add(self, file_path: str, mtime_ns: int):
+        with self._lock:
+            self._binary_files[file_path] = mtime_ns
+
+    def clear(self):
+        with self._lock:
+            self._binary_files.clear()
+
+    def __len__(self) -> int:
+        return len(self._binary_files)
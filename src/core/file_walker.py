@@ -0,0 +1,171 @@
+import os
+import re
+import fnmatch
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .listing_cache import DirectoryListingCache
+
+
+# 워커가 반환하는 항목: (파일 경로, stat 결과)
+WalkEntry = Tuple[str, os.stat_result]
+
+
+class ExcludeMatcher:
+    """glob 제외 패턴을 하나의 정규식으로 합친 매처
+
+    '/'가 들어간 패턴(예: */target/*)은 전체 경로에, 없는 패턴(예: *.min.js, node_modules)은
+    마지막 경로 구성요소에 매칭됩니다. 경로 구분자는 '/'로 통일하고 대소문자를 구분하지 않습니다.
+    root를 주면 검색 디렉토리 아래의 경로("/" + 상대 경로)에만 매칭하므로,
+    검색 디렉토리의 상위 디렉토리 이름(예: /tmp/build/proj의 build)으로는 제외되지 않습니다.
+    """
+
+    def __init__(self, patterns: Optional[List[str]] = None):
+        self.patterns = [p.strip().replace("\\", "/") for p in (patterns or []) if p.strip()]
+        translated = []
+        for pattern in self.patterns:
+            if "/" not in pattern:
+                # 이름 패턴은 어느 디렉토리 아래에 있든 마지막 구성요소와 매칭
+                pattern = "*/" + pattern
+            translated.append(fnmatch.translate(pattern.lower()))
+        self._regex = re.compile("|".join(translated)) if translated else None
+
+    def __bool__(self) -> bool:
+        return self._regex is not None
+
+    @staticmethod
+    def _normalize(path: str, root: str = "") -> str:
+        if root:
+            # 검색 디렉토리 아래 부분만 남김 (탐색기가 반환하는 경로는 항상 root로 시작)
+            path = path[len(root.rstrip(os.sep)):]
+        return path.replace(os.sep, "/").lower() if os.sep != "/" else path.lower()
+
+    def match_file(self, path: str, root: str = "") -> bool:
+        """파일 경로가 제외 대상인지 확인"""
+        return self._regex is not None and self._regex.match(self._normalize(path, root)) is not None
+
+    def match_dir(self, path: str, root: str = "") -> bool:
+        """디렉토리를 통째로 제외할 수 있는지 확인 (예: */target/* 는 .../target/ 와 매칭)"""
+        if self._regex is None:
+            return False
+        normalized = self._normalize(path, root)
+        return self._regex.match(normalized) is not None or self._regex.match(normalized + "/") is not None
+
+
+class FileWalker:
+    """os.scandir 기반 디렉토리 탐색기
+
+    제외된 디렉토리는 하위로 내려가기 전에 잘라내고, DirEntry의 stat 결과를 함께 반환하여
+    파일마다 다시 stat을 호출하지 않습니다.
+    max_depth가 있으면 검색 디렉토리(깊이 0) 기준으로 그보다 깊은 디렉토리에는 내려가지 않습니다.
+    listing_cache가 있으면 mtime이 바뀌지 않은 디렉토리는 목록을 읽지 않고 캐시된 이름을 사용하며,
+    파일 stat은 내용 변경을 놓치지 않도록 항상 새로 가져옵니다.
+    """
+
+    def __init__(self, file_extensions: tuple, exclude_matcher: ExcludeMatcher,
+                 cancel_check: Callable[[], bool] = None, max_depth: Optional[int] = None,
+                 listing_cache: Optional[DirectoryListingCache] = None):
+        self.file_extensions = tuple(file_extensions)
+        self.exclude_matcher = exclude_matcher
+        self.cancel_check = cancel_check or (lambda: False)
+        self.max_depth = max_depth
+        self.listing_cache = listing_cache
+        # 탐색 중인 검색 디렉토리 (제외 패턴은 이 디렉토리 아래 경로에만 매칭)
+        self.root = ""
+        self.visited_dirs = 0
+        self.pruned_dirs = 0
+        self.excluded_files = 0
+        # 깊이 제한으로 내려가지 않은 디렉토리 수
+        self.depth_limited_dirs = 0
+        # 목록 캐시를 재사용한 디렉토리 수와 다시 읽은 디렉토리 수
+        self.reused_dirs = 0
+        self.relisted_dirs = 0
+        # 중간에 멈추지 않고 전체 트리를 탐색했는지 여부
+        self.completed = False
+
+    def walk(self, root: str) -> Iterator[WalkEntry]:
+        """대상 파일을 발견하는 즉시 하나씩 반환"""
+        self.root = root
+        stack = [(root, 0)]
+        max_depth = self.max_depth
+        cache = self.listing_cache
+        if cache is not None:
+            cache.start_walk()
+
+        while stack:
+            if self.cancel_check():
+                return
+
+            directory, depth = stack.pop()
+            self.visited_dirs += 1
+            cached = None
+            if cache is not None:
+                try:
+                    # 목록을 읽기 전의 mtime을 저장해야 읽는 중에 바뀐 디렉토리를 다음에 다시 읽음
+                    mtime_ns = os.stat(directory).st_mtime_ns
+                except OSError as e:
+                    print(f"디렉토리 읽기 오류: {directory} ({e})")
+                    continue
+                cached = cache.lookup(directory, mtime_ns)
+
+            if cached is not None:
+                self.reused_dirs += 1
+                _, file_names, subdir_names, pruned_dirs, excluded_files = cached
+                self.pruned_dirs += pruned_dirs
+                self.excluded_files += excluded_files
+                for name in file_names:
+                    file_path = os.path.join(directory, name)
+                    try:
+                        yield file_path, os.stat(file_path)
+                    except OSError as e:
+                        print(f"파일 읽기 오류: {file_path} ({e})")
+                subdirs = [os.path.join(directory, name) for name in subdir_names]
+            else:
+                listing = self._list_directory(directory)
+                if listing is None:
+                    continue
+                files, subdirs, pruned_dirs, excluded_files = listing
+                self.relisted_dirs += 1
+                if cache is not None:
+                    cache.store(directory, mtime_ns, [os.path.basename(path) for path, _ in files],
+                                [os.path.basename(path) for path in subdirs], pruned_dirs, excluded_files)
+                yield from files
+
+            if max_depth is not None and depth >= max_depth:
+                self.depth_limited_dirs += len(subdirs)
+                continue
+            # 디렉토리를 발견한 순서대로 내려가도록 역순으로 스택에 추가
+            stack.extend((subdir, depth + 1) for subdir in reversed(subdirs))
+        self.completed = True
+
+    def _list_directory(self, directory: str) -> Optional[Tuple[List[WalkEntry], List[str], int, int]]:
+        """디렉토리 한 곳을 읽어 (대상 파일, 하위 디렉토리, 잘라낸 디렉토리 수, 제외된 파일 수) 반환"""
+        matcher = self.exclude_matcher
+        root = self.root
+        extensions = self.file_extensions
+        files = []
+        subdirs = []
+        pruned_dirs = 0
+        excluded_files = 0
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if matcher and matcher.match_dir(entry.path, root):
+                                pruned_dirs += 1
+                            else:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(extensions) and entry.is_file():
+                            if matcher and matcher.match_file(entry.path, root):
+                                excluded_files += 1
+                                continue
+                            files.append((entry.path, entry.stat()))
+                    except OSError as e:
+                        print(f"파일 읽기 오류: {entry.path} ({e})")
+        except OSError as e:
+            print(f"디렉토리 읽기 오류: {directory} ({e})")
+            return None
+
+        self.pruned_dirs += pruned_dirs
+        self.excluded_files += excluded_files
+        return files, subdirs, pruned_dirs, excluded_files
@@ -0,0 +1,113 @@
+import os
+import time
+import pickle
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+LISTING_CACHE_VERSION = 2
+DEFAULT_LISTING_DIR = Path.home() / ".java_search" / "listing"
+# 디렉토리 mtime이 목록을 읽은 시각과 이 간격(나노초) 안이면 캐시하지 않음
+# (mtime 해상도가 낮은 파일 시스템에서 같은 시각에 추가된 파일을 놓치지 않도록)
+RACY_MTIME_WINDOW_NS = 2_000_000_000
+
+# 디렉토리 항목: (mtime_ns, 대상 파일 이름, 하위 디렉토리 이름, 잘라낸 디렉토리 수, 제외된 파일 수)
+ListingEntry = Tuple[int, Tuple[str, ...], Tuple[str, ...], int, int]
+
+
+class DirectoryListingCache:
+    """검색 루트/확장자/제외 패턴별 디스크 디렉토리 목록 캐시
+
+    디렉토리마다 mtime과 함께 대상 파일 이름과 (제외되지 않은) 하위 디렉토리 이름을 저장하고,
+    다시 탐색할 때 mtime이 같은 디렉토리는 목록을 읽지 않고 저장된 항목을 사용합니다.
+    디렉토리 mtime은 항목이 추가/삭제/이름 변경될 때만 바뀌므로 파일 stat은 캐시하지 않습니다.
+    """
+
+    def __init__(self, root: str, file_extensions: Iterable[str], exclude_patterns: Iterable[str],
+                 cache_dir: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.file_extensions = tuple(sorted(file_extensions))
+        self.exclude_patterns = tuple(sorted(exclude_patterns))
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_LISTING_DIR
+        self.key = (self.root, self.file_extensions, self.exclude_patterns)
+        key_hash = hashlib.sha1(repr(self.key).encode("utf-8")).hexdigest()[:16]
+        self.cache_file = self.cache_dir / f"{key_hash}.lst"
+        self.entries: Dict[str, ListingEntry] = {}
+        self.dirty = False
+        # 이번 탐색에서 확인한 디렉토리 (사라진 디렉토리 항목 정리용)
+        self.visited: Set[str] = set()
+        self.load()
+
+    def load(self):
+        """디스크에서 캐시를 로드합니다."""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = pickle.load(f)
+            if data.get("version") == LISTING_CACHE_VERSION and data.get("key") == self.key:
+                self.entries = data["entries"]
+        except Exception as e:
+            print(f"디렉토리 목록 캐시 로드 오류: {self.cache_file} ({e})")
+            self.entries = {}
+
+    def save(self) -> bool:
+        """변경된 경우에만 캐시를 디스크에 저장합니다."""
+        if not self.dirty:
+            return True
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix(".tmp")
+            with open(temp_file, "wb") as f:
+                pickle.dump({"version": LISTING_CACHE_VERSION, "key": self.key, "entries": self.entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+            self.dirty = False
+            return True
+        except Exception as e:
+            print(f"디렉토리 목록 캐시 저장 오류: {self.cache_file} ({e})")
+            return False
+
+    def start_walk(self):
+        """새 탐색 시작 (확인한 디렉토리 기록 초기화)"""
+        self.visited.clear()
+
+    def lookup(self, directory: str, mtime_ns: int) -> Optional[ListingEntry]:
+        """디렉토리가 바뀌지 않았으면 저장된 항목을, 바뀌었거나 없으면 None 반환"""
+        self.visited.add(directory)
+        entry = self.entries.get(directory)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry
+        return None
+
+    def store(self, directory: str, mtime_ns: int, file_names: Iterable[str], subdir_names: Iterable[str],
+              pruned_dirs: int, excluded_files: int):
+        """새로 읽은 디렉토리 목록 저장 (mtime이 너무 최근이면 다음 탐색에서 다시 읽도록 저장하지 않음)"""
+        if time.time_ns() - mtime_ns < RACY_MTIME_WINDOW_NS:
+            if self.entries.pop(directory, None) is not None:
+                self.dirty = True
+            return
+        self.entries[directory] = (mtime_ns, tuple(file_names), tuple(subdir_names), pruned_dirs, excluded_files)
+        self.dirty = True
+
+    def prune(self):
+        """이번 탐색에서 확인하지 않은 디렉토리 항목 제거 (전체 트리를 탐색한 경우에만 호출)"""
+        removed = [directory for directory in self.entries if directory not in self.visited]
+        for directory in removed:
+            del self.entries[directory]
+        if removed:
+            self.dirty = True
+
+    def clear(self):
+        """캐시 항목과 디스크 파일을 삭제합니다."""
+        self.entries.clear()
+        self.visited.clear()
+        self.dirty = False
+        try:
+            self.cache_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,138 @@
+from typing import Dict, List, Optional, Tuple
+
+from .matching import CASE_FOLD_EXCEPTIONS, ByteLineMapper, Match, has_case_fold_exceptions
+
+
+# 바이트 위치만으로 문자 경계를 알 수 있는 인코딩 (ASCII 바이트가 멀티바이트 문자 안에 나오지 않음)
+LITERAL_SAFE_ENCODINGS = {"utf-8", "iso8859-1", "euc_kr"}
+# ASCII 바이트별 단어 문자 여부
+ASCII_WORD_BYTES = [chr(byte).isalnum() or byte == ord("_") for byte in range(0x80)]
+CASE_FOLD_LETTERS = set(b"iks")
+
+
+def _is_word_char(char: str) -> bool:
+    """정규식 \\w와 같은 기준의 단어 문자 여부"""
+    return char.isalnum() or char == "_"
+
+
+def _char_before(data, pos: int, codec: str) -> str:
+    """바이트 위치 앞의 문자 (없으면 빈 문자열)"""
+    if pos <= 0:
+        return ""
+    if data[pos - 1] < 0x80 or codec in ("ascii", "iso8859-1"):
+        return chr(data[pos - 1])
+    if codec == "euc_kr":
+        start = max(0, pos - 2)
+    else:
+        # UTF-8: 이어지는 바이트(10xxxxxx)를 건너 시작 바이트까지 이동
+        start = pos - 1
+        while start > max(0, pos - 4) and 0x80 <= data[start] < 0xC0:
+            start -= 1
+    return data[start:pos].decode(codec, errors="ignore")[-1:]
+
+
+def _char_after(data, pos: int, length: int, codec: str) -> str:
+    """바이트 위치의 문자 (없으면 빈 문자열)"""
+    if pos >= length:
+        return ""
+    lead = data[pos]
+    if lead < 0x80 or codec in ("ascii", "iso8859-1"):
+        return chr(lead)
+    if codec == "euc_kr":
+        size = 2
+    else:
+        size = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    return data[pos:min(length, pos + size)].decode(codec, errors="ignore")[:1]
+
+
+def needs_case_fold_check(needle: bytes) -> bool:
+    """소문자 검색 바이트열에 CASE_FOLD_EXCEPTIONS와 겹치는 문자(i, k, s)가 있는지 여부"""
+    return any(byte in CASE_FOLD_LETTERS for byte in needle)
+
+
+class LiteralSearcher:
+    """정규식 엔진을 쓰지 않는 리터럴 키워드 검색기
+
+    대소문자 무시 검색이면 파일 버퍼를 한 번만 소문자로 바꾼 뒤 bytes.find로 후보를 찾고,
+    단어 단위 검색은 후보 위치의 앞뒤 문자만 확인합니다. 첫 find에서 후보가 없으면 파일을 바로 제외합니다.
+    결과는 re.escape(keyword) 정규식(단어 단위면 \\b...\\b)의 버퍼 검색 결과와 같습니다.
+    """
+
+    def __init__(self, keyword: str, case_sensitive: bool = False, whole_word: bool = False):
+        self.keyword = keyword
+        self.case_sensitive = case_sensitive
+        self.whole_word = whole_word
+        self._needles: Dict[str, Optional[bytes]] = {}
+        self._starts_with_word = bool(keyword) and _is_word_char(keyword[0])
+        self._ends_with_word = bool(keyword) and _is_word_char(keyword[-1])
+
+    def _needle(self, codec: str) -> Optional[bytes]:
+        """인코딩별 검색 바이트열 (바이트 검색으로 처리할 수 없는 키워드면 None)"""
+        if codec in self._needles:
+            return self._needles[codec]
+
+        keyword = self.keyword
+        needle = None
+        if keyword and "\n" not in keyword and "\r" not in keyword:
+            if keyword.isascii():
+                needle = keyword.encode("ascii")
+            elif codec == "utf-8" and (self.case_sensitive or
+                                       all(ch.isascii() or ch.lower() == ch.upper() for ch in keyword)):
+                # 대소문자가 없는 비ASCII 문자(한글 등)만 있으면 UTF-8 바이트로 그대로 검색
+                needle = keyword.encode("utf-8")
+        if needle is not None and not self.case_sensitive:
+            needle = needle.lower()
+        self._needles[codec] = needle
+        return needle
+
+    def _is_whole_word(self, data, start: int, end: int, length: int, codec: str) -> bool:
+        """후보 위치가 \\b{keyword}\\b 조건을 만족하는지 확인 (앞뒤가 ASCII면 표로 바로 판단)"""
+        if start > 0 and data[start - 1] < 0x80:
+            before = ASCII_WORD_BYTES[data[start - 1]]
+        else:
+            before = _is_word_char(_char_before(data, start, codec))
+        if before == self._starts_with_word:
+            return False
+        if end < length and data[end] < 0x80:
+            after = ASCII_WORD_BYTES[data[end]]
+        else:
+            after = _is_word_char(_char_after(data, end, length, codec))
+        return self._ends_with_word != after
+
+    def find_matches(self, data, length: int, codec: str) -> Optional[Tuple[List[Match], int]]:
+        """버퍼(줄바꿈은 \\n으로 통일된 상태)에서 키워드 검색
+
+        Returns:
+            (매칭 목록, 디코딩한 바이트 수), 이 파일을 바이트 검색으로 처리할 수 없으면 None
+        """
+        needle = self._needle(codec)
+        if needle is None:
+            return None
+
+        if not self.case_sensitive and needs_case_fold_check(needle) and has_case_fold_exceptions(data, length, codec):
+            return None
+
+        haystack = data if self.case_sensitive else data[:length].lower()
+        pos = haystack.find(needle, 0, length)
+        if pos == -1:
+            return [], 0
+
+        if codec not in LITERAL_SAFE_ENCODINGS:
+            # cp949의 두 번째 바이트는 ASCII 범위일 수 있고, ascii 인코딩은 비ASCII 바이트를 버리므로
+            # 순수 ASCII 파일만 직접 처리
+            if not data[:length].isascii():
+                return None
+            codec = "ascii"
+
+        mapper = ByteLineMapper(data, length, codec)
+        matches = []
+        needle_length = len(needle)
+        while pos != -1:
+            end = pos + needle_length
+            if self.whole_word and not self._is_whole_word(data, pos, end, length, codec):
+                pos = haystack.find(needle, pos + 1, length)
+                continue
+            matches.append(mapper.to_match(pos, end))
+            pos = haystack.find(needle, end, length)
+
+        return matches, mapper.decoded_bytes
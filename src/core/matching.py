@@ -0,0 +1,511 @@
+import codecs
+import mmap
+import os
+import re
+import threading
+from bisect import bisect_left
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python 3.10 이하
+    import sre_parse
+    import sre_constants
+
+from .trigram_index import build_signature
+from .file_filter import SNIFF_BYTES, is_binary_data
+
+
+# 줄 단위 검색과 버퍼 단위 검색의 결과가 달라질 수 있는 정규식 구문
+LINE_MODE_CONSTRUCTS = ("(?=", "(?!", "(?<", "\\A", "\\Z")
+
+# (라인 번호, 라인 내용, 라인 내용 기준 매칭 시작 위치, 매칭 텍스트)
+Match = Tuple[int, str, int, str]
+# 파일 검색 통계: (검색한 바이트, 디코딩한 바이트, 사전 필터로 제외한 파일 수)
+ScanStats = Tuple[int, int, int]
+
+# ASCII 바이트가 멀티바이트 문자 안에 나오지 않는 인코딩 (바이트 단위 매칭 결과가 문자열 매칭과 같음)
+ASCII_SAFE_ENCODINGS = {"utf-8", "ascii", "euc_kr", "iso8859-1"}
+# ASCII 호환 인코딩 (cp949는 두 번째 바이트가 ASCII 범위일 수 있어 비ASCII 파일에서는 사전 필터로만 사용)
+ASCII_COMPATIBLE_ENCODINGS = ASCII_SAFE_ENCODINGS | {"cp949"}
+# 이 크기 이상의 파일은 mmap으로 읽음 (작은 파일은 스레드별 버퍼를 재사용)
+MMAP_THRESHOLD = 1024 * 1024
+
+# 대소문자 무시 정규식에서 ASCII 문자와 같게 취급되는 비ASCII 문자 (İ, ı → i, ſ → s, 켈빈 기호 → k)
+CASE_FOLD_EXCEPTIONS = "\u0130\u0131\u017f\u212a"
+
+NEWLINE_PATTERN = re.compile("\n")
+NEWLINE_BYTES_PATTERN = re.compile(b"\n")
+
+# 스레드(프로세스 워커)별 파일 읽기 버퍼
+_read_buffers = threading.local()
+
+
+class LineIndex:
+    """줄바꿈 오프셋 테이블 (첫 매칭이 나왔을 때만 생성)
+
+    str과 bytes 버퍼 모두 사용할 수 있으며, 재사용 버퍼처럼 뒤쪽이 비어 있으면 length까지만 봅니다.
+    """
+
+    __slots__ = ("content", "length", "_offsets")
+
+    def __init__(self, content, length: Optional[int] = None):
+        self.content = content
+        self.length = len(content) if length is None else length
+        self._offsets: Optional[List[int]] = None
+
+    @property
+    def offsets(self) -> List[int]:
+        """각 '\\n' 문자의 위치 목록"""
+        if self._offsets is None:
+            newline = NEWLINE_PATTERN if isinstance(self.content, str) else NEWLINE_BYTES_PATTERN
+            self._offsets = [m.start() for m in newline.finditer(self.content, 0, self.length)]
+        return self._offsets
+
+    def line_number(self, pos: int) -> int:
+        """버퍼 위치가 속한 라인 번호 (1부터 시작)"""
+        return bisect_left(self.offsets, pos) + 1
+
+    def line_start(self, line_number: int) -> int:
+        """라인 번호의 시작 위치"""
+        return self.offsets[line_number - 2] + 1 if line_number > 1 else 0
+
+    def line_text(self, line_number: int) -> str:
+        """라인 번호의 내용 (줄바꿈 제외)"""
+        offsets = self.offsets
+        start = self.line_start(line_number)
+        end = offsets[line_number - 1] if line_number - 1 < len(offsets) else self.length
+        return self.content[start:end]
+
+
+# 줄바꿈을 포함해 거의 모든 문자와 매칭되는 문자 클래스 (\D)
+BROAD_CATEGORIES = {sre_constants.CATEGORY_NOT_DIGIT}
+REPEAT_OPS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, "POSSESSIVE_REPEAT"):
+    REPEAT_OPS.add(sre_constants.POSSESSIVE_REPEAT)
+
+
+def _sub_dotall(av, dotall: bool) -> bool:
+    """그룹 인라인 플래그를 반영한 DOTALL 여부"""
+    _, add_flags, del_flags, _ = av
+    if del_flags & sre_constants.SRE_FLAG_DOTALL:
+        return False
+    return dotall or bool(add_flags & sre_constants.SRE_FLAG_DOTALL)
+
+
+def _set_is_broad(items) -> bool:
+    """문자 집합([...])이 줄바꿈을 포함한 넓은 범위와 매칭되는지 확인"""
+    negate = False
+    has_newline = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL and av == 10:
+            has_newline = True
+        elif op is sre_constants.RANGE and av[0] <= 10 <= av[1]:
+            if not negate:
+                return True
+            has_newline = True
+        elif op is sre_constants.CATEGORY and av in BROAD_CATEGORIES:
+            return True
+    return negate and not has_newline
+
+
+def _is_broad(items, dotall: bool) -> bool:
+    """파싱된 패턴 조각이 줄바꿈을 포함한 넓은 범위의 문자를 소비할 수 있는지 확인
+
+    \s, \W 처럼 줄바꿈을 포함하지만 범위가 좁은 클래스는 연속 구간이 짧으므로 제외합니다.
+    """
+    for op, av in items:
+        if op is sre_constants.NOT_LITERAL:
+            if av != 10:
+                return True
+        elif op is sre_constants.ANY:
+            if dotall:
+                return True
+        elif op is sre_constants.IN:
+            if _set_is_broad(av):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _is_broad(av[3], _sub_dotall(av, dotall)):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_is_broad(branch, dotall) for branch in av[1]):
+                return True
+        elif op in REPEAT_OPS:
+            if _is_broad(av[2], dotall):
+                return True
+        elif op is sre_constants.GROUPREF:
+            return True
+    return False
+
+
+def _has_unbounded_broad_repeat(items, dotall: bool) -> bool:
+    """줄바꿈을 넘어 무제한으로 진행할 수 있는 반복이 있는지 확인
+
+    이런 패턴(예: [^x]*Zebra)은 버퍼 전체에서 실행하면 매칭 시도마다 파일 끝까지 진행하여
+    라인 단위 검색보다 훨씬 느려질 수 있습니다.
+    """
+    for op, av in items:
+        if op in REPEAT_OPS:
+            if av[1] == sre_constants.MAXREPEAT and _is_broad(av[2], dotall):
+                return True
+            if _has_unbounded_broad_repeat(av[2], dotall):
+                return True
+        elif op is sre_constants.SUBPATTERN:
+            if _has_unbounded_broad_repeat(av[3], _sub_dotall(av, dotall)):
+                return True
+        elif op is sre_constants.BRANCH:
+            if any(_has_unbounded_broad_repeat(branch, dotall) for branch in av[1]):
+                return True
+    return False
+
+
+def _byte_safety(items) -> Optional[bool]:
+    """바이트 패턴으로 바꿨을 때의 안전성
+
+    Returns:
+        None: ASCII 범위 밖 문자가 있어 바이트 패턴으로 쓸 수 없음
+        True: ASCII 문자만 매칭하므로 비ASCII 파일에서도 문자열 매칭과 같은 결과
+        False: \\w, \\b, ., [^...] 처럼 문자 단위 의미가 달라 순수 ASCII 파일에서만 사용 가능
+    """
+    safe = True
+    for op, av in items:
+        if op is sre_constants.LITERAL or op is sre_constants.NOT_LITERAL:
+            if av > 0x7f:
+                return None
+            if op is sre_constants.NOT_LITERAL:
+                safe = False
+        elif op is sre_constants.IN:
+            for set_op, set_av in av:
+                if set_op is sre_constants.LITERAL and set_av > 0x7f:
+                    return None
+                if set_op is sre_constants.RANGE and set_av[1] > 0x7f:
+                    return None
+                if set_op is sre_constants.NEGATE or set_op is sre_constants.CATEGORY:
+                    safe = False
+        elif op is sre_constants.SUBPATTERN or op in REPEAT_OPS or op is sre_constants.BRANCH:
+            if op is sre_constants.SUBPATTERN:
+                branches = [av[3]]
+            elif op is sre_constants.BRANCH:
+                branches = av[1]
+            else:
+                branches = [av[2]]
+            for branch in branches:
+                branch_safety = _byte_safety(branch)
+                if branch_safety is None:
+                    return None
+                safe = safe and branch_safety
+        elif op is sre_constants.AT:
+            if av in (sre_constants.AT_BOUNDARY, sre_constants.AT_NON_BOUNDARY):
+                safe = False
+        elif op is not sre_constants.GROUPREF:
+            safe = False
+    return safe
+
+
+@lru_cache(maxsize=32)
+def compile_bytes_pattern(pattern_source: str, flags: int) -> Tuple[Optional[re.Pattern], bool]:
+    """문자열 패턴을 바이트 패턴으로 컴파일
+
+    Returns:
+        (바이트 패턴 (사용할 수 없으면 None), 비ASCII 파일에도 안전한지 여부)
+    """
+    if not pattern_source.isascii():
+        return None, False
+    try:
+        parsed = sre_parse.parse(pattern_source, flags)
+        safety = _byte_safety(list(parsed))
+        if safety is None:
+            return None, False
+        if parsed.getwidth()[0] == 0:
+            # 빈 문자열과 매칭될 수 있는 패턴은 멀티바이트 문자 중간 바이트에서도 매칭되므로 순수 ASCII 파일에서만 사용
+            safety = False
+        return re.compile(pattern_source.encode("ascii"), flags & ~re.UNICODE), safety
+    except Exception:
+        # \\u 이스케이프 등 바이트 패턴에서 지원하지 않는 구문
+        return None, False
+
+
+@lru_cache(maxsize=16)
+def _case_fold_exception_bytes(codec: str) -> Tuple[bytes, ...]:
+    """인코딩별 CASE_FOLD_EXCEPTIONS 문자의 바이트열 (표현할 수 없는 문자는 제외)"""
+    encoded = []
+    for char in CASE_FOLD_EXCEPTIONS:
+        try:
+            encoded.append(char.encode(codec))
+        except (UnicodeEncodeError, LookupError):
+            continue
+    return tuple(encoded)
+
+
+def has_case_fold_exceptions(data, length: int, codec: str) -> bool:
+    """bytes.lower()로는 맞출 수 없는 대소문자 무시 문자가 버퍼에 있는지 확인
+
+    대소문자 무시 정규식은 "k"를 켈빈 기호와도 매칭하므로, 이런 문자가 있는 파일은
+    소문자 변환 후 find 결과나 바이트 패턴 매칭 결과가 문자열 정규식 결과와 다를 수 있습니다.
+    """
+    if data[:length].isascii():
+        return False
+    return any(data.find(encoded, 0, length) != -1 for encoded in _case_fold_exception_bytes(codec))
+
+
+def requires_line_mode(pattern_source: str, flags: int = 0) -> bool:
+    """버퍼 단위 검색으로 줄 단위 결과를 효율적으로 재현할 수 없는 패턴인지 확인"""
+    if any(construct in pattern_source for construct in LINE_MODE_CONSTRUCTS):
+        return True
+    try:
+        parsed = sre_parse.parse(pattern_source, flags)
+    except Exception:
+        return True
+    dotall = bool(parsed.state.flags & sre_constants.SRE_FLAG_DOTALL)
+    return _has_unbounded_broad_repeat(list(parsed), dotall)
+
+
+def normalize_newlines(content: str) -> str:
+    """\\r\\n, \\r 줄바꿈을 \\n으로 통일 (텍스트 모드 읽기와 동일한 결과)"""
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
+
+
+def find_line_matches(content: str, pattern: re.Pattern) -> List[Match]:
+    """라인별로 패턴을 실행하는 기존 방식의 검색"""
+    matches = []
+    for line_num, line in enumerate(content.splitlines(), start=1):
+        for match in pattern.finditer(line):
+            stripped = line.strip()
+            # 라인 내용은 앞뒤 공백을 제거하므로 매칭 위치도 그만큼 이동
+            indent = len(line) - len(line.lstrip())
+            matches.append((line_num, stripped, match.start() - indent, match.group()))
+    return matches
+
+
+def find_buffer_matches(content: str, pattern: re.Pattern, multiline: bool = False) -> List[Match]:
+    """파일 버퍼 전체에 패턴을 한 번 실행하고 매칭된 위치만 라인 번호로 변환
+
+    매칭이 없는 파일은 정규식 스캔 한 번으로 끝나며 라인 문자열을 만들지 않습니다.
+    multiline이 아니면 여러 줄에 걸친 매칭이 나온 파일만 줄 단위 검색으로 다시 확인하여
+    기존 결과와 동일하게 유지합니다. multiline이면 여러 줄 매칭을 시작 라인 기준으로 보고합니다.
+    """
+    content = normalize_newlines(content)
+    line_index = None
+    matches = []
+    last_line_num = 0
+    last_line_text = ""
+    last_line_start = 0
+
+    for match in pattern.finditer(content):
+        if match.start() == len(content) and content[-1:] in ("", "\n"):
+            # 마지막 줄바꿈 뒤(또는 빈 파일)는 줄 단위 검색(splitlines)에 없는 라인
+            break
+        if line_index is None:
+            line_index = LineIndex(content)
+
+        match_text = match.group()
+        if not multiline and "\n" in match_text:
+            return find_line_matches(content, pattern)
+        line_num = line_index.line_number(match.start())
+
+        # 같은 라인에 여러 매칭이 있으면 라인 문자열을 재사용
+        if line_num != last_line_num:
+            last_line_num = line_num
+            raw_line = line_index.line_text(line_num)
+            last_line_text = raw_line.strip()
+            # 라인 내용(앞 공백 제거) 기준 시작 위치
+            last_line_start = line_index.line_start(line_num) + len(raw_line) - len(raw_line.lstrip())
+        matches.append((line_num, last_line_text, match.start() - last_line_start, match_text))
+
+    return matches
+
+
+class ByteLineMapper:
+    """바이트 버퍼의 매칭 위치를 (라인 번호, 라인 내용, 문자 단위 위치)로 변환
+
+    줄바꿈은 \\n으로 통일된 상태여야 하며, 매칭이 있는 라인만 디코딩하고 같은 라인은 한 번만 디코딩합니다.
+    """
+
+    __slots__ = ("data", "file_encoding", "line_index", "decoded_bytes",
+                 "_line_num", "_line_start", "_line_text", "_indent", "_single_byte")
+
+    def __init__(self, data, length: int, file_encoding: str):
+        self.data = data
+        self.file_encoding = file_encoding
+        self.line_index = LineIndex(data, length)
+        self.decoded_bytes = 0
+        self._line_num = 0
+        self._line_start = 0
+        self._line_text = ""
+        self._indent = 0
+        self._single_byte = True
+
+    def to_match(self, start: int, end: int) -> Match:
+        """바이트 구간 [start, end)의 매칭 튜플"""
+        line_num = self.line_index.line_number(start)
+        if line_num != self._line_num:
+            self._line_num = line_num
+            self._line_start = self.line_index.line_start(line_num)
+            raw_line_bytes = self.line_index.line_text(line_num)
+            self.decoded_bytes += len(raw_line_bytes)
+            raw_line = raw_line_bytes.decode(self.file_encoding, errors="ignore")
+            self._line_text = raw_line.strip()
+            self._indent = len(raw_line) - len(raw_line.lstrip())
+            self._single_byte = len(raw_line) == len(raw_line_bytes)
+
+        # 멀티바이트 문자가 있는 라인은 앞부분을 디코딩해 문자 단위 위치로 변환
+        offset = start - self._line_start
+        if not self._single_byte:
+            offset = len(self.data[self._line_start:start].decode(self.file_encoding, errors="ignore"))
+        match_text = self.data[start:end].decode(self.file_encoding, errors="ignore")
+        return line_num, self._line_text, offset - self._indent, match_text
+
+
+def find_bytes_matches(data, length: int, pattern: re.Pattern, file_encoding: str,
+                       multiline: bool = False) -> Optional[Tuple[List[Match], int]]:
+    """바이트 버퍼에 바이트 패턴을 실행하고 매칭된 라인만 디코딩 (줄바꿈은 \\n으로 통일된 상태)
+
+    Returns:
+        (매칭 목록, 디코딩한 바이트 수), 여러 줄에 걸친 매칭이 나와 줄 단위 검색이 필요하면 None
+    """
+    mapper = None
+    matches = []
+
+    for match in pattern.finditer(data, 0, length):
+        start, end = match.span()
+        if start == length and data[length - 1:length] in (b"", b"\n"):
+            # 마지막 줄바꿈 뒤(또는 빈 파일)는 줄 단위 검색(splitlines)에 없는 라인
+            break
+        if mapper is None:
+            mapper = ByteLineMapper(data, length, file_encoding)
+        if not multiline and data.find(b"\n", start, end) != -1:
+            return None
+        matches.append(mapper.to_match(start, end))
+
+    return matches, mapper.decoded_bytes if mapper else 0
+
+
+def codec_name(file_encoding: str) -> Optional[str]:
+    """인코딩 이름을 codecs 표준 이름으로 변환 (알 수 없는 인코딩이면 None)"""
+    try:
+        return codecs.lookup(file_encoding).name
+    except LookupError:
+        return None
+
+
+def _read_into_buffer(f, size: int) -> Tuple[bytearray, int]:
+    """스레드별 재사용 버퍼에 파일을 읽음 (버퍼 뒤쪽은 이전 파일 내용일 수 있으므로 길이와 함께 반환)"""
+    buffer = getattr(_read_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size + 1:
+        # 파일이 읽는 사이 커졌는지 확인할 수 있도록 1바이트 여유
+        buffer = bytearray(max(size + 1, 64 * 1024))
+        _read_buffers.buffer = buffer
+    with memoryview(buffer) as view:
+        length = f.readinto(view)
+    if length == len(buffer):
+        # 버퍼보다 커진 파일은 나머지를 이어서 읽음
+        data = bytes(buffer) + f.read()
+        return bytearray(data), len(data)
+    return buffer, length
+
+
+def _scan_data(data, length: int, pattern: re.Pattern, file_encoding: str, buffer_mode: bool,
+               multiline: bool, with_signature: bool, literal=None,
+               prefilter=None) -> Tuple[List[Match], Optional[bytes], ScanStats]:
+    """읽어 둔 파일 버퍼(bytearray/mmap)를 검색"""
+    # 변경된 파일은 읽은 김에 인덱스 시그니처 계산
+    signature = build_signature(data[:length]) if with_signature else None
+    scanned_bytes = length
+
+    codec = codec_name(file_encoding)
+    bytes_pattern, byte_safe = None, False
+    if buffer_mode and codec in ASCII_COMPATIBLE_ENCODINGS:
+        bytes_pattern, byte_safe = compile_bytes_pattern(pattern.pattern, pattern.flags)
+    if codec not in ASCII_COMPATIBLE_ENCODINGS:
+        literal = prefilter = None
+
+    if bytes_pattern is not None or literal is not None:
+        if data.find(b"\r", 0, length) != -1:
+            data = data[:length].replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+            length = len(data)
+
+    if literal is not None:
+        # 리터럴 검색: 정규식 엔진 없이 find로 후보를 찾음 (처리할 수 없으면 None)
+        found = literal.find_matches(data, length, codec)
+        if found is not None:
+            return found[0], signature, (scanned_bytes, found[1], 0)
+
+    if prefilter is not None and not prefilter.may_match(data, length, codec):
+        # 필수 리터럴이 없는 파일은 정규식을 실행하지 않음
+        return [], signature, (scanned_bytes, 0, 1)
+
+    if bytes_pattern is not None and pattern.flags & re.IGNORECASE and \
+            has_case_fold_exceptions(data, length, codec):
+        # 바이트 패턴은 ASCII 대소문자만 무시하므로 İ, ı, ſ, 켈빈 기호가 있는 파일은 디코딩해서 검색
+        bytes_pattern = None
+
+    if bytes_pattern is not None:
+        # 순수 ASCII 파일이면 어떤 ASCII 패턴이든 바이트 매칭 결과가 문자열 매칭과 같음
+        if (byte_safe and codec in ASCII_SAFE_ENCODINGS) or data[:length].isascii():
+            # 디코딩 없이 바이트로 매칭하고 매칭된 라인만 디코딩
+            found = find_bytes_matches(data, length, bytes_pattern, file_encoding, multiline)
+            if found is not None:
+                return found[0], signature, (scanned_bytes, found[1], 0)
+        elif byte_safe and bytes_pattern.search(data, 0, length) is None:
+            # 비ASCII cp949 파일: 바이트 매칭이 없으면 문자열 매칭도 없음
+            return [], signature, (scanned_bytes, 0, 0)
+
+    content = data[:length].decode(file_encoding, errors="ignore")
+    stats = (scanned_bytes, length, 0)
+    if buffer_mode:
+        return find_buffer_matches(content, pattern, multiline), signature, stats
+    return find_line_matches(content, pattern), signature, stats
+
+
+def _scan_unique(file_path: str, data, length: int, pattern: re.Pattern, file_encoding: str, buffer_mode: bool,
+                 multiline: bool, with_signature: bool, literal=None, prefilter=None,
+                 dedupe=None) -> Tuple[List[Match], Optional[bytes], ScanStats]:
+    """내용이 같은 파일을 이미 검색했으면 저장된 매칭 목록을, 아니면 버퍼를 검색해 반환"""
+    if dedupe is None or not length:
+        return _scan_data(data, length, pattern, file_encoding, buffer_mode, multiline, with_signature,
+                          literal, prefilter)
+    digest = dedupe.digest(data, length)
+    matches = dedupe.lookup(file_path, digest, length)
+    if matches is not None:
+        signature = build_signature(data[:length]) if with_signature else None
+        return matches, signature, (0, 0, 0)
+    matches, signature, stats = _scan_data(data, length, pattern, file_encoding, buffer_mode, multiline,
+                                           with_signature, literal, prefilter)
+    dedupe.store(digest, matches)
+    return matches, signature, stats
+
+
+def scan_file(file_path: str, pattern: re.Pattern, file_encoding: str, buffer_mode: bool = True,
+              multiline: bool = False, with_signature: bool = False,
+              skip_binary: bool = False, literal=None,
+              prefilter=None, dedupe=None) -> Tuple[Optional[List[Match]], Optional[bytes], ScanStats]:
+    """파일을 한 번 읽어 매칭 목록, (요청 시) 트라이그램 시그니처, 검색/디코딩 바이트 수를 반환
+
+    스레드 백엔드와 프로세스 백엔드가 공통으로 사용하며, 파일 읽기 오류는 호출자에게 전달합니다.
+    skip_binary이면 앞부분만 먼저 읽어 바이너리 파일은 전체를 읽지 않고 매칭 목록 None을 반환합니다.
+    패턴을 바이트 패턴으로 바꿀 수 있으면 파일 전체를 디코딩하지 않고 바이트 단위로 매칭합니다.
+    literal(LiteralSearcher)이 있으면 정규식보다 먼저 바이트 문자열 검색으로 처리합니다.
+    prefilter(RequiredLiteralFilter)가 있으면 필수 리터럴이 없는 파일은 정규식을 실행하지 않습니다.
+    dedupe(ContentDedupe)가 있으면 읽은 내용의 해시로 같은 내용의 파일은 한 번만 검색합니다.
+    """
+    with open(file_path, "rb") as f:
+        if skip_binary:
+            if is_binary_data(f.read(SNIFF_BYTES)):
+                return None, None, (0, 0, 0)
+            f.seek(0)
+
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _scan_unique(file_path, data, len(data), pattern, file_encoding, buffer_mode, multiline,
+                                    with_signature, literal, prefilter, dedupe)
+
+        data, length = _read_into_buffer(f, size)
+        return _scan_unique(file_path, data, length, pattern, file_encoding, buffer_mode, multiline,
+                            with_signature, literal, prefilter, dedupe)
@@ -0,0 +1,94 @@
+import re
+from typing import Dict, List, Optional
+
+
+# 키워드 파일 주석 접두사
+COMMENT_PREFIX = "#"
+# casefold()로는 i와 같아지지 않지만 대소문자 무시 정규식은 i와 매칭하는 문자 (İ, ı)
+DOTTED_I_FOLD = str.maketrans("\u0130\u0131", "ii")
+
+
+def keyword_key(text: str, case_sensitive: bool = False) -> str:
+    """키워드/매칭 텍스트 비교용 키 (대소문자 무시 검색이면 re.IGNORECASE처럼 ſ, 켈빈 기호 등도 접음)"""
+    if case_sensitive:
+        return text
+    return text.translate(DOTTED_I_FOLD).casefold()
+
+
+def normalize_keywords(keywords: List[str], case_sensitive: bool = False) -> List[str]:
+    """공백/중복 키워드 제거 (입력 순서 유지, 대소문자 무시 검색이면 대소문자 무시 중복 제거)"""
+    seen = set()
+    normalized = []
+    for keyword in keywords:
+        keyword = keyword.strip()
+        key = keyword_key(keyword, case_sensitive)
+        if keyword and key not in seen:
+            seen.add(key)
+            normalized.append(keyword)
+    return normalized
+
+
+def load_keywords(file_path: str, encoding: str = "utf-8") -> List[str]:
+    """키워드 파일 로드 (한 줄에 하나, 빈 줄과 # 주석은 무시)"""
+    keywords = []
+    with open(file_path, "r", encoding=encoding, errors="ignore") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith(COMMENT_PREFIX):
+                keywords.append(line)
+    return keywords
+
+
+def _trie_to_regex(node: Dict) -> Optional[str]:
+    """트라이 노드를 정규식으로 변환 (하위 노드가 없으면 None)"""
+    branches = []
+    single_chars = []
+    for char in sorted(key for key in node if key):
+        sub = _trie_to_regex(node[char])
+        if sub is None:
+            single_chars.append(re.escape(char))
+        else:
+            branches.append(re.escape(char) + sub)
+
+    if single_chars:
+        branches.append(single_chars[0] if len(single_chars) == 1 else "[" + "".join(single_chars) + "]")
+    if not branches:
+        return None
+
+    if len(branches) == 1:
+        result = branches[0]
+        # 단일 문자나 문자 클래스만 있으면 그대로 수량자를 붙일 수 있음
+        atomic = bool(single_chars)
+    else:
+        result = "(?:" + "|".join(branches) + ")"
+        atomic = True
+
+    # 여기서 끝나는 키워드가 있으면 나머지는 선택 (탐욕적이므로 가장 긴 키워드 우선)
+    if "" in node:
+        result = (result if atomic else "(?:" + result + ")") + "?"
+    return result
+
+
+def build_keyword_pattern(keywords: List[str], whole_word: bool = False) -> str:
+    """키워드 목록을 트라이 구조의 정규식 하나로 변환
+
+    공통 접두사를 공유하는 트라이 형태라서 각 위치에서 시도하는 분기 수가 키워드 수가 아니라
+    다음 문자 종류 수에 비례하므로, 키워드가 수천 개여도 파일당 한 번의 스캔 비용이 거의 일정합니다.
+    같은 위치에서는 가장 긴 키워드가 매칭됩니다.
+    """
+    trie: Dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    body = _trie_to_regex(trie) or ""
+    if whole_word:
+        return rf"\b(?:{body})\b"
+    return body
+
+
+def build_keyword_lookup(keywords: List[str], case_sensitive: bool = False) -> Dict[str, str]:
+    """매칭 텍스트 → 원래 키워드 매핑 (키는 keyword_key로 변환한 값)"""
+    return {keyword_key(keyword, case_sensitive): keyword for keyword in keywords}
@@ -0,0 +1,84 @@
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .content_dedupe import ContentDedupe
+from .matching import Match, ScanStats, scan_file
+
+
+# 워커로 보내는 파일 항목: (파일 경로, 시그니처 필요 여부)
+BatchItem = Tuple[str, bool]
+# 워커가 돌려주는 파일 결과: (파일 경로, 매칭 목록 (바이너리 파일이면 None), 시그니처, 내용 해시)
+FileBatchResult = Tuple[str, Optional[List[Match]], Optional[bytes], Optional[bytes]]
+# 워커가 중복 내용으로 건너뛴 (파일 수, 바이트 수)
+DuplicateStats = Tuple[int, int]
+
+# 워커 프로세스의 중복 내용 테이블 (검색마다 새 토큰으로 교체)
+_dedupe_token = None
+_dedupe = None
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern(pattern_source: str, flags: int) -> re.Pattern:
+    """워커 프로세스 내 정규식 컴파일 캐시"""
+    return re.compile(pattern_source, flags)
+
+
+def _worker_dedupe(token) -> Optional[ContentDedupe]:
+    """검색 토큰의 워커 프로세스 중복 내용 테이블 (토큰이 없으면 None)
+
+    프로세스 사이에는 테이블을 공유하지 않으므로 같은 내용은 워커마다 최대 한 번씩 검색됩니다.
+    """
+    global _dedupe_token, _dedupe
+    if token is None:
+        return None
+    if token != _dedupe_token:
+        _dedupe_token = token
+        _dedupe = ContentDedupe()
+    return _dedupe
+
+
+def scan_file_batch(batch: List[BatchItem], pattern_source: str, flags: int, file_encoding: str,
+                    buffer_mode: bool = True, multiline: bool = False,
+                    skip_binary: bool = False, literal=None,
+                    prefilter=None,
+                    dedupe_token=None, report_all: bool = False) -> Tuple[List[FileBatchResult], ScanStats, DuplicateStats]:
+    """프로세스 풀 워커 함수: 파일 경로 배치를 검색하여 매칭이 있는 파일만 압축된 형태로 반환
+
+    SearchResult 객체 대신 튜플만 주고받아 프로세스 간 직렬화 비용을 줄입니다.
+    바이너리로 판별된 파일은 메인 프로세스에서 캐시할 수 있도록 매칭 목록 None으로 반환합니다.
+    검색/디코딩 바이트 수와 사전 필터로 제외한 파일 수는 배치 합계로 함께 반환합니다.
+    dedupe_token이 있으면 같은 검색의 배치끼리 워커 프로세스의 중복 내용 테이블을 공유하고,
+    매칭이 있는 파일의 내용 해시와 중복으로 건너뛴 파일 수/바이트 수를 함께 반환합니다.
+    report_all이면 결과 캐시에 저장할 수 있도록 매칭이 없는 파일도 빈 매칭 목록으로 반환합니다.
+    """
+    pattern = _compile_pattern(pattern_source, flags)
+    dedupe = _worker_dedupe(dedupe_token)
+    duplicate_files = dedupe.duplicate_files if dedupe is not None else 0
+    duplicate_bytes = dedupe.duplicate_bytes if dedupe is not None else 0
+    batch_results = []
+    scanned_bytes = 0
+    decoded_bytes = 0
+    prefiltered_files = 0
+
+    for file_path, with_signature in batch:
+        try:
+            matches, signature, (scanned, decoded, prefiltered) = scan_file(
+                file_path, pattern, file_encoding, buffer_mode, multiline, with_signature, skip_binary,
+                literal, prefilter, dedupe)
+        except Exception as e:
+            # 파일 읽기 오류는 무시하고 계속 진행
+            print(f"파일 읽기 오류: {file_path} ({e})")
+            continue
+
+        scanned_bytes += scanned
+        decoded_bytes += decoded
+        prefiltered_files += prefiltered
+        digest = dedupe.pop_digest(file_path) if dedupe is not None else None
+        if report_all or matches or matches is None or signature is not None:
+            batch_results.append((file_path, matches, signature, digest))
+
+    if dedupe is not None:
+        duplicate_files = dedupe.duplicate_files - duplicate_files
+        duplicate_bytes = dedupe.duplicate_bytes - duplicate_bytes
+    return batch_results, (scanned_bytes, decoded_bytes, prefiltered_files), (duplicate_files, duplicate_bytes)
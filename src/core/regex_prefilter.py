@@ -0,0 +1,136 @@
+from typing import Dict, List, Optional
+
+try:
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+except ImportError:  # Python 3.10 이하
+    import sre_parse
+    import sre_constants
+
+from .literal_search import has_case_fold_exceptions, needs_case_fold_check
+
+
+# 사전 필터에 사용할 최소 리터럴 길이 (짧은 리터럴은 거의 모든 파일에 있어 효과가 없음)
+MIN_PREFILTER_LITERAL = 3
+# 파일마다 확인할 최대 리터럴 수 (긴 리터럴부터)
+MAX_PREFILTER_LITERALS = 4
+
+REPEAT_OPS = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, "POSSESSIVE_REPEAT"):
+    REPEAT_OPS.add(sre_constants.POSSESSIVE_REPEAT)
+
+
+def _flush(run: List[str], literals: List[str]) -> List[str]:
+    """이어진 리터럴 문자를 목록에 추가하고 새 구간 시작"""
+    if run:
+        literals.append("".join(run))
+    return []
+
+
+def _collect(items, literals: List[str], run: List[str]) -> List[str]:
+    """파싱된 패턴에서 모든 매칭에 반드시 나오는 연속 리터럴 수집 (남은 구간 반환)"""
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            char = chr(av)
+            if char in "\r\n":
+                # 줄바꿈은 파일마다 표기가 달라 바이트 검색에 쓰지 않음
+                run = _flush(run, literals)
+            else:
+                run.append(char)
+        elif op is sre_constants.IN and len(av) == 1 and av[0][0] is sre_constants.LITERAL:
+            # [(] 처럼 문자 하나짜리 클래스
+            run = _collect(av, literals, run)
+        elif op is sre_constants.AT:
+            # ^, $, \b 등은 너비가 없어 앞뒤 리터럴이 그대로 이어짐
+            continue
+        elif op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub_items = av
+            if (add_flags | del_flags) & sre_constants.SRE_FLAG_IGNORECASE:
+                # 그룹 안에서 대소문자 옵션이 바뀌면 건너뜀
+                run = _flush(run, literals)
+            else:
+                run = _collect(sub_items, literals, run)
+        elif op in REPEAT_OPS:
+            # 한 번 이상 반복되는 부분의 리터럴만 필수 (반복 경계에서는 구간을 끊음)
+            run = _flush(run, literals)
+            if av[0] >= 1:
+                _flush(_collect(av[2], literals, []), literals)
+        else:
+            # 분기, 문자 클래스, 전후방 탐색 등은 필수 리터럴을 알 수 없으므로 구간을 끊음
+            run = _flush(run, literals)
+    return run
+
+
+def extract_required_literals(pattern_source: str, flags: int = 0) -> List[str]:
+    """정규식의 모든 매칭에 반드시 포함되는 리터럴 목록 (긴 것부터, 없으면 빈 리스트)
+
+    예: @Transactional\\(.*readOnly → ["@Transactional(", "readOnly"]
+    """
+    try:
+        parsed = sre_parse.parse(pattern_source, flags)
+    except Exception:
+        return []
+
+    literals: List[str] = []
+    _flush(_collect(list(parsed), literals, []), literals)
+
+    unique = []
+    for literal in sorted(literals, key=len, reverse=True):
+        if len(literal) >= MIN_PREFILTER_LITERAL and literal not in unique:
+            unique.append(literal)
+    return unique[:MAX_PREFILTER_LITERALS]
+
+
+class RequiredLiteralFilter:
+    """정규식 실행 전에 필수 리터럴이 없는 파일을 bytes.find로 걸러내는 사전 필터
+
+    필수 리터럴 중 하나라도 없는 파일은 정규식이 매칭될 수 없으므로 바로 제외합니다.
+    확신할 수 없는 경우(인코딩할 수 없는 리터럴, 대소문자 접기 예외 문자)는 항상 통과시킵니다.
+    """
+
+    def __init__(self, literals: List[str], case_sensitive: bool = False):
+        self.literals = literals
+        self.case_sensitive = case_sensitive
+        self._needles: Dict[str, List[bytes]] = {}
+
+    @classmethod
+    def from_pattern(cls, pattern_source: str, flags: int) -> Optional["RequiredLiteralFilter"]:
+        """패턴에서 필수 리터럴을 추출해 필터 생성 (리터럴이 없으면 None)"""
+        literals = extract_required_literals(pattern_source, flags)
+        if not literals:
+            return None
+        return cls(literals, case_sensitive=not flags & sre_constants.SRE_FLAG_IGNORECASE)
+
+    def _needles_for(self, codec: str) -> List[bytes]:
+        """인코딩별 검색 바이트열 목록"""
+        needles = self._needles.get(codec)
+        if needles is not None:
+            return needles
+
+        needles = []
+        for literal in self.literals:
+            if not self.case_sensitive and not all(ch.isascii() or ch.lower() == ch.upper() for ch in literal):
+                # 대소문자가 있는 비ASCII 문자는 bytes.lower()로 접을 수 없음
+                continue
+            try:
+                needle = literal.encode(codec)
+            except (UnicodeEncodeError, LookupError):
+                continue
+            needles.append(needle if self.case_sensitive else needle.lower())
+        self._needles[codec] = needles
+        return needles
+
+    def may_match(self, data, length: int, codec: str) -> bool:
+        """파일에 필수 리터럴이 모두 있으면(또는 판단할 수 없으면) True"""
+        needles = self._needles_for(codec)
+        if not needles:
+            return True
+
+        haystack = data if self.case_sensitive else data[:length].lower()
+        for needle in needles:
+            if haystack.find(needle, 0, length) == -1:
+                if not self.case_sensitive and needs_case_fold_check(needle) and \
+                        has_case_fold_exceptions(data, length, codec):
+                    return True
+                return False
+        return True
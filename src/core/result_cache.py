@@ -0,0 +1,254 @@
+import os
+import time
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+from .listing_cache import RACY_MTIME_WINDOW_NS
+from .matching import Match
+
+
+RESULT_CACHE_VERSION = 3
+RESULT_CACHE_SUFFIX = ".rc"
+DEFAULT_RESULT_CACHE_DIR = Path.home() / ".java_search" / "results"
+DEFAULT_RESULT_CACHE_MB = 256
+# 항목 크기 추정용 고정 비용 (튜플/문자열 객체 헤더, 바이트)
+ENTRY_OVERHEAD_BYTES = 96
+MATCH_OVERHEAD_BYTES = 112
+
+# 파일 항목: (mtime_ns, 파일 크기, 매칭 목록, 추정 바이트 수, 내용 해시 (중복 내용 검색에서만 기록))
+CacheEntry = Tuple[int, int, List[Match], int, Optional[bytes]]
+# 조회 결과: (매칭 목록, 내용 해시)
+CacheHit = Tuple[List[Match], Optional[bytes]]
+
+
+def _entry_bytes(file_path: str, matches: List[Match]) -> int:
+    """항목의 대략적인 바이트 수 (라인/매칭 문자열 길이 기준)"""
+    size = ENTRY_OVERHEAD_BYTES + len(file_path)
+    for _, line_text, _, match_text in matches:
+        size += MATCH_OVERHEAD_BYTES + len(line_text) + len(match_text)
+    return size
+
+
+class ResultCacheSegment:
+    """검색 조건 하나의 파일별 결과 캐시 (검색 1회 동안 메모리에 로드)
+
+    항목은 마지막으로 사용한 순서로 유지되며, 크기 제한을 넘으면 오래 사용하지 않은 항목부터 제거합니다.
+    검색 워커 스레드에서 동시에 조회/저장하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, cache_file: Path, key: tuple, max_bytes: int):
+        self.cache_file = cache_file
+        self.key = key
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.total_bytes = 0
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """디스크에서 캐시를 로드합니다."""
+        if not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, "rb") as f:
+                data = pickle.load(f)
+            if data.get("version") == RESULT_CACHE_VERSION and data.get("key") == self.key:
+                self.entries = data["entries"]
+                self.total_bytes = sum(entry[3] for entry in self.entries.values())
+        except Exception as e:
+            print(f"결과 캐시 로드 오류: {self.cache_file} ({e})")
+            self.entries = OrderedDict()
+            self.total_bytes = 0
+
+    def save(self) -> bool:
+        """변경된 경우 캐시를 저장하고, 변경이 없어도 최근 사용 시각을 갱신합니다."""
+        try:
+            if not self.dirty:
+                if self.cache_file.exists():
+                    os.utime(self.cache_file)
+                return True
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix(".tmp")
+            with open(temp_file, "wb") as f:
+                pickle.dump({"version": RESULT_CACHE_VERSION, "key": self.key, "entries": self.entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.cache_file)
+            self.dirty = False
+            return True
+        except Exception as e:
+            print(f"결과 캐시 저장 오류: {self.cache_file} ({e})")
+            return False
+
+    def lookup(self, file_path: str, stat: os.stat_result, need_digest: bool = False) -> Optional[CacheHit]:
+        """파일이 바뀌지 않았으면 저장된 (매칭 목록, 내용 해시)를, 바뀌었거나 없으면 None 반환
+
+        need_digest이면 내용 해시 없이 저장된 항목도 다시 검색하도록 None을 반환합니다.
+        """
+        with self._lock:
+            entry = self.entries.get(file_path)
+            if (entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size
+                    and (entry[4] is not None or not need_digest)):
+                self.entries.move_to_end(file_path)
+                self.hits += 1
+                return entry[2], entry[4]
+            self.misses += 1
+            return None
+
+    def store(self, file_path: str, stat: os.stat_result, matches: List[Match], digest: Optional[bytes] = None):
+        """새로 검색한 파일의 매칭 목록 저장 (방금 수정된 파일과 제한보다 큰 항목은 저장하지 않음)"""
+        recent = time.time_ns() - stat.st_mtime_ns < RACY_MTIME_WINDOW_NS
+        nbytes = _entry_bytes(file_path, matches)
+        with self._lock:
+            old = self.entries.pop(file_path, None)
+            if old is not None:
+                self.total_bytes -= old[3]
+                self.dirty = True
+            if recent or nbytes > self.max_bytes:
+                return
+            self.entries[file_path] = (stat.st_mtime_ns, stat.st_size, matches, nbytes, digest)
+            self.total_bytes += nbytes
+            self.dirty = True
+
+    def prune(self, seen_files: Set[str]):
+        """이번 검색에서 발견하지 못한 파일 항목 제거 (전체 트리를 탐색한 경우에만 호출)"""
+        removed = [file_path for file_path in self.entries if file_path not in seen_files]
+        for file_path in removed:
+            self.total_bytes -= self.entries.pop(file_path)[3]
+        if removed:
+            self.dirty = True
+
+    def trim(self, max_bytes: int):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 항목부터 제거"""
+        while self.entries and self.total_bytes > max_bytes:
+            _, entry = self.entries.popitem(last=False)
+            self.total_bytes -= entry[3]
+            self.dirty = True
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class ResultCache:
+    """파일 지문(경로, 크기, mtime)과 검색 조건(패턴 소스, 플래그, 검색 옵션)별 디스크 결과 캐시
+
+    검색 조건마다 세그먼트 파일 하나에 파일별 매칭 목록을 저장합니다.
+    다시 검색할 때 크기와 mtime이 같은 파일은 읽지 않고 저장된 매칭을 사용하고, 바뀐 파일만 검색합니다.
+    전체 크기가 max_bytes를 넘으면 세그먼트 안에서는 오래 사용하지 않은 항목부터,
+    디스크에서는 오래 사용하지 않은 세그먼트 파일부터 삭제합니다.
+    keep_open이 있으면 최근 사용한 세그먼트를 그 수만큼 메모리에 유지하여 다음 검색에서 다시 로드하지 않습니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_RESULT_CACHE_MB * 1024 * 1024,
+                 keep_open: int = 0):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_RESULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        # 메모리에 유지할 세그먼트 수 (0이면 검색마다 디스크에서 로드)
+        self.keep_open = keep_open
+        self._segments: "OrderedDict[tuple, ResultCacheSegment]" = OrderedDict()
+        # 엔진을 만든 뒤 누적 조회 수
+        self.hits = 0
+        self.misses = 0
+
+    def open_segment(self, key: tuple) -> ResultCacheSegment:
+        """검색 조건의 세그먼트를 로드 (메모리에 유지 중이면 그대로, 없으면 빈 세그먼트)"""
+        key = (RESULT_CACHE_VERSION,) + tuple(key)
+        segment = self._segments.get(key)
+        if segment is not None:
+            self._segments.move_to_end(key)
+            segment.max_bytes = self.max_bytes
+            segment.hits = segment.misses = 0
+            return segment
+        key_hash = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:16]
+        segment = ResultCacheSegment(self.cache_dir / f"{key_hash}{RESULT_CACHE_SUFFIX}", key, self.max_bytes)
+        if self.keep_open > 0:
+            self._segments[key] = segment
+            while len(self._segments) > self.keep_open:
+                self._segments.popitem(last=False)
+        return segment
+
+    def close_segment(self, segment: ResultCacheSegment, seen_files: Optional[Iterable[str]] = None):
+        """검색이 끝난 세그먼트를 정리/저장하고 전체 크기 제한에 맞춰 다른 세그먼트를 삭제
+
+        Args:
+            segment: open_segment()로 연 세그먼트
+            seen_files: 전체 트리를 탐색한 경우 발견한 파일 목록 (사라진 파일 항목 정리용)
+        """
+        self.hits += segment.hits
+        self.misses += segment.misses
+        if seen_files is not None:
+            segment.prune(set(seen_files))
+        segment.trim(self.max_bytes)
+        if segment.save():
+            self.evict(keep=segment.cache_file)
+
+    def _segment_files(self) -> List[Tuple[float, int, Path]]:
+        """디스크의 세그먼트 파일 목록: (최근 사용 시각, 크기, 경로)"""
+        files = []
+        if not self.cache_dir.is_dir():
+            return files
+        for path in self.cache_dir.glob(f"*{RESULT_CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """디스크 크기가 제한 이하가 될 때까지 오래 사용하지 않은 세그먼트 파일 삭제 (삭제한 바이트 수 반환)"""
+        files = sorted(self._segment_files())
+        total = sum(size for _, size, _ in files)
+        freed = 0
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError as e:
+                print(f"결과 캐시 삭제 오류: {path} ({e})")
+                continue
+            total -= size
+            freed += size
+            # 메모리에 유지 중인 세그먼트도 함께 제거 (전체 메모리도 크기 제한 근처로 유지)
+            for key in [key for key, segment in self._segments.items() if segment.cache_file == path]:
+                del self._segments[key]
+        return freed
+
+    def memory_usage(self) -> int:
+        """메모리에 유지 중인 세그먼트의 추정 크기 (바이트)"""
+        return sum(segment.total_bytes for segment in self._segments.values())
+
+    def disk_usage(self) -> int:
+        """디스크에 저장된 세그먼트 파일 전체 크기 (바이트)"""
+        return sum(size for _, size, _ in self._segment_files())
+
+    def clear(self) -> int:
+        """모든 세그먼트 파일과 메모리에 유지 중인 세그먼트를 삭제합니다. (삭제한 바이트 수 반환)"""
+        self._segments.clear()
+        freed = 0
+        for _, size, path in self._segment_files():
+            try:
+                path.unlink()
+                freed += size
+            except OSError as e:
+                print(f"결과 캐시 삭제 오류: {path} ({e})")
+        return freed
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
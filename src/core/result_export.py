@@ -0,0 +1,336 @@
+import csv
+import json
+import multiprocessing
+import queue
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from .result_store import ResultStore
+
+
+# 내보내기 열: (결과 속성, 헤더)
+EXPORT_COLUMNS = (
+    ("file_path", "File Path"),
+    ("file_name", "File Name"),
+    ("line_number", "Line"),
+    ("content", "Content"),
+    ("match_text", "Match"),
+)
+KEYWORD_COLUMN = ("keyword", "Keyword")
+# 내보내는 라인 내용의 최대 길이
+CONTENT_EXPORT_LENGTH = 500
+# Excel 열 너비 상한 (문자 수)
+MAX_COLUMN_WIDTH = 50
+EXCEL_SHEET_NAME = "Search Results"
+# xlsx 시트당 최대 행 수와 헤더를 뺀 데이터 행 수
+EXCEL_MAX_ROWS = 1048576
+EXCEL_ROWS_PER_SHEET = EXCEL_MAX_ROWS - 1
+# 행 제한을 넘는 결과의 분할 방식 (file: 번호 붙은 통합 문서, sheet: 한 통합 문서의 여러 시트)
+EXPORT_SPLIT_FILE = "file"
+EXPORT_SPLIT_SHEET = "sheet"
+EXPORT_SPLIT_MODES = (EXPORT_SPLIT_FILE, EXPORT_SPLIT_SHEET)
+# 진행률을 알리는 간격 (행)
+EXPORT_PROGRESS_ROWS = 5000
+# 병렬 저장 중 진행률 큐를 확인하는 간격 (초)
+EXPORT_POLL_INTERVAL = 0.1
+
+# 내보내기 형식과 출력 파일 확장자
+EXPORT_FORMAT_EXCEL = "excel"
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_JSONL = "jsonl"
+EXPORT_FORMAT_PARQUET = "parquet"
+EXPORT_EXTENSIONS = {
+    ".xlsx": EXPORT_FORMAT_EXCEL,
+    ".csv": EXPORT_FORMAT_CSV,
+    ".jsonl": EXPORT_FORMAT_JSONL,
+    ".ndjson": EXPORT_FORMAT_JSONL,
+    ".parquet": EXPORT_FORMAT_PARQUET,
+}
+EXPORT_FORMAT_LABELS = {
+    EXPORT_FORMAT_EXCEL: "Excel",
+    EXPORT_FORMAT_CSV: "CSV",
+    EXPORT_FORMAT_JSONL: "JSON Lines",
+    EXPORT_FORMAT_PARQUET: "Parquet",
+}
+# Parquet 행 그룹(배치) 크기 (이 행 수만큼만 메모리에 모아 씀)
+PARQUET_BATCH_ROWS = 65536
+
+# 진행률 콜백: (쓴 행 수, 전체 행 수)
+ExportProgressCallback = Callable[[int, int], None]
+# 시트 하나에 들어갈 행 구간 (시작, 끝)
+RowRange = Tuple[int, int]
+
+
+def export_columns(results: Sequence) -> List[tuple]:
+    """결과에 맞는 내보내기 열 목록 (다중 키워드 검색 결과면 Keyword 열 추가)"""
+    if isinstance(results, ResultStore):
+        with_keyword = results.has_keywords
+    else:
+        with_keyword = any(result.keyword for result in results)
+    return list(EXPORT_COLUMNS) + ([KEYWORD_COLUMN] if with_keyword else [])
+
+
+def iter_export_rows(results: Sequence, with_keyword: bool,
+                     content_limit: Optional[int] = CONTENT_EXPORT_LENGTH) -> Iterator[list]:
+    """내보낼 행 값을 하나씩 생성 (전체 행 목록을 만들지 않음, content_limit이 None이면 라인 전체)"""
+    for result in results:
+        row = [result.file_path, result.file_name, result.line_number,
+               result.content[:content_limit], result.match_text]
+        if with_keyword:
+            row.append(result.keyword)
+        yield row
+
+
+class ColumnWidths:
+    """열별 최대 값 길이를 누적해 Excel 열 너비 계산 (셀을 다시 읽지 않음)"""
+
+    def __init__(self, headers: Sequence[str]):
+        self.lengths = [len(header) for header in headers]
+
+    def update(self, row: Sequence):
+        for column, value in enumerate(row):
+            length = len(str(value))
+            if length > self.lengths[column]:
+                self.lengths[column] = length
+
+    def update_lengths(self, lengths: Sequence[int]):
+        self.lengths = [max(current, length) for current, length in zip(self.lengths, lengths)]
+
+    @property
+    def saturated(self) -> bool:
+        """모든 열이 너비 상한에 도달했는지 여부 (더 볼 필요 없음)"""
+        return all(length + 2 >= MAX_COLUMN_WIDTH for length in self.lengths)
+
+    def widths(self) -> List[int]:
+        return [min(length + 2, MAX_COLUMN_WIDTH) for length in self.lengths]
+
+
+def _column_widths(results: Sequence, columns: List[tuple]) -> List[int]:
+    """내보낼 값 기준 열 너비 (ResultStore는 중복 제거된 열만 확인)"""
+    widths = ColumnWidths([header for _, header in columns])
+    if isinstance(results, ResultStore):
+        lengths = results.max_text_lengths(CONTENT_EXPORT_LENGTH)
+        widths.update_lengths([lengths[name] for name, _ in columns])
+    else:
+        for row in iter_export_rows(results, KEYWORD_COLUMN in columns):
+            widths.update(row)
+            if widths.saturated:
+                break
+    return widths.widths()
+
+
+def plan_excel_shards(total: int, split: str = EXPORT_SPLIT_FILE,
+                      rows_per_sheet: int = EXCEL_ROWS_PER_SHEET) -> List[List[RowRange]]:
+    """Excel 행 제한에 맞춘 분할 계획: 통합 문서별 시트 행 구간 목록
+
+    file이면 시트 하나씩 번호 붙은 통합 문서로, sheet이면 한 통합 문서의 여러 시트로 나눕니다.
+    """
+    if split not in EXPORT_SPLIT_MODES:
+        raise ValueError(f"지원하지 않는 내보내기 분할 방식입니다: {split}")
+    sheets = [(start, min(start + rows_per_sheet, total)) for start in range(0, total, rows_per_sheet)]
+    if not sheets:
+        sheets = [(0, 0)]
+    if split == EXPORT_SPLIT_SHEET:
+        return [sheets]
+    return [[sheet] for sheet in sheets]
+
+
+def _sheet_title(number: int) -> str:
+    return EXCEL_SHEET_NAME if number == 1 else f"{EXCEL_SHEET_NAME} ({number})"
+
+
+def _write_workbook(results: Sequence, output_file: str, sheet_ranges: List[RowRange], columns: List[tuple],
+                    widths: List[int], progress: Optional[Callable[[int], None]] = None) -> int:
+    """통합 문서 하나를 쓰기 전용 모드로 스트리밍 저장 (progress에는 새로 쓴 행 수를 전달)"""
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    with_keyword = KEYWORD_COLUMN in columns
+    workbook = Workbook(write_only=True)
+    written = 0
+    for number, (start, stop) in enumerate(sheet_ranges, 1):
+        sheet = workbook.create_sheet(_sheet_title(number))
+        for column, width in enumerate(widths, 1):
+            sheet.column_dimensions[get_column_letter(column)].width = width
+        sheet.append([header for _, header in columns])
+        for row in iter_export_rows((results[index] for index in range(start, stop)), with_keyword):
+            sheet.append(row)
+            written += 1
+            if progress and written % EXPORT_PROGRESS_ROWS == 0:
+                progress(EXPORT_PROGRESS_ROWS)
+
+    workbook.save(output_file)
+    if progress and written % EXPORT_PROGRESS_ROWS:
+        progress(written % EXPORT_PROGRESS_ROWS)
+    return written
+
+
+# 내보내기 워커 프로세스의 진행률 큐 (_init_export_worker에서 설정)
+_progress_queue = None
+
+
+def _init_export_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+
+def _write_shard(rows: Sequence, output_file: str, sheet_ranges: List[RowRange], columns: List[tuple],
+                 widths: List[int]) -> int:
+    """프로세스 풀 워커 함수: 분할된 행으로 통합 문서 하나를 저장"""
+    progress = _progress_queue.put if _progress_queue is not None else None
+    return _write_workbook(rows, output_file, sheet_ranges, columns, widths, progress)
+
+
+def _shard_rows(results: Sequence, sheet_ranges: List[RowRange]) -> Tuple[Sequence, List[RowRange]]:
+    """워커로 보낼 분할 행과 그 기준의 시트 구간"""
+    start, stop = sheet_ranges[0][0], sheet_ranges[-1][1]
+    rows = results.subset(start, stop) if isinstance(results, ResultStore) else list(results[start:stop])
+    return rows, [(sheet_start - start, sheet_stop - start) for sheet_start, sheet_stop in sheet_ranges]
+
+
+def write_excel(results: Sequence, output_files: Sequence[str], shards: List[List[RowRange]],
+                progress_callback: Optional[ExportProgressCallback] = None, workers: int = 1) -> int:
+    """검색 결과를 분할 계획대로 openpyxl 쓰기 전용 통합 문서에 스트리밍 저장하고 쓴 행 수를 반환
+
+    행 값은 결과 저장소에서 한 행씩 만들어 바로 파일로 내보내므로 DataFrame이나 전체 셀을 메모리에 두지 않습니다.
+    쓰기 전용 시트는 열 너비를 첫 행보다 먼저 써야 하므로, 너비는 값 길이만 미리 모아 계산합니다.
+    통합 문서가 여러 개이고 workers가 2 이상이면 통합 문서마다 워커 프로세스에서 동시에 저장합니다.
+    """
+    columns = export_columns(results)
+    widths = _column_widths(results, columns)
+    total = len(results)
+    written = 0
+
+    def report(rows: int):
+        nonlocal written
+        written += rows
+        if progress_callback:
+            progress_callback(written, total)
+
+    if workers <= 1 or len(shards) <= 1:
+        for output_file, sheet_ranges in zip(output_files, shards):
+            _write_workbook(results, output_file, sheet_ranges, columns, widths, report)
+        return written
+
+    context = multiprocessing.get_context("spawn")
+    progress_queue = context.Queue()
+    pending_shards = list(zip(output_files, shards))
+    in_flight = set()
+    shard_written = 0
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards)), mp_context=context,
+                             initializer=_init_export_worker, initargs=(progress_queue,)) as executor:
+        while pending_shards or in_flight:
+            # 분할 행 복사본이 한꺼번에 만들어지지 않도록 워커 수만큼만 제출
+            while pending_shards and len(in_flight) < workers:
+                output_file, sheet_ranges = pending_shards.pop(0)
+                rows, relative_ranges = _shard_rows(results, sheet_ranges)
+                in_flight.add(executor.submit(_write_shard, rows, output_file, relative_ranges, columns, widths))
+                del rows
+            done, in_flight = wait(in_flight, timeout=EXPORT_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard_written += future.result()
+            while True:
+                try:
+                    report(progress_queue.get_nowait())
+                except queue.Empty:
+                    break
+    # 큐에 늦게 도착하는 마지막 진행률은 기다리지 않고 워커가 반환한 행 수로 마무리
+    if shard_written > written:
+        report(shard_written - written)
+    return shard_written
+
+
+def export_format_for(output_file: str) -> str:
+    """출력 파일 확장자에 맞는 내보내기 형식"""
+    suffix = Path(output_file).suffix.lower()
+    if suffix not in EXPORT_EXTENSIONS:
+        raise ValueError(f"지원하지 않는 내보내기 파일 형식입니다: {suffix or output_file}")
+    return EXPORT_EXTENSIONS[suffix]
+
+
+def _iter_with_progress(rows: Iterator[list], total: int,
+                        progress_callback: Optional[ExportProgressCallback]) -> Iterator[list]:
+    """행을 그대로 넘기면서 EXPORT_PROGRESS_ROWS마다 진행률 알림"""
+    written = 0
+    for row in rows:
+        yield row
+        written += 1
+        if progress_callback and written % EXPORT_PROGRESS_ROWS == 0:
+            progress_callback(written, total)
+
+
+def write_csv(results: Sequence, output_file: str,
+              progress_callback: Optional[ExportProgressCallback] = None) -> int:
+    """검색 결과를 UTF-8 CSV로 한 행씩 저장하고 쓴 행 수를 반환 (라인 내용은 자르지 않음)"""
+    columns = export_columns(results)
+    rows = iter_export_rows(results, KEYWORD_COLUMN in columns, content_limit=None)
+    written = 0
+    with open(output_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([header for _, header in columns])
+        for row in _iter_with_progress(rows, len(results), progress_callback):
+            writer.writerow(row)
+            written += 1
+    if progress_callback:
+        progress_callback(written, len(results))
+    return written
+
+
+def write_jsonl(results: Sequence, output_file: str,
+                progress_callback: Optional[ExportProgressCallback] = None) -> int:
+    """검색 결과를 JSON Lines(행마다 결과 속성 이름을 키로 한 객체)로 한 행씩 저장하고 쓴 행 수를 반환"""
+    columns = export_columns(results)
+    names = [name for name, _ in columns]
+    rows = iter_export_rows(results, KEYWORD_COLUMN in columns, content_limit=None)
+    written = 0
+    with open(output_file, "w", encoding="utf-8", newline="\n") as f:
+        for row in _iter_with_progress(rows, len(results), progress_callback):
+            f.write(json.dumps(dict(zip(names, row)), ensure_ascii=False))
+            f.write("\n")
+            written += 1
+    if progress_callback:
+        progress_callback(written, len(results))
+    return written
+
+
+def write_parquet(results: Sequence, output_file: str,
+                  progress_callback: Optional[ExportProgressCallback] = None) -> int:
+    """검색 결과를 Parquet로 저장하고 쓴 행 수를 반환 (pyarrow 필요)
+
+    PARQUET_BATCH_ROWS행씩 열 배열로 모아 행 그룹 하나로 쓰므로 메모리는 배치 크기만큼만 사용합니다.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = export_columns(results)
+    names = [name for name, _ in columns]
+    schema = pa.schema([(name, pa.int64() if name == "line_number" else pa.string()) for name in names])
+    rows = iter_export_rows(results, KEYWORD_COLUMN in columns, content_limit=None)
+    total = len(results)
+    written = 0
+    with pq.ParquetWriter(output_file, schema) as writer:
+        batch = [[] for _ in names]
+        for row in rows:
+            for values, value in zip(batch, row):
+                values.append(value)
+            if len(batch[0]) == PARQUET_BATCH_ROWS:
+                writer.write_table(pa.table(batch, schema=schema))
+                written += PARQUET_BATCH_ROWS
+                batch = [[] for _ in names]
+                if progress_callback:
+                    progress_callback(written, total)
+        if batch[0] or not written:
+            writer.write_table(pa.table(batch, schema=schema))
+            written += len(batch[0])
+    if progress_callback:
+        progress_callback(written, total)
+    return written
+
+
+# 형식별 단일 파일 저장 함수 (Excel은 행 제한 분할이 필요해 write_excel을 따로 사용)
+EXPORT_WRITERS = {
+    EXPORT_FORMAT_CSV: write_csv,
+    EXPORT_FORMAT_JSONL: write_jsonl,
+    EXPORT_FORMAT_PARQUET: write_parquet,
+}
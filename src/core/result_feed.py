@@ -0,0 +1,125 @@
+from collections import deque
+from typing import Any, List, Optional, Tuple
+
+from .result_store import FileSummary, ResultRow, ResultStore
+
+
+# drain() 한 번에 가져가는 기본 최대 행 수 (GUI 한 프레임에 삽입할 양)
+DEFAULT_MAX_ROWS_PER_DRAIN = 1000
+# drain() 한 번에 가져가는 기본 최대 파일 요약 수
+DEFAULT_MAX_FILES_PER_DRAIN = 500
+
+# 진행률: (검색한 파일 수, 발견한 파일 수, 마지막 파일)
+Progress = Tuple[int, int, str]
+
+
+class FeedUpdate:
+    """drain() 한 번으로 가져간 변경 내용"""
+
+    __slots__ = ("store", "start", "stop", "files", "progress", "finished", "results", "error")
+
+    def __init__(self, store: Optional[ResultStore], start: int, stop: int, files: List[FileSummary],
+                 progress: Optional[Progress], finished: bool, results: Any = None, error: Optional[str] = None):
+        self.store = store
+        # 새로 전달할 결과 행 구간 [start, stop)
+        self.start = start
+        self.stop = stop
+        # 새로 검색이 끝난 매칭 파일 요약
+        self.files = files
+        # 지난 drain() 이후 바뀐 진행률 (바뀌지 않았으면 None)
+        self.progress = progress
+        # 검색이 끝났고 전달할 행/파일 요약도 더 없는지 여부
+        self.finished = finished
+        self.results = results
+        self.error = error
+
+    @property
+    def row_count(self) -> int:
+        return self.stop - self.start
+
+
+class ResultFeed:
+    """검색 스레드에서 GUI 메인 루프로 결과와 진행률을 넘기는 전달 큐
+
+    검색 스레드는 push_results()/push_files()/push_progress()로 값만 기록하고 위젯에는 접근하지 않습니다.
+    결과 행은 ResultStore에 이미 들어 있으므로 행 객체 대신 (시작, 끝) 구간만 deque에 넣고,
+    파일 요약은 그룹 보기용으로 따로 쌓으며, 진행률은 마지막 값 하나만 유지합니다 (deque 추가/꺼내기와 속성 대입은 원자적이라 잠금이 필요 없음).
+    GUI는 타이머로 drain()을 호출해 이어진 구간을 합쳐 한 번에 최대 max_rows개씩 가져갑니다.
+    생산자는 검색 스레드 하나, 소비자는 GUI 스레드 하나라고 가정합니다.
+    """
+
+    def __init__(self):
+        self._ranges = deque()
+        self._files = deque()
+        self._progress: Optional[Progress] = None
+        self._last_progress: Optional[Progress] = None
+        self._done = False
+        self.store: Optional[ResultStore] = None
+        self.results: Any = None
+        self.error: Optional[str] = None
+        # 지금까지 전달된(GUI가 가져간) 행 수
+        self.delivered_rows = 0
+
+    def push_results(self, rows: List[ResultRow]):
+        """result_callback: 이번 배치에서 추가된 행 (검색 스레드에서 호출)"""
+        if rows:
+            self.store = rows[0].store
+            self._ranges.append((rows[0].index, rows[-1].index + 1))
+
+    def push_files(self, summaries: List[FileSummary]):
+        """file_callback: 이번 배치에서 검색이 끝난 매칭 파일 요약 (검색 스레드에서 호출)"""
+        self._files.extend(summaries)
+
+    def push_progress(self, current: int, total: int, current_file: str):
+        """progress_callback: 최신 진행률만 기록 (검색 스레드에서 호출)"""
+        self._progress = (current, total, current_file)
+
+    def finish(self, results: Any = None):
+        """검색 완료 (마지막 결과를 넣은 뒤 호출)"""
+        self.results = results
+        self._done = True
+
+    def fail(self, error_message: str):
+        """검색 오류로 종료"""
+        self.error = error_message
+        self._done = True
+
+    @property
+    def done(self) -> bool:
+        """검색 스레드가 끝났는지 여부 (전달할 행이 남아 있을 수 있음)"""
+        return self._done
+
+    def drain(self, max_rows: int = DEFAULT_MAX_ROWS_PER_DRAIN,
+              max_files: int = DEFAULT_MAX_FILES_PER_DRAIN) -> FeedUpdate:
+        """쌓인 결과 구간을 최대 max_rows행, 파일 요약을 최대 max_files개까지 가져옴 (GUI 스레드에서 호출)"""
+        # 완료 여부를 먼저 읽어야 완료 직전에 들어온 구간을 놓치지 않음
+        done = self._done
+        start = stop = self.delivered_rows
+        while self._ranges and stop - start < max_rows:
+            range_start, range_stop = self._ranges[0]
+            if stop == start:
+                # 기존 행이 있는 저장소에 추가된 경우 첫 구간부터 시작
+                start = stop = max(range_start, stop)
+            elif range_start > stop:
+                # 이어지지 않는 구간은 다음 drain()에서 처리
+                break
+            self._ranges.popleft()
+            if range_stop - start > max_rows:
+                # 한 프레임 분량만 가져가고 나머지는 되돌려 놓음
+                self._ranges.appendleft((start + max_rows, range_stop))
+                range_stop = start + max_rows
+            stop = max(stop, range_stop)
+        self.delivered_rows = stop
+
+        files = []
+        while self._files and len(files) < max_files:
+            files.append(self._files.popleft())
+
+        progress = self._progress
+        if progress == self._last_progress:
+            progress = None
+        else:
+            self._last_progress = progress
+
+        finished = done and not self._ranges and not self._files
+        return FeedUpdate(self.store, start, stop, files, progress, finished, self.results, self.error)
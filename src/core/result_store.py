@@ -0,0 +1,346 @@
+import operator
+import os
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .matching import Match
+from .multi_keyword import keyword_key
+
+
+# 결과 정렬 기준
+SORT_KEYS = ("file", "line", "content", "match")
+
+
+class ResultRow:
+    """ResultStore의 한 행을 가리키는 가벼운 뷰 (SearchResult와 같은 속성 제공)"""
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "ResultStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def file_path(self) -> str:
+        return self.store._paths[self.store.file_ids[self.index]]
+
+    @property
+    def file_name(self) -> str:
+        return self.store._names[self.store.file_ids[self.index]]
+
+    @property
+    def line_number(self) -> int:
+        return self.store.line_numbers[self.index]
+
+    @property
+    def content(self) -> str:
+        return self.store._lines[self.store.line_ids[self.index]]
+
+    @property
+    def match_span(self) -> Tuple[int, int]:
+        """라인 내용 기준 매칭 위치 (시작, 끝)"""
+        return self.store.match_starts[self.index], self.store.match_ends[self.index]
+
+    @property
+    def match_text(self) -> str:
+        return self.store.match_text(self.index)
+
+    @property
+    def keyword(self) -> Optional[str]:
+        return self.store.keyword(self.index)
+
+
+class FileSummary:
+    """파일 단위 결과 요약 (파일 경로, 매칭 수, 첫 매칭) - 파일별 그룹 보기용"""
+
+    __slots__ = ("file_id", "file_path", "hit_count", "first_row", "first_line_number", "first_content")
+
+    def __init__(self, file_id: int, file_path: str, hit_count: int, first_row: int,
+                 first_line_number: int, first_content: str):
+        self.file_id = file_id
+        self.file_path = file_path
+        self.hit_count = hit_count
+        self.first_row = first_row
+        self.first_line_number = first_line_number
+        self.first_content = first_content
+
+    @property
+    def file_name(self) -> str:
+        return os.path.basename(self.file_path)
+
+
+class ResultStore:
+    """검색 결과를 열 단위로 저장하는 컴팩트 저장소
+
+    매칭마다 SearchResult 객체를 만드는 대신 파일 경로는 파일 ID로 한 번만 저장하고,
+    라인 번호/매칭 위치는 array에, 라인 내용은 같은 라인의 매칭끼리 공유합니다.
+    매칭 텍스트는 라인 내용의 구간으로 복원하며, 라인을 넘어가는 매칭(여러 줄 검색)만 따로 보관합니다.
+    결과 추가는 검색 스레드 하나에서만 하고, GUI/내보내기는 ResultRow 뷰로 읽습니다.
+    """
+
+    def __init__(self):
+        self._paths: List[str] = []
+        self._names: List[str] = []
+        self._path_ids: Dict[str, int] = {}
+        # 파일 ID별 행 구간 목록 [(시작, 끝)] (파일 단위 이동/그룹 표시용 보조 인덱스)
+        self._file_ranges: List[List[Tuple[int, int]]] = []
+        # 파일 ID별 같은 내용의 대표 파일 ID (중복 내용 검색에서 내용 해시가 같은 파일 중 처음 추가된 파일)
+        self._content_owners: List[int] = []
+        self._owner_by_digest: Dict[bytes, int] = {}
+        self._duplicate_counts: Dict[int, int] = {}
+        self._lines: List[str] = []
+        self._long_matches: Dict[int, str] = {}
+        self.file_ids = array("I")
+        self.line_numbers = array("I")
+        self.line_ids = array("I")
+        self.match_starts = array("I")
+        self.match_ends = array("I")
+        self._text_bytes = 0
+        # 다중 키워드 검색: 매칭 텍스트 → 키워드
+        self._keyword_lookup: Optional[Dict[str, str]] = None
+        self._case_sensitive = False
+        # 최대 결과 수에 도달해 검색을 일찍 끝냈는지 여부와 검색하지 못한 파일 수
+        self.truncated = False
+        self.unscanned_files = 0
+
+    def set_keyword_lookup(self, lookup: Optional[Dict[str, str]], case_sensitive: bool = False):
+        """다중 키워드 검색의 매칭 텍스트 → 키워드 매핑 설정"""
+        self._keyword_lookup = lookup
+        self._case_sensitive = case_sensitive
+
+    @property
+    def has_keywords(self) -> bool:
+        return self._keyword_lookup is not None
+
+    @property
+    def file_count(self) -> int:
+        """결과가 있는 파일 수"""
+        return len(self._paths)
+
+    def _file_id(self, file_path: str) -> int:
+        file_id = self._path_ids.get(file_path)
+        if file_id is None:
+            file_id = len(self._paths)
+            self._path_ids[file_path] = file_id
+            self._paths.append(file_path)
+            self._names.append(os.path.basename(file_path))
+            self._file_ranges.append([])
+            self._content_owners.append(file_id)
+            self._text_bytes += sys.getsizeof(file_path) + sys.getsizeof(self._names[-1])
+        return file_id
+
+    def add_file_matches(self, file_path: str, matches: List[Match], content_digest: Optional[bytes] = None) -> int:
+        """한 파일의 매칭 목록을 추가하고 추가된 행 수를 반환 (content_digest가 있으면 같은 내용의 파일끼리 묶음)"""
+        if not matches:
+            return 0
+
+        file_id = self._file_id(file_path)
+        if content_digest is not None and not self._file_ranges[file_id]:
+            owner = self._owner_by_digest.setdefault(content_digest, file_id)
+            if owner != file_id:
+                self._content_owners[file_id] = owner
+                self._duplicate_counts[owner] = self._duplicate_counts.get(owner, 0) + 1
+        start = len(self.file_ids)
+        ranges = self._file_ranges[file_id]
+        if ranges and ranges[-1][1] == start:
+            ranges[-1] = (ranges[-1][0], start + len(matches))
+        else:
+            ranges.append((start, start + len(matches)))
+        last_line_num = 0
+        line_id = 0
+        for line_num, line_text, column, match_text in matches:
+            # 같은 라인의 매칭은 라인 내용을 공유
+            if line_num != last_line_num:
+                last_line_num = line_num
+                line_id = len(self._lines)
+                self._lines.append(line_text)
+                self._text_bytes += sys.getsizeof(line_text)
+
+            end = column + len(match_text)
+            if column < 0 or line_text[column:end] != match_text:
+                # 라인 내용으로 복원할 수 없는 매칭 (줄바꿈 포함, 앞 공백에서 시작)
+                self._long_matches[len(self.file_ids)] = match_text
+                self._text_bytes += sys.getsizeof(match_text)
+                column = end = 0
+
+            self.file_ids.append(file_id)
+            self.line_numbers.append(line_num)
+            self.line_ids.append(line_id)
+            self.match_starts.append(column)
+            self.match_ends.append(end)
+        return len(matches)
+
+    def file_id(self, index: int) -> int:
+        """행의 파일 ID"""
+        return self.file_ids[index]
+
+    def file_path_of(self, file_id: int) -> str:
+        return self._paths[file_id]
+
+    def file_row_ranges(self, file_id: int) -> List[Tuple[int, int]]:
+        """파일의 행 구간 목록 [(시작, 끝)] (한 번의 검색에서는 보통 구간 하나)"""
+        return self._file_ranges[file_id]
+
+    def file_range_at(self, index: int) -> Tuple[int, int]:
+        """행이 속한 같은 파일의 연속 행 구간 (시작, 끝)"""
+        for start, stop in self._file_ranges[self.file_ids[index]]:
+            if start <= index < stop:
+                return start, stop
+        return index, index + 1
+
+    def file_summary(self, file_id: int) -> FileSummary:
+        """파일 ID의 결과 요약"""
+        first_row = self._file_ranges[file_id][0][0]
+        return FileSummary(file_id, self._paths[file_id], self.file_hit_count(file_id), first_row,
+                           self.line_numbers[first_row], self._lines[self.line_ids[first_row]])
+
+    def file_hit_count(self, file_id: int) -> int:
+        """파일의 매칭 수"""
+        return sum(stop - start for start, stop in self._file_ranges[file_id])
+
+    def content_owner(self, file_id: int) -> int:
+        """같은 내용의 파일 중 처음 추가된 파일 ID (중복이 아니면 자기 자신)"""
+        return self._content_owners[file_id]
+
+    def duplicate_count(self, file_id: int) -> int:
+        """파일과 내용이 같은 다른 파일 수 (대표 파일 기준)"""
+        return self._duplicate_counts.get(self._content_owners[file_id], 0)
+
+    @property
+    def duplicate_file_count(self) -> int:
+        """다른 파일과 내용이 같아 접을 수 있는 파일 수"""
+        return sum(self._duplicate_counts.values())
+
+    def unique_rows(self, indices: Iterable[int]) -> array:
+        """행 인덱스 중 같은 내용의 대표 파일 행만 남긴 순서 (중복 파일 접기)"""
+        owners, file_ids = self._content_owners, self.file_ids
+        return array("I", [index for index in indices if owners[file_ids[index]] == file_ids[index]])
+
+    def file_rows(self, file_id: int) -> Iterator[int]:
+        """파일의 행 인덱스 (추가된 순서)"""
+        for start, stop in self._file_ranges[file_id]:
+            yield from range(start, stop)
+
+    def match_text(self, index: int) -> str:
+        """행의 매칭 텍스트"""
+        long_match = self._long_matches.get(index)
+        if long_match is not None:
+            return long_match
+        return self._lines[self.line_ids[index]][self.match_starts[index]:self.match_ends[index]]
+
+    def keyword(self, index: int) -> Optional[str]:
+        """다중 키워드 검색에서 행이 매칭된 키워드"""
+        if self._keyword_lookup is None:
+            return None
+        match_text = self.match_text(index)
+        return self._keyword_lookup.get(keyword_key(match_text, self._case_sensitive), match_text)
+
+    def max_text_lengths(self, content_limit: Optional[int] = None) -> Dict[str, int]:
+        """열별 최대 표시 길이 (내보내기 열 너비 계산용)
+
+        경로와 라인 내용은 중복 제거된 값만, 매칭 텍스트는 위치 배열만 확인하므로 행을 만들지 않습니다.
+        content_limit이 있으면 라인 내용은 그 길이까지만 셉니다.
+        """
+        line_length = max(map(len, self._lines), default=0)
+        if content_limit is not None:
+            line_length = min(line_length, content_limit)
+        match_length = max(map(operator.sub, self.match_ends, self.match_starts), default=0)
+        match_length = max(match_length, max(map(len, self._long_matches.values()), default=0))
+        keyword_length = 0
+        if self._keyword_lookup is not None:
+            keyword_length = max(match_length, max(map(len, self._keyword_lookup.values()), default=0))
+        return {
+            "file_path": max(map(len, self._paths), default=0),
+            "file_name": max(map(len, self._names), default=0),
+            "line_number": len(str(max(self.line_numbers, default=0))),
+            "content": line_length,
+            "match_text": match_length,
+            "keyword": keyword_length,
+        }
+
+    def subset(self, start: int, stop: int) -> "ResultStore":
+        """[start, stop) 행만 담은 새 저장소 (내보내기 분할을 다른 프로세스로 보낼 때 사용)
+
+        행은 추가된 순서라 라인 ID가 증가하므로 라인 내용은 필요한 구간만 복사합니다.
+        """
+        stop = min(stop, len(self))
+        part = ResultStore()
+        part._paths = list(self._paths)
+        part._names = list(self._names)
+        part._path_ids = dict(self._path_ids)
+        part._content_owners = list(self._content_owners)
+        part._owner_by_digest = dict(self._owner_by_digest)
+        part._duplicate_counts = dict(self._duplicate_counts)
+        part._file_ranges = [[(max(range_start, start) - start, min(range_stop, stop) - start)
+                              for range_start, range_stop in ranges if range_start < stop and range_stop > start]
+                             for ranges in self._file_ranges]
+        if start < stop:
+            first_line = self.line_ids[start]
+            part._lines = self._lines[first_line:self.line_ids[stop - 1] + 1]
+            part.line_ids = array("I", [line_id - first_line for line_id in self.line_ids[start:stop]])
+        part._long_matches = {index - start: text for index, text in self._long_matches.items()
+                              if start <= index < stop}
+        part.file_ids = self.file_ids[start:stop]
+        part.line_numbers = self.line_numbers[start:stop]
+        part.match_starts = self.match_starts[start:stop]
+        part.match_ends = self.match_ends[start:stop]
+        part._keyword_lookup = self._keyword_lookup
+        part._case_sensitive = self._case_sensitive
+        return part
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> List[ResultRow]:
+        """구간의 행 뷰 목록"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [ResultRow(self, index) for index in range(start, stop)]
+
+    def sorted_indices(self, key: str, reverse: bool = False, stop: Optional[int] = None) -> array:
+        """정렬 기준에 따른 행 인덱스 순서 (같은 값은 추가된 순서 유지, stop이 있으면 그 앞 행만)
+
+        file은 파일 이름(같으면 전체 경로)과 라인 번호 순, match는 다중 키워드 검색이면 키워드 순입니다.
+        """
+        if key == "file":
+            # 파일 ID별 순위를 먼저 구해 행마다 정수 키 하나로 비교
+            ranks = [0] * len(self._paths)
+            by_name = sorted(range(len(self._paths)), key=lambda file_id: (self._names[file_id], self._paths[file_id]))
+            for rank, file_id in enumerate(by_name):
+                ranks[file_id] = rank
+            file_ids, line_numbers = self.file_ids, self.line_numbers
+            sort_key = lambda index: (ranks[file_ids[index]] << 32) | line_numbers[index]
+        elif key == "line":
+            sort_key = self.line_numbers.__getitem__
+        elif key == "content":
+            lines, line_ids = self._lines, self.line_ids
+            sort_key = lambda index: lines[line_ids[index]]
+        elif key == "match":
+            sort_key = self.keyword if self.has_keywords else self.match_text
+        else:
+            raise ValueError(f"알 수 없는 정렬 기준입니다: {key}")
+        stop = len(self) if stop is None else min(stop, len(self))
+        return array("I", sorted(range(stop), key=sort_key, reverse=reverse))
+
+    def memory_usage(self) -> int:
+        """결과 저장에 사용 중인 대략적인 메모리 (바이트)"""
+        arrays = (self.file_ids, self.line_numbers, self.line_ids, self.match_starts, self.match_ends)
+        array_bytes = sum(column.buffer_info()[1] * column.itemsize for column in arrays)
+        list_bytes = (sys.getsizeof(self._lines) + sys.getsizeof(self._paths) + sys.getsizeof(self._names)
+                      + sys.getsizeof(self._file_ranges) + sum(sys.getsizeof(ranges) for ranges in self._file_ranges)
+                      + sys.getsizeof(self._content_owners))
+        dict_bytes = sys.getsizeof(self._path_ids) + sys.getsizeof(self._long_matches)
+        return array_bytes + list_bytes + dict_bytes + self._text_bytes
+
+    def __len__(self) -> int:
+        return len(self.file_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [ResultRow(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("결과 인덱스 범위를 벗어났습니다.")
+        return ResultRow(self, index)
+
+    def __iter__(self) -> Iterator[ResultRow]:
+        for index in range(len(self)):
+            yield ResultRow(self, index)
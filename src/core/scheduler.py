@@ -0,0 +1,100 @@
+import heapq
+import os
+import threading
+from typing import List, Tuple
+
+
+# 배치당 목표 바이트 범위와 최대 파일 수
+MIN_BATCH_BYTES = 256 * 1024
+MAX_BATCH_BYTES = 8 * 1024 * 1024
+MAX_BATCH_FILES = 256
+# 워커당 배치 수 (작을수록 배치가 커지고, 클수록 부하 분산이 세밀해짐)
+BATCHES_PER_WORKER = 8
+# 탐색기가 앞서 나갈 수 있는 대기 파일 수 (초과하면 탐색기가 대기)
+MAX_PENDING_FILES = 10000
+
+# 스케줄러 항목: (파일 경로, stat 결과)
+ScheduledFile = Tuple[str, os.stat_result]
+
+
+class FileScheduler:
+    """파일 크기 기반 동적 배치 스케줄러 (탐색과 검색을 동시에 진행하는 제한 큐)
+
+    디렉토리 탐색 스레드가 add()로 파일을 넣는 동안 검색 워커가 next_batch()로 바로 가져갑니다.
+    대기 중인 파일 중 큰 파일부터 꺼내며, 배치의 바이트 합계가 목표치에 도달할 때까지 파일을 담습니다.
+    목표치는 지금까지 발견한 전체 크기에 맞춰 커지므로 첫 배치는 작게 시작해 결과가 빨리 나옵니다.
+    """
+
+    def __init__(self, workers: int, max_pending: int = MAX_PENDING_FILES):
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self.discovered = 0
+        self.total_bytes = 0
+        self.batch_bytes = MIN_BATCH_BYTES
+        self.closed = False
+        self.cancelled = False
+        self._heap = []
+        self._condition = threading.Condition()
+
+    def add(self, file_path: str, stat: os.stat_result) -> bool:
+        """검색할 파일 추가 (대기 파일이 많으면 자리가 날 때까지 대기)
+
+        Returns:
+            취소되었으면 False
+        """
+        with self._condition:
+            while len(self._heap) >= self.max_pending and not self.cancelled:
+                self._condition.wait()
+            if self.cancelled:
+                return False
+            # 같은 크기의 파일은 발견한 순서대로
+            heapq.heappush(self._heap, (-stat.st_size, self.discovered, file_path, stat))
+            self.discovered += 1
+            self.total_bytes += stat.st_size
+            target = self.total_bytes // (self.workers * BATCHES_PER_WORKER)
+            self.batch_bytes = max(MIN_BATCH_BYTES, min(MAX_BATCH_BYTES, target))
+            self._condition.notify_all()
+        return True
+
+    def close(self):
+        """탐색 완료 (더 이상 파일이 추가되지 않음)"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def cancel(self):
+        """대기 중인 파일을 버리고 탐색기를 깨웁니다."""
+        with self._condition:
+            self.cancelled = True
+            self.closed = True
+            self._heap.clear()
+            self._condition.notify_all()
+
+    @property
+    def exhausted(self) -> bool:
+        """탐색이 끝났고 남은 파일도 없는지 여부"""
+        return self.closed and not self._heap
+
+    def wait_for_files(self, timeout: float):
+        """새 파일이 들어오거나 탐색이 끝날 때까지 최대 timeout초 대기"""
+        with self._condition:
+            if not self._heap and not self.closed:
+                self._condition.wait(timeout)
+
+    def next_batch(self) -> List[ScheduledFile]:
+        """다음 배치를 꺼냅니다. 지금 대기 중인 파일이 없으면 빈 리스트 반환"""
+        batch = []
+        batch_bytes = 0
+        with self._condition:
+            while self._heap and len(batch) < MAX_BATCH_FILES:
+                if batch and batch_bytes + (-self._heap[0][0]) > self.batch_bytes:
+                    break
+                size, _, file_path, stat = heapq.heappop(self._heap)
+                batch.append((file_path, stat))
+                batch_bytes -= size
+            if batch:
+                self._condition.notify_all()
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -0,0 +1,518 @@
+import os
+import json
+import time
+import secrets
+import threading
+import http.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .file_filter import DEFAULT_MAX_FILE_SIZE_MB
+from .multi_keyword import build_keyword_lookup, normalize_keywords
+from .result_store import FileSummary, ResultRow, ResultStore
+from .search_engine import SearchEngine
+
+
+DAEMON_PROTOCOL_VERSION = 1
+DAEMON_HOST = "127.0.0.1"
+DEFAULT_DAEMON_STATE_FILE = Path.home() / ".java_search" / "daemon.json"
+# 데몬 요청 인증 헤더 (상태 파일을 읽을 수 있는 사용자만 접속)
+TOKEN_HEADER = "X-Search-Token"
+# 데몬 확인 요청 제한 시간 (초, 실행 중이 아니면 바로 로컬 검색)
+PROBE_TIMEOUT = 0.5
+# 진행률 이벤트 최소 간격 (초)
+PROGRESS_INTERVAL = 0.1
+# 데몬이 메모리에 유지할 결과 캐시 세그먼트(검색 조건) 수
+DAEMON_RESULT_SEGMENTS = 8
+DEFAULT_EXTENSIONS = (".java", ".xml", ".properties")
+
+# 데몬으로 전달하는 SearchEngine.search() 옵션 (콜백/결과 저장소 제외)
+REMOTE_SEARCH_OPTIONS = (
+    "keyword", "use_regex", "case_sensitive", "whole_word", "file_extensions", "exclude_patterns",
+    "file_encoding", "use_index", "multiline", "keywords", "max_results", "max_depth", "include_binary",
+    "max_file_size", "dedupe_content",
+)
+
+# 스트림 이벤트 (JSON Lines 한 줄에 하나)
+EVENT_PROGRESS = "progress"
+EVENT_FILES = "files"
+EVENT_DONE = "done"
+EVENT_ERROR = "error"
+
+
+def _encode_rows(rows: List[ResultRow], with_content_key: bool) -> List[Dict[str, Any]]:
+    """결과 행을 파일 단위 매칭 목록으로 변환 (같은 파일의 연속된 행끼리 묶음)
+
+    매칭은 (라인 번호, 라인 내용, 매칭 시작 위치, 매칭 텍스트)로 보내며, 클라이언트는 그대로
+    ResultStore.add_file_matches()에 넣습니다. 중복 내용 검색이면 같은 내용의 대표 파일 경로를
+    content_key로 보내 클라이언트에서도 같은 내용의 파일끼리 묶을 수 있게 합니다.
+    """
+    files = []
+    current_id = None
+    for row in rows:
+        store = row.store
+        file_id = store.file_id(row.index)
+        if file_id != current_id:
+            current_id = file_id
+            content_key = store.file_path_of(store.content_owner(file_id)) if with_content_key else None
+            files.append({"path": row.file_path, "content_key": content_key, "matches": []})
+        files[-1]["matches"].append((row.line_number, row.content, row.match_span[0], row.match_text))
+    return files
+
+
+def write_state_file(state_file: Path, state: Dict[str, Any]):
+    """데몬 주소와 토큰을 소유자만 읽을 수 있는 상태 파일로 저장"""
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = state_file.with_suffix(".tmp")
+    fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(temp_file, state_file)
+
+
+def read_state_file(state_file: Path) -> Optional[Dict[str, Any]]:
+    """상태 파일을 읽음 (없거나 손상되었으면 None)"""
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != DAEMON_PROTOCOL_VERSION:
+        return None
+    return state
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """데몬 HTTP 요청 처리 (GET /status, POST /search, /roots, /cancel, /clear-cache, /shutdown)"""
+
+    server_version = "JavaSearchDaemon/1"
+
+    def log_message(self, format, *args):
+        # 요청마다 표준 오류에 기록하지 않음
+        pass
+
+    @property
+    def search_daemon(self) -> "SearchDaemon":
+        return self.server.search_daemon
+
+    def _authorized(self) -> bool:
+        token = self.headers.get(TOKEN_HEADER, "")
+        # compare_digest는 비ASCII str에 TypeError를 내므로 바이트로 비교
+        if secrets.compare_digest(token.encode("utf-8", "surrogateescape"), self.search_daemon.token.encode()):
+            return True
+        self._send_json({"error": "인증 토큰이 올바르지 않습니다."}, 403)
+        return False
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        body = json.loads(self.rfile.read(length).decode("utf-8"))
+        if not isinstance(body, dict):
+            raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+        return body
+
+    def _send_json(self, data: Dict[str, Any], status: int = 200):
+        body = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        if self.path == "/status":
+            self._send_json(self.search_daemon.status())
+        else:
+            self._send_json({"error": f"알 수 없는 요청입니다: {self.path}"}, 404)
+
+    def do_POST(self):
+        if not self._authorized():
+            return
+        try:
+            body = self._read_json()
+        except ValueError as e:
+            self._send_json({"error": f"잘못된 요청입니다: {e}"}, 400)
+            return
+
+        if self.path == "/search":
+            self._stream_search(body)
+        elif self.path == "/roots":
+            try:
+                self._send_json(self.search_daemon.register_root(
+                    body.get("search_dir", ""), tuple(body.get("file_extensions") or DEFAULT_EXTENSIONS),
+                    body.get("exclude_patterns")))
+            except ValueError as e:
+                self._send_json({"error": str(e)}, 400)
+        elif self.path == "/cancel":
+            self.search_daemon.cancel(body.get("search_id"))
+            self._send_json({"cancelled": True})
+        elif self.path == "/clear-cache":
+            self._send_json({"freed_bytes": self.search_daemon.clear_result_cache()})
+        elif self.path == "/shutdown":
+            self._send_json({"stopping": True})
+            self.search_daemon.stop()
+        else:
+            self._send_json({"error": f"알 수 없는 요청입니다: {self.path}"}, 404)
+
+    def _stream_search(self, body: Dict[str, Any]):
+        """검색 이벤트를 JSON Lines로 스트리밍 (연결이 끊기면 검색 취소)"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.end_headers()
+        disconnected = False
+
+        def emit(event: Dict[str, Any]):
+            nonlocal disconnected
+            if disconnected:
+                return
+            try:
+                self.wfile.write(json.dumps(event, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            except OSError:
+                disconnected = True
+                self.search_daemon.cancel(body.get("search_id"))
+
+        self.search_daemon.search(body, emit)
+
+
+class SearchDaemon:
+    """검색 엔진과 캐시/인덱스를 메모리에 유지하는 로컬 검색 데몬 (localhost HTTP/JSON)
+
+    등록한 검색 디렉토리의 트라이그램 인덱스와 디렉토리 목록 캐시, 최근 검색 조건의 결과 캐시,
+    정규식 패턴 캐시, 프로세스 풀을 검색 간에 유지하므로 GUI/CLI를 새로 실행해도 따뜻한 상태로 검색합니다.
+    검색 결과는 배치가 끝날 때마다 파일 단위 JSON Lines 이벤트로 스트리밍합니다.
+    엔진은 검색 하나씩만 실행하므로 동시에 들어온 검색은 순서대로 처리합니다.
+    주소와 인증 토큰은 상태 파일에 기록하며, 클라이언트는 DaemonClient.discover()로 찾습니다.
+    """
+
+    def __init__(self, engine: Optional[SearchEngine] = None, host: str = DAEMON_HOST, port: int = 0,
+                 state_file: Optional[str] = None):
+        self.engine = engine or SearchEngine()
+        self.engine.result_cache.keep_open = DAEMON_RESULT_SEGMENTS
+        self.state_file = Path(state_file) if state_file else DEFAULT_DAEMON_STATE_FILE
+        self.token = secrets.token_hex(16)
+        # 검색 디렉토리(절대 경로) → 등록 정보 (확장자, 제외 패턴, 파일 수, 검색 수, 최근 지연 시간)
+        self.roots: Dict[str, Dict[str, Any]] = {}
+        self.started_at = time.time()
+        self.search_count = 0
+        self.total_latency = 0.0
+        self.last_latency: Optional[float] = None
+        self._search_lock = threading.Lock()
+        # 실행 중인 검색 ID와 차례를 기다리는 중에 취소된 검색 ID (다른 클라이언트의 검색은 취소하지 않음)
+        self._active_search_id: Optional[str] = None
+        self._cancelled_ids = set()
+        self._cancel_lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), _DaemonRequestHandler)
+        self.server.daemon_threads = True
+        self.server.search_daemon = self
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def _root_info(self, root: str) -> Dict[str, Any]:
+        return self.roots.setdefault(root, {
+            "file_extensions": list(DEFAULT_EXTENSIONS), "exclude_patterns": [], "files": None,
+            "warm_time": None, "searches": 0, "last_latency": None,
+        })
+
+    def register_root(self, search_dir: str, file_extensions: tuple = DEFAULT_EXTENSIONS,
+                      exclude_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """검색 디렉토리를 등록하고 인덱스/디렉토리 목록을 미리 로드 (등록 정보 반환)"""
+        root = os.path.abspath(search_dir)
+        start = time.time()
+        with self._search_lock:
+            files = self.engine.preload(root, file_extensions, exclude_patterns)
+        info = self._root_info(root)
+        info.update(file_extensions=list(file_extensions), exclude_patterns=list(exclude_patterns or []),
+                    files=files, warm_time=time.time() - start)
+        print(f"검색 디렉토리 등록: {root} ({files}개 파일, {info['warm_time']:.2f}초)")
+        return dict(info, search_dir=root)
+
+    def search(self, options: Dict[str, Any], emit: Callable[[Dict[str, Any]], None]):
+        """요청 옵션으로 검색하며 진행률/결과/완료 이벤트를 emit으로 보냄"""
+        received = time.time()
+        search_dir = os.path.abspath(options.get("search_dir") or ".")
+        search_id = options.get("search_id")
+        kwargs = {name: options[name] for name in REMOTE_SEARCH_OPTIONS if name in options}
+        if "file_extensions" in kwargs:
+            kwargs["file_extensions"] = tuple(kwargs["file_extensions"])
+        with_content_key = bool(kwargs.get("dedupe_content"))
+        last_progress = 0.0
+
+        def on_progress(current: int, total: int, current_file: str):
+            nonlocal last_progress
+            now = time.time()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                last_progress = now
+                emit({"event": EVENT_PROGRESS, "current": current, "total": total, "file": current_file})
+
+        def on_results(rows: List[ResultRow]):
+            emit({"event": EVENT_FILES, "files": _encode_rows(rows, with_content_key)})
+
+        with self._search_lock:
+            queue_time = time.time() - received
+            with self._cancel_lock:
+                if search_id in self._cancelled_ids:
+                    self._cancelled_ids.discard(search_id)
+                    emit({"event": EVENT_DONE, "stats": {"cancelled": True}, "result_count": 0,
+                          "truncated": False, "unscanned_files": 0})
+                    return
+                self._active_search_id = search_id
+            try:
+                results = self.engine.search(search_dir=search_dir, progress_callback=on_progress,
+                                             result_callback=on_results, **kwargs)
+            except Exception as e:
+                emit({"event": EVENT_ERROR, "message": str(e)})
+                return
+            finally:
+                with self._cancel_lock:
+                    self._active_search_id = None
+            stats = dict(self.engine.last_search_stats)
+
+        latency = time.time() - received
+        self.search_count += 1
+        self.total_latency += latency
+        self.last_latency = latency
+        info = self._root_info(search_dir)
+        info["searches"] += 1
+        info["last_latency"] = latency
+        stats["daemon_queue_time"] = queue_time
+        stats["daemon_latency"] = latency
+        emit({"event": EVENT_DONE, "stats": stats, "result_count": len(results),
+              "truncated": results.truncated, "unscanned_files": results.unscanned_files})
+
+    def clear_result_cache(self) -> int:
+        """메모리에 유지 중인 세그먼트와 디스크의 결과 캐시 삭제 (진행 중인 검색이 끝난 뒤, 삭제한 바이트 수 반환)"""
+        with self._search_lock:
+            freed = self.engine.clear_result_cache()
+        print(f"결과 캐시 삭제: {freed / (1024 * 1024):.1f} MB")
+        return freed
+
+    def cancel(self, search_id: Optional[str]):
+        """검색 취소 (실행 중이면 바로 멈추고, 차례를 기다리는 중이면 시작하지 않음)"""
+        with self._cancel_lock:
+            if search_id is None or search_id == self._active_search_id:
+                self.engine.cancel_current_search()
+            else:
+                self._cancelled_ids.add(search_id)
+
+    def status(self) -> Dict[str, Any]:
+        """데몬 상태 (등록 디렉토리, 검색 수, 평균/최근 지연 시간, 엔진 성능 통계)"""
+        return {
+            "version": DAEMON_PROTOCOL_VERSION,
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started_at,
+            "searching": self._search_lock.locked(),
+            "search_count": self.search_count,
+            "last_latency": self.last_latency,
+            "average_latency": self.total_latency / self.search_count if self.search_count else None,
+            "roots": [dict(info, search_dir=root) for root, info in self.roots.items()],
+            "engine": self.engine.get_performance_stats(),
+        }
+
+    def serve_forever(self, preload_roots: Optional[List[str]] = None, file_extensions: tuple = DEFAULT_EXTENSIONS,
+                      exclude_patterns: Optional[List[str]] = None):
+        """상태 파일을 기록하고 요청을 처리 (preload_roots는 백그라운드에서 미리 로드)"""
+        host, port = self.address
+        write_state_file(self.state_file, {"version": DAEMON_PROTOCOL_VERSION, "host": host, "port": port,
+                                           "pid": os.getpid(), "token": self.token})
+        print(f"검색 데몬 시작: http://{host}:{port} (상태 파일: {self.state_file})")
+        for root in preload_roots or []:
+            threading.Thread(target=self._preload, args=(root, file_extensions, exclude_patterns),
+                             daemon=True).start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.engine.shutdown()
+            # 다른 데몬이 상태 파일을 덮어쓴 경우에는 지우지 않음
+            state = read_state_file(self.state_file)
+            if state is not None and state.get("pid") == os.getpid():
+                try:
+                    self.state_file.unlink()
+                except OSError:
+                    pass
+            print("검색 데몬 종료")
+
+    def _preload(self, root: str, file_extensions: tuple, exclude_patterns: Optional[List[str]]):
+        try:
+            self.register_root(root, file_extensions, exclude_patterns)
+        except Exception as e:
+            print(f"검색 디렉토리 등록 오류: {root} ({e})")
+
+    def stop(self):
+        """요청 처리를 멈춤 (진행 중인 검색은 취소)"""
+        self.engine.cancel_current_search()
+        # serve_forever()가 끝날 때까지 기다리므로 요청 처리 스레드가 아닌 곳에서 호출
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class DaemonClient:
+    """실행 중인 검색 데몬 클라이언트 (SearchEngine.search()와 같은 인터페이스)
+
+    search()는 데몬이 스트리밍한 파일 단위 매칭을 로컬 ResultStore에 추가하면서
+    SearchEngine과 같은 progress/result/file 콜백을 호출합니다.
+    """
+
+    def __init__(self, host: str, port: int, token: str):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.last_search_stats: Dict[str, Any] = {}
+        self.cancel_search = False
+        # 진행 중인 검색 ID (취소 요청에 사용)
+        self._search_id: Optional[str] = None
+
+    @classmethod
+    def discover(cls, state_file: Optional[str] = None) -> Optional["DaemonClient"]:
+        """상태 파일로 실행 중인 데몬을 찾음 (없거나 응답하지 않으면 None)"""
+        state = read_state_file(Path(state_file) if state_file else DEFAULT_DAEMON_STATE_FILE)
+        if state is None:
+            return None
+        try:
+            client = cls(state["host"], int(state["port"]), state["token"])
+            client.status(timeout=PROBE_TIMEOUT)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return client
+
+    def _open(self, method: str, path: str, body: Optional[Dict[str, Any]] = None,
+              timeout: Optional[float] = None) -> http.client.HTTPResponse:
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        payload = json.dumps(body or {}, ensure_ascii=False).encode("utf-8") if method == "POST" else None
+        headers = {TOKEN_HEADER: self.token, "Content-Type": "application/json; charset=utf-8"}
+        connection.request(method, path, body=payload, headers=headers)
+        return connection.getresponse()
+
+    def _call(self, method: str, path: str, body: Optional[Dict[str, Any]] = None,
+              timeout: Optional[float] = None) -> Dict[str, Any]:
+        response = self._open(method, path, body, timeout)
+        with response:
+            data = json.loads(response.read().decode("utf-8"))
+        if response.status != 200:
+            raise ValueError(data.get("error") or f"검색 데몬 오류 (HTTP {response.status})")
+        return data
+
+    def status(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """데몬 상태 조회"""
+        return self._call("GET", "/status", timeout=timeout)
+
+    def register_root(self, search_dir: str, file_extensions: tuple = DEFAULT_EXTENSIONS,
+                      exclude_patterns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """검색 디렉토리를 데몬에 등록하고 미리 로드"""
+        return self._call("POST", "/roots", {"search_dir": os.path.abspath(search_dir),
+                                             "file_extensions": list(file_extensions),
+                                             "exclude_patterns": list(exclude_patterns or [])})
+
+    def clear_result_cache(self) -> int:
+        """데몬의 결과 캐시 삭제 (삭제한 바이트 수 반환)"""
+        return self._call("POST", "/clear-cache")["freed_bytes"]
+
+    def shutdown_daemon(self):
+        """데몬 종료 요청"""
+        self._call("POST", "/shutdown")
+
+    def cancel_current_search(self):
+        """진행 중인 데몬 검색 취소"""
+        self.cancel_search = True
+        if self._search_id is None:
+            return
+        try:
+            self._call("POST", "/cancel", {"search_id": self._search_id}, timeout=PROBE_TIMEOUT)
+        except (OSError, ValueError):
+            pass
+
+    def search(self,
+               search_dir: str,
+               keyword: str,
+               use_regex: bool = True,
+               case_sensitive: bool = False,
+               whole_word: bool = False,
+               file_extensions: tuple = DEFAULT_EXTENSIONS,
+               exclude_patterns: List[str] = None,
+               file_encoding: str = "utf-8",
+               use_index: bool = True,
+               multiline: bool = False,
+               keywords: List[str] = None,
+               result_store: ResultStore = None,
+               max_results: Optional[int] = None,
+               max_depth: Optional[int] = None,
+               include_binary: bool = False,
+               max_file_size: Optional[int] = DEFAULT_MAX_FILE_SIZE_MB * 1024 * 1024,
+               dedupe_content: bool = False,
+               progress_callback: Callable[[int, int, str], None] = None,
+               result_callback: Callable[[List[ResultRow]], None] = None,
+               file_callback: Callable[[List[FileSummary]], None] = None) -> ResultStore:
+        """데몬에서 검색 (인자와 반환 값은 SearchEngine.search()와 같음)
+
+        last_search_stats에는 데몬 엔진의 검색 통계와 함께 왕복 시간(round_trip_time)을 기록합니다.
+
+        Raises:
+            ValueError: 데몬에서 검색이 실패한 경우 (잘못된 경로/정규식 등)
+            ConnectionError: 검색 도중 데몬 연결이 끊어진 경우
+        """
+        start_time = time.time()
+        self.cancel_search = False
+        self.last_search_stats = {}
+        results = result_store if result_store is not None else ResultStore()
+        if keywords:
+            keywords = normalize_keywords(keywords, case_sensitive)
+            results.set_keyword_lookup(build_keyword_lookup(keywords, case_sensitive), case_sensitive)
+        self._search_id = secrets.token_hex(8)
+        request = {
+            "search_id": self._search_id, "search_dir": os.path.abspath(search_dir), "keyword": keyword, "use_regex": use_regex,
+            "case_sensitive": case_sensitive, "whole_word": whole_word, "file_extensions": list(file_extensions),
+            "exclude_patterns": list(exclude_patterns or []), "file_encoding": file_encoding,
+            "use_index": use_index, "multiline": multiline, "keywords": keywords, "max_results": max_results,
+            "max_depth": max_depth, "include_binary": include_binary, "max_file_size": max_file_size,
+            "dedupe_content": dedupe_content,
+        }
+
+        response = self._open("POST", "/search", request)
+        finished = False
+        try:
+            for line in response:
+                event = json.loads(line)
+                kind = event.get("event")
+                if kind == EVENT_FILES:
+                    self._add_files(results, event["files"], result_callback, file_callback)
+                elif kind == EVENT_PROGRESS and progress_callback:
+                    progress_callback(event["current"], event["total"], event["file"])
+                elif kind == EVENT_ERROR:
+                    raise ValueError(event["message"])
+                elif kind == EVENT_DONE:
+                    self.last_search_stats = event["stats"]
+                    results.truncated = event["truncated"]
+                    results.unscanned_files = event["unscanned_files"]
+                    finished = True
+        finally:
+            response.close()
+            self._search_id = None
+
+        if not finished and not self.cancel_search:
+            raise ConnectionError("검색 도중 검색 데몬 연결이 끊어졌습니다.")
+        self.last_search_stats["daemon"] = True
+        self.last_search_stats["round_trip_time"] = time.time() - start_time
+        return results
+
+    @staticmethod
+    def _add_files(results: ResultStore, files: List[Dict[str, Any]], result_callback, file_callback):
+        """스트리밍된 파일 단위 매칭을 결과 저장소에 추가하고 콜백 호출 (SearchEngine과 같은 순서)"""
+        start = len(results)
+        file_rows = []
+        for item in files:
+            content_key = item.get("content_key")
+            first_row = len(results)
+            matches = [tuple(match) for match in item["matches"]]
+            if results.add_file_matches(item["path"], matches, content_key.encode("utf-8") if content_key else None):
+                file_rows.append(first_row)
+        if len(results) > start:
+            if result_callback:
+                result_callback(results.rows(start))
+            if file_callback:
+                file_callback([results.file_summary(results.file_id(row)) for row in file_rows])
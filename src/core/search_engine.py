@@ -1,42 +1,144 @@
 import os
 import re
-import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Callable, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional, Sequence, Tuple
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import time
 
+from .trigram_index import TrigramIndex, query_bits
+from .matching import ASCII_COMPATIBLE_ENCODINGS, Match, ScanStats, codec_name, requires_line_mode, scan_file
+from .process_backend import scan_file_batch
+from .scheduler import FileScheduler, ScheduledFile
+from .file_walker import ExcludeMatcher, FileWalker
+from .listing_cache import DirectoryListingCache
+from .result_cache import ResultCache, ResultCacheSegment
+from .content_dedupe import ContentDedupe
+from .multi_keyword import build_keyword_lookup, build_keyword_pattern, normalize_keywords
+from .result_store import FileSummary, ResultRow, ResultStore
+from .result_export import (EXPORT_FORMAT_CSV, EXPORT_FORMAT_EXCEL, EXPORT_FORMAT_JSONL, EXPORT_FORMAT_LABELS,
+                            EXPORT_FORMAT_PARQUET, EXPORT_SPLIT_FILE, EXPORT_SPLIT_MODES, EXPORT_WRITERS,
+                            ExportProgressCallback, export_format_for, plan_excel_shards, write_excel)
+from .file_filter import DEFAULT_MAX_FILE_SIZE_MB, SNIFF_BYTES, BinaryCache
+from .literal_search import LiteralSearcher
+from .regex_prefilter import RequiredLiteralFilter, extract_required_literals
+
+
+# 정규식 메타 문자 (이 문자가 없으면 정규식도 리터럴로 취급 가능)
+REGEX_META_CHARS = set(r".^$*+?{}[]\|()")
+
+# 검색 백엔드
+BACKEND_THREAD = "thread"
+BACKEND_PROCESS = "process"
+SEARCH_BACKENDS = (BACKEND_THREAD, BACKEND_PROCESS)
+# 다중 키워드 검색에서 인덱스로 후보를 줄이는 최대 키워드 수
+MAX_INDEX_KEYWORDS = 32
+# 디렉토리 탐색 중 새 파일/진행률을 확인하는 간격 (초)
+DISCOVERY_POLL_INTERVAL = 0.05
+
+# 배치 워커가 반환하는 파일별 매칭: (파일 경로, 매칭 목록)
+FileMatches = Tuple[str, List[Match]]
+
 
 class SearchResult:
     """검색 결과를 담는 데이터 클래스"""
-    def __init__(self, file_path: str, file_name: str, line_number: int, content: str, match_text: str):
+    def __init__(self, file_path: str, file_name: str, line_number: int, content: str, match_text: str,
+                 keyword: str = None):
         self.file_path = file_path
         self.file_name = file_name
         self.line_number = line_number
         self.content = content
         self.match_text = match_text
+        # 다중 키워드 검색에서 매칭된 키워드
+        self.keyword = keyword
+
+
+class ScanContext:
+    """검색 1회 동안 워커가 공유하는 검색 설정"""
+    def __init__(self, pattern: re.Pattern, file_encoding: str, buffer_mode: bool = True,
+                 multiline: bool = False, index: Optional[TrigramIndex] = None,
+                 index_bit_sets: List[List[int]] = None, max_results: Optional[int] = None,
+                 skip_binary: bool = False, literal: Optional[LiteralSearcher] = None,
+                 prefilter: Optional[RequiredLiteralFilter] = None,
+                 result_cache: Optional[ResultCacheSegment] = None,
+                 dedupe: Optional[ContentDedupe] = None):
+        self.pattern = pattern
+        self.file_encoding = file_encoding
+        self.buffer_mode = buffer_mode
+        self.multiline = multiline
+        self.index = index
+        # 인덱스 조회 비트 (이 중 하나라도 모두 포함된 파일만 후보)
+        self.index_bit_sets = index_bit_sets or []
+        # 최대 결과 수 (도달하면 stopped를 세워 워커와 탐색기를 멈춤)
+        self.max_results = max_results
+        self.stopped = False
+        # 바이너리 파일 건너뛰기 여부 (앞부분만 읽어 판별)
+        self.skip_binary = skip_binary
+        # 리터럴 검색기 (정규식 미사용 단일 키워드 검색에서 정규식 엔진 대신 사용)
+        self.literal = literal
+        # 정규식 필수 리터럴 사전 필터 (리터럴이 없는 파일은 정규식을 실행하지 않음)
+        self.prefilter = prefilter
+        # 파일별 결과 캐시 (크기/mtime이 같은 파일은 읽지 않고 저장된 매칭 사용)
+        self.result_cache = result_cache
+        # 내용 해시별 매칭 목록 (바이트가 같은 파일은 한 번만 검색, 사용하지 않으면 None)
+        self.dedupe = dedupe
+        # 프로세스 워커의 중복 내용 테이블을 검색마다 구분하는 토큰
+        self.dedupe_token = (os.getpid(), time.monotonic_ns()) if dedupe is not None else None
 
 
 class SearchEngine:
     """Java 프로젝트 검색 엔진 (최적화된 버전)"""
     
-    def __init__(self, max_workers: int = None):
+    def __init__(self, max_workers: int = None, index_dir: str = None, backend: str = BACKEND_THREAD,
+                 listing_dir: str = None, result_cache_dir: str = None):
         self.is_searching = False
         self.search_thread = None
         self.cancel_search = False
         # CPU 코어 수에 따른 최적 워커 수 설정
         self.max_workers = max_workers or min(8, (os.cpu_count() or 1) + 4)
+        # 검색 백엔드 (프로세스 풀은 검색 간에 재사용)
+        self.backend = BACKEND_THREAD
+        self.set_backend(backend)
+        self.process_workers = os.cpu_count() or 1
+        self._process_pool = None
         # 정규식 패턴 캐시
         self.pattern_cache = {}
         self.cache_size_limit = 100
+        # 검색 디렉토리별 트라이그램 인덱스
+        self.index_dir = index_dir
+        self.indexes: Dict[str, TrigramIndex] = {}
+        # 검색 디렉토리/확장자/제외 패턴별 디렉토리 목록 캐시 (mtime이 바뀐 디렉토리만 다시 읽음)
+        self.listing_dir = listing_dir
+        self.listing_caches: Dict[tuple, DirectoryListingCache] = {}
+        self.use_listing_cache = True
+        # 검색 조건/파일 지문별 결과 캐시 (바뀐 파일만 다시 검색)
+        self.result_cache = ResultCache(result_cache_dir)
+        self.use_result_cache = True
+        # 바이너리로 판별된 파일 캐시 (검색 간에 유지)
+        self.binary_cache = BinaryCache()
+        # 정규식 필수 리터럴 사전 필터 사용 여부
+        self.use_prefilter = True
+        # Excel 행 제한을 넘는 내보내기의 분할 방식과 마지막 내보내기로 저장한 파일 목록
+        self.export_split = EXPORT_SPLIT_FILE
+        self.last_export_files: List[str] = []
+        # 마지막 검색 통계
+        self.last_search_stats: Dict[str, Any] = {}
+        self._stats_lock = threading.Lock()
+        self._search_start_time = 0.0
     
     def _generate_unique_filename(self, base_path: str) -> str:
         """중복되지 않는 파일명 생성"""
+        return self._generate_unique_filenames(base_path, 1)[0]
+    
+    def _generate_unique_filenames(self, base_path: str, count: int) -> List[str]:
+        """중복되지 않는 파일명 count개 생성 (원래 이름, _1, _2 ... 순서로 없는 이름만 사용)"""
         path = Path(base_path)
+        filenames = []
         if not path.exists():
-            return base_path
+            filenames.append(base_path)
         
         # 파일명과 확장자 분리
         stem = path.stem
@@ -44,12 +146,13 @@ class SearchEngine:
         parent = path.parent
         
         counter = 1
-        while True:
+        while len(filenames) < count:
             new_filename = f"{stem}_{counter}{suffix}"
             new_path = parent / new_filename
             if not new_path.exists():
-                return str(new_path)
+                filenames.append(str(new_path))
             counter += 1
+        return filenames
     
     def _get_cached_pattern(self, keyword: str, flags: int) -> re.Pattern:
         """정규식 패턴을 캐시에서 가져오거나 컴파일"""
@@ -71,78 +174,186 @@ class SearchEngine:
         except re.error as e:
             raise ValueError(f"정규식 에러: {e}")
     
-    def _should_skip_file(self, file_path: Path, exclude_patterns: List[re.Pattern]) -> bool:
-        """파일이 제외 패턴에 해당하는지 빠르게 확인"""
-        file_str = str(file_path)
-        file_name = file_path.name
-        
-        for pattern in exclude_patterns:
-            if pattern.search(file_str) or pattern.search(file_name):
-                return True
-        return False
+    def _add_stat(self, key: str, value: int = 1):
+        """마지막 검색 통계 카운터 증가 (워커 스레드에서 호출)"""
+        with self._stats_lock:
+            self.last_search_stats[key] = self.last_search_stats.get(key, 0) + value
+    
+    def _get_index(self, search_path: Path) -> TrigramIndex:
+        """검색 디렉토리의 트라이그램 인덱스를 가져오거나 로드"""
+        root = os.path.abspath(search_path)
+        index = self.indexes.get(root)
+        if index is None:
+            index = TrigramIndex(root, self.index_dir)
+            self.indexes[root] = index
+        return index
     
-    def _search_single_file(self, file_path: Path, pattern: re.Pattern, 
-                           file_encoding: str) -> List[SearchResult]:
-        """단일 파일에서 검색 수행 (최적화된 버전)"""
-        results = []
+    def _get_listing_cache(self, search_path: Path, file_extensions: tuple,
+                           exclude_matcher: ExcludeMatcher) -> Optional[DirectoryListingCache]:
+        """검색 조건의 디렉토리 목록 캐시를 가져오거나 로드 (사용하지 않으면 None)"""
+        if not self.use_listing_cache:
+            return None
+        key = (os.path.abspath(search_path), tuple(sorted(file_extensions)), tuple(sorted(exclude_matcher.patterns)))
+        cache = self.listing_caches.get(key)
+        if cache is None:
+            cache = DirectoryListingCache(key[0], file_extensions, exclude_matcher.patterns, self.listing_dir)
+            self.listing_caches[key] = cache
+        return cache
+    
+    def _finish_listing(self, walker: FileWalker):
+        """탐색이 끝난 뒤 목록 캐시 통계 기록, 정리 및 저장"""
+        self.last_search_stats["listing_reused_dirs"] = walker.reused_dirs
+        self.last_search_stats["listing_relisted_dirs"] = walker.relisted_dirs
+        cache = walker.listing_cache
+        if cache is None:
+            return
+        # 전체 트리를 탐색한 경우에만 사라진 디렉토리 항목 정리
+        if walker.completed and not walker.depth_limited_dirs:
+            cache.prune()
+        cache.save()
+    
+    def _index_bit_sets(self, keyword: str, use_regex: bool, keywords: List[str] = None,
+                        flags: int = 0) -> List[List[int]]:
+        """인덱스 조회 비트 집합 목록 (하나라도 만족하면 후보, 빈 리스트면 축소 불가)"""
+        if keywords:
+            # 키워드가 많으면 파일마다 확인하는 비용이 커지므로 인덱스는 갱신만 수행
+            if len(keywords) > MAX_INDEX_KEYWORDS:
+                return []
+            bit_sets = [query_bits([kw]) for kw in keywords]
+        else:
+            bit_sets = [query_bits(self._required_literals(keyword, use_regex, flags))]
+        if not all(bit_sets):
+            return []
+        return bit_sets
+    
+    def _required_literals(self, keyword: str, use_regex: bool, flags: int = 0) -> List[str]:
+        """매칭되는 모든 줄에 반드시 포함되어야 하는 리터럴 목록"""
+        if not use_regex or not any(ch in REGEX_META_CHARS for ch in keyword):
+            return [keyword]
+        # 정규식은 파싱해서 반드시 매칭되어야 하는 리터럴 구간만 추출
+        return extract_required_literals(keyword, flags)
+    
+    def _search_single_file(self, file_path: str, ctx: ScanContext,
+                           stat: Optional[os.stat_result] = None) -> List[Match]:
+        """단일 파일에서 검색 수행 (최적화된 버전)
+
+        ctx.buffer_mode이면 파일 버퍼 전체에 패턴을 한 번만 실행하고, 매칭된 위치만 라인으로 변환합니다.
+        """
+        matches = []
         
         try:
-            # 파일을 한 번에 읽기 (메모리 효율적)
-            with open(file_path, "r", encoding=file_encoding, errors="ignore") as f:
-                # 모든 파일을 한 번에 읽기
-                content = f.read()
-                lines = content.splitlines()
-                
-                # 라인별 검색 (최적화된 버전)
-                for line_num, line in enumerate(lines, start=1):
-                    if self.cancel_search:
-                        break
+            # 인덱스가 최신이면 시그니처로 매칭 불가능한 파일을 읽지 않고 건너뜀
+            # (결과 캐시에 저장되지 않는 파일이므로 캐시 조회보다 먼저 확인해 캐시 미스로 세지 않음)
+            skip, stale_stat = self._check_index(file_path, ctx, stat)
+            if skip:
+                return matches
+            
+            # 결과 캐시에 같은 크기/mtime의 항목이 있으면 파일을 읽지 않음
+            if ctx.result_cache is not None:
+                stat = stat or stale_stat or os.stat(file_path)
+                cached = ctx.result_cache.lookup(str(file_path), stat, ctx.dedupe is not None)
+                if cached is not None:
+                    if ctx.dedupe is not None:
+                        ctx.dedupe.record(str(file_path), cached[1], cached[0])
+                    return cached[0]
+            
+            # 파일을 한 번에 읽어 매칭 (변경된 파일은 인덱스 시그니처도 함께 계산)
+            matches, signature, scan_stats = scan_file(str(file_path), ctx.pattern, ctx.file_encoding,
+                                                       ctx.buffer_mode, ctx.multiline,
+                                                       with_signature=stale_stat is not None,
+                                                       skip_binary=ctx.skip_binary, literal=ctx.literal,
+                                                       prefilter=ctx.prefilter, dedupe=ctx.dedupe)
+            self._add_scan_stats(scan_stats)
+            if matches is None:
+                self._record_binary(str(file_path), stat or os.stat(file_path))
+                return []
+            if signature is not None:
+                self._store_signature(ctx, str(file_path), stale_stat, signature)
+            if ctx.result_cache is not None:
+                ctx.result_cache.store(str(file_path), stat, matches, self._content_digest(ctx, str(file_path)))
                     
-                    # 정규식 매칭
-                    matches = pattern.finditer(line)
-                    for match in matches:
-                        result = SearchResult(
-                            file_path=str(file_path),
-                            file_name=file_path.name,
-                            line_number=line_num,
-                            content=line.strip(),
-                            match_text=match.group()
-                        )
-                        results.append(result)
-                        
         except Exception as e:
             # 파일 읽기 오류는 무시하고 계속 진행
             print(f"파일 읽기 오류: {file_path} ({e})")
         
-        return results
+        return matches
     
-    def _collect_target_files_optimized(self, search_path: Path, file_extensions: tuple,
-                                      exclude_patterns: List[re.Pattern]) -> List[Path]:
-        """대상 파일 목록을 효율적으로 수집"""
-        target_files = []
+    def _content_digest(self, ctx: ScanContext, file_path: str) -> Optional[bytes]:
+        """중복 내용 검색에서 기록된 파일의 내용 해시 (사용하지 않거나 읽지 않은 파일이면 None)"""
+        return ctx.dedupe.digest_of(file_path) if ctx.dedupe is not None else None
+    
+    def _check_index(self, file_path: str, ctx: ScanContext,
+                     stat: Optional[os.stat_result] = None) -> Tuple[bool, Optional[os.stat_result]]:
+        """인덱스로 파일을 건너뛸 수 있는지 확인
+
+        Returns:
+            (건너뛰기 여부, 시그니처 갱신이 필요하면 파일 stat 아니면 None)
+        """
+        if ctx.index is None:
+            return False, None
         
-        # 파일 확장자 세트로 변환 (검색 속도 향상)
-        ext_set = set(file_extensions)
+        if stat is None:
+            stat = os.stat(file_path)
+        signature = ctx.index.lookup(str(file_path), stat.st_mtime_ns, stat.st_size)
+        if signature is None:
+            return False, stat
+        if ctx.index_bit_sets and not any(ctx.index.may_contain(signature, bits) for bits in ctx.index_bit_sets):
+            self._add_stat("index_skipped_files")
+            return True, None
+        return False, None
+    
+    def _add_scan_stats(self, scan_stats: ScanStats):
+        """검색한 바이트, 디코딩한 바이트 수와 사전 필터로 제외한 파일 수 기록"""
+        scanned_bytes, decoded_bytes, prefiltered_files = scan_stats
+        with self._stats_lock:
+            stats = self.last_search_stats
+            stats["bytes_scanned"] = stats.get("bytes_scanned", 0) + scanned_bytes
+            stats["bytes_decoded"] = stats.get("bytes_decoded", 0) + decoded_bytes
+            stats["prefilter_skipped_files"] = stats.get("prefilter_skipped_files", 0) + prefiltered_files
+    
+    def _record_binary(self, file_path: str, stat: os.stat_result):
+        """바이너리로 판별된 파일을 캐시하고 읽지 않은 바이트 수를 기록"""
+        self.binary_cache.add(file_path, stat.st_mtime_ns)
+        self._add_stat("binary_skipped_files")
+        self._add_stat("binary_skipped_bytes", max(0, stat.st_size - SNIFF_BYTES))
+    
+    def _store_signature(self, ctx: ScanContext, file_path: str, stat: os.stat_result, signature: bytes):
+        """새로 계산한 시그니처를 인덱스에 반영"""
+        ctx.index.store(file_path, stat.st_mtime_ns, stat.st_size, signature)
+        self._add_stat("index_refreshed_files")
+    
+    def _collect_target_files_optimized(self, search_path: Path, file_extensions: tuple,
+                                      exclude_matcher: ExcludeMatcher) -> List[str]:
+        """대상 파일 목록을 효율적으로 수집 (디렉토리 목록 캐시 사용)"""
+        listing_cache = self._get_listing_cache(search_path, file_extensions, exclude_matcher)
+        walker = FileWalker(file_extensions, exclude_matcher, lambda: self.cancel_search, listing_cache=listing_cache)
+        file_paths = [file_path for file_path, _ in walker.walk(str(search_path))]
+        self._finish_listing(walker)
+        return file_paths
+    
+    def _discover_files(self, search_path: Path, walker: FileWalker, scheduler: FileScheduler,
+                        seen_files: List[str], ctx: ScanContext, max_file_size: Optional[int] = None):
+        """디렉토리 탐색 스레드: 발견한 파일을 바로 스케줄러 큐에 넣음
         
-        for root, dirs, files in os.walk(search_path):
-            if self.cancel_search:
-                break
-            
-            # 디렉토리 제외 패턴 체크 (최적화)
-            dirs[:] = [d for d in dirs if not self._should_skip_file(Path(root) / d, exclude_patterns)]
-            
-            # 파일 필터링 및 수집
-            for file in files:
-                if not file.endswith(file_extensions):
+        크기 제한을 넘는 파일과 이전에 바이너리로 판별된 파일은 읽지 않고 여기서 걸러냅니다.
+        """
+        try:
+            for file_path, stat in walker.walk(str(search_path)):
+                seen_files.append(file_path)
+                if max_file_size and stat.st_size > max_file_size:
+                    self._add_stat("large_skipped_files")
+                    self._add_stat("large_skipped_bytes", stat.st_size)
                     continue
-                
-                file_path = Path(root) / file
-                
-                # 제외 패턴 체크
-                if not self._should_skip_file(file_path, exclude_patterns):
-                    target_files.append(file_path)
-        
-        return target_files
+                if ctx.skip_binary and self.binary_cache.is_binary(file_path, stat.st_mtime_ns):
+                    self._add_stat("binary_skipped_files")
+                    self._add_stat("binary_skipped_bytes", stat.st_size)
+                    continue
+                if not scheduler.add(file_path, stat):
+                    break
+        except Exception as e:
+            print(f"디렉토리 탐색 오류: {e}")
+        finally:
+            scheduler.close()
     
     def search(self, 
                search_dir: str,
@@ -153,8 +364,18 @@ class SearchEngine:
                file_extensions: tuple = (".java", ".xml", ".properties"),
                exclude_patterns: List[str] = None,
                file_encoding: str = "utf-8",
+               use_index: bool = True,
+               multiline: bool = False,
+               keywords: List[str] = None,
+               result_store: ResultStore = None,
+               max_results: Optional[int] = None,
+               max_depth: Optional[int] = None,
+               include_binary: bool = False,
+               max_file_size: Optional[int] = DEFAULT_MAX_FILE_SIZE_MB * 1024 * 1024,
+               dedupe_content: bool = False,
                progress_callback: Callable[[int, int, str], None] = None,
-               result_callback: Callable[[List[SearchResult]], None] = None) -> List[SearchResult]:
+               result_callback: Callable[[List[ResultRow]], None] = None,
+               file_callback: Callable[[List[FileSummary]], None] = None) -> ResultStore:
         """
         파일 검색을 수행합니다. (최적화된 버전)
         
@@ -165,32 +386,63 @@ class SearchEngine:
             case_sensitive: 대소문자 구분 여부
             whole_word: 단어 단위 검색 여부
             file_extensions: 검색할 파일 확장자 튜플
-            exclude_patterns: 제외할 파일/폴더 패턴 리스트
+            exclude_patterns: 제외할 파일/폴더 glob 패턴 리스트 (예: */target/*, *.min.js)
             file_encoding: 파일 인코딩
+            use_index: 트라이그램 인덱스로 후보 파일 축소 여부
+            multiline: 여러 줄에 걸친 매칭 허용 여부 (MULTILINE | DOTALL)
+            keywords: 다중 키워드 목록 (지정하면 keyword 대신 모든 키워드를 리터럴로 한 번에 검색)
+            result_store: 결과를 추가할 저장소 (없으면 새로 생성)
+            max_results: 최대 결과 수 (도달하면 탐색과 검색을 바로 중단, None이면 제한 없음)
+            max_depth: 검색 디렉토리 기준 최대 하위 디렉토리 깊이 (0이면 검색 디렉토리만, None이면 제한 없음)
+            include_binary: 바이너리 파일도 검색할지 여부 (False면 앞부분을 읽어 판별 후 건너뜀)
+            max_file_size: 검색할 최대 파일 크기 (바이트, None/0이면 제한 없음)
+            dedupe_content: 파일 내용 해시로 바이트가 같은 파일은 한 번만 검색하고 매칭을 모든 경로에 복사할지 여부
             progress_callback: 진행률 콜백 함수 (current, total, current_file)
-            result_callback: 결과 콜백 함수 (results)
+            result_callback: 결과 콜백 함수 (이번 배치에서 추가된 결과 행 뷰 목록)
+            file_callback: 파일 콜백 함수 (이번 배치에서 검색이 끝난 매칭 파일의 요약 목록)
             
         Returns:
-            검색 결과 리스트
+            검색 결과 저장소 (ResultRow 뷰의 시퀀스)
         """
         start_time = time.time()
+        self._search_start_time = start_time
         search_path = Path(search_dir)
         
         # 경로 검증
         if not search_path.exists() or not search_path.is_dir():
             raise ValueError(f"경로 {search_dir} 가 존재하지 않습니다.")
         
-        if not keyword.strip():
+        # 다중 키워드는 항상 리터럴로 처리
+        if keywords:
+            keywords = normalize_keywords(keywords, case_sensitive)
+            use_regex = False
+        
+        if not keywords and not keyword.strip():
             raise ValueError("검색할 키워드를 입력해주세요.")
         
-        results = []
+        if max_results is not None and max_results <= 0:
+            raise ValueError("최대 결과 수는 1 이상이어야 합니다.")
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("검색 깊이는 0 이상이어야 합니다.")
+        
+        results = result_store if result_store is not None else ResultStore()
         self.cancel_search = False
+        self.last_search_stats = {}
         
         # 대소문자 옵션
         flags = 0 if case_sensitive else re.IGNORECASE
         
+        # 버퍼 단위 검색에서는 ^, $가 각 라인 경계에 매칭되어야 함
+        buffer_mode = multiline or not (use_regex and requires_line_mode(keyword))
+        if buffer_mode:
+            flags |= re.MULTILINE
+        if multiline:
+            flags |= re.DOTALL
+        
         # 패턴 준비 (캐시 사용)
-        if use_regex:
+        if keywords:
+            pattern = self._get_cached_pattern(build_keyword_pattern(keywords, whole_word), flags)
+        elif use_regex:
             pattern = self._get_cached_pattern(keyword, flags)
         else:
             if whole_word:
@@ -198,77 +450,302 @@ class SearchEngine:
             else:
                 pattern = self._get_cached_pattern(re.escape(keyword), flags)
         
-        # 제외 패턴 컴파일 (최적화)
-        exclude_compiled = []
-        if exclude_patterns:
-            for exclude_pattern in exclude_patterns:
-                if exclude_pattern.strip():
-                    try:
-                        exclude_compiled.append(re.compile(exclude_pattern, re.IGNORECASE))
-                    except re.error:
-                        # 정규식이 아닌 경우 일반 문자열로 처리
-                        exclude_compiled.append(re.compile(re.escape(exclude_pattern), re.IGNORECASE))
-        
-        # 대상 파일 목록 수집 (최적화)
-        target_files = self._collect_target_files_optimized(search_path, file_extensions, exclude_compiled)
-        total_files = len(target_files)
-        
-        if total_files == 0:
-            return results
-        
-        # 병렬 처리를 위한 청크 분할
-        chunk_size = max(1, total_files // self.max_workers)
-        file_chunks = [target_files[i:i + chunk_size] for i in range(0, total_files, chunk_size)]
-        
-        # 병렬 검색 실행
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 각 청크를 병렬로 처리
-            future_to_chunk = {
-                executor.submit(self._process_file_chunk, chunk, pattern, file_encoding, 
-                              progress_callback, total_files): chunk 
-                for chunk in file_chunks
-            }
+        # 제외 패턴 컴파일 (glob 패턴을 하나의 매처로 결합)
+        exclude_matcher = ExcludeMatcher(exclude_patterns)
+        
+        # 트라이그램 인덱스 준비 (필수 리터럴이 없으면 갱신만 수행)
+        # 시그니처는 파일 바이트의 ASCII 트라이그램이므로 UTF-16 등 ASCII 호환이 아닌 인코딩에서는 사용하지 않음
+        if codec_name(file_encoding) not in ASCII_COMPATIBLE_ENCODINGS:
+            use_index = False
+        index = self._get_index(search_path) if use_index else None
+        index_bit_sets = self._index_bit_sets(keyword, use_regex, keywords, flags) if index is not None else []
+        # 정규식을 쓰지 않는 단일 키워드는 find 기반 리터럴 검색 (처리할 수 없는 파일은 정규식으로 대체)
+        literal = LiteralSearcher(keyword, case_sensitive, whole_word) if not use_regex and not keywords else None
+        # 정규식은 필수 리터럴을 추출해 없는 파일을 먼저 제외 (추출할 수 없으면 정규식만 사용)
+        prefilter = None
+        if use_regex and not keywords and self.use_prefilter:
+            prefilter = RequiredLiteralFilter.from_pattern(keyword, pattern.flags)
+        skip_binary = not include_binary
+        result_cache = None
+        if self.use_result_cache:
+            result_cache = self.result_cache.open_segment(
+                (pattern.pattern, pattern.flags, file_encoding, buffer_mode, multiline, skip_binary))
+        ctx = ScanContext(pattern, file_encoding, buffer_mode, multiline, index, index_bit_sets, max_results,
+                          skip_binary=skip_binary, literal=literal, prefilter=prefilter, result_cache=result_cache,
+                          dedupe=ContentDedupe() if dedupe_content else None)
+        self.last_search_stats["literal_fast_path"] = literal is not None
+        self.last_search_stats["prefilter_used"] = prefilter is not None
+        self.last_search_stats["prefilter_literals"] = prefilter.literals if prefilter is not None else []
+        self.last_search_stats["prefilter_skipped_files"] = 0
+        if keywords:
+            results.set_keyword_lookup(build_keyword_lookup(keywords, case_sensitive), case_sensitive)
+            self.last_search_stats["keyword_count"] = len(keywords)
+        
+        # 디렉토리 탐색과 검색을 동시에 진행 (탐색 스레드 → 크기 기반 배치 큐 → 검색 워커)
+        workers = self.process_workers if self.backend == BACKEND_PROCESS else self.max_workers
+        scheduler = FileScheduler(workers)
+        listing_cache = self._get_listing_cache(search_path, file_extensions, exclude_matcher)
+        walker = FileWalker(file_extensions, exclude_matcher, lambda: self.cancel_search or ctx.stopped, max_depth,
+                            listing_cache)
+        seen_files = []
+        walker_thread = threading.Thread(
+            target=self._discover_files,
+            args=(search_path, walker, scheduler, seen_files, ctx, max_file_size),
+            daemon=True
+        )
+        walker_thread.start()
+        
+        try:
+            if self.backend == BACKEND_PROCESS:
+                files_done = self._dispatch_batches(self._get_process_pool(), self._submit_process_batch,
+                                       scheduler, ctx, workers, results, progress_callback, result_callback,
+                                       file_callback)
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    files_done = self._dispatch_batches(executor, self._submit_thread_batch,
+                                           scheduler, ctx, workers, results, progress_callback, result_callback,
+                                           file_callback)
+        finally:
+            scheduler.cancel()
+            walker_thread.join()
+        
+        total_files = scheduler.discovered
+        self.last_search_stats["files_total"] = total_files
+        self.last_search_stats["total_bytes"] = scheduler.total_bytes
+        self.last_search_stats["visited_dirs"] = walker.visited_dirs
+        self.last_search_stats["pruned_dirs"] = walker.pruned_dirs
+        self.last_search_stats["excluded_files"] = walker.excluded_files
+        self.last_search_stats["depth_limited_dirs"] = walker.depth_limited_dirs
+        self._finish_listing(walker)
+        
+        # 최대 결과 수로 일찍 끝난 경우 (발견했지만 결과에 반영되지 않은 파일 수)
+        results.truncated = ctx.stopped
+        results.unscanned_files = total_files - files_done if ctx.stopped else 0
+        self.last_search_stats["truncated"] = results.truncated
+        self.last_search_stats["unscanned_files"] = results.unscanned_files
+        
+        # 인덱스/결과 캐시 정리 및 저장 (전체 트리를 탐색한 경우에만 사라진 파일 정리)
+        walked_all = not (ctx.stopped or self.cancel_search or walker.depth_limited_dirs)
+        if index is not None:
+            if walked_all:
+                index.prune(set(seen_files))
+            index.save()
+        if result_cache is not None:
+            self.result_cache.close_segment(result_cache, seen_files if walked_all else None)
+            self.last_search_stats["result_cache_hits"] = result_cache.hits
+            self.last_search_stats["result_cache_misses"] = result_cache.misses
+            self.last_search_stats["result_cache_hit_rate"] = result_cache.hit_rate
+        if ctx.dedupe is not None:
+            self.last_search_stats["duplicate_skipped_files"] = ctx.dedupe.duplicate_files
+            self.last_search_stats["duplicate_skipped_bytes"] = ctx.dedupe.duplicate_bytes
+        
+        # 성능 통계
+        elapsed_time = time.time() - start_time
+        self.last_search_stats["elapsed_time"] = elapsed_time
+        self.last_search_stats["result_count"] = len(results)
+        # 결과 저장소 메모리 (매칭 1건당 바이트)
+        result_memory = results.memory_usage()
+        self.last_search_stats["result_memory_bytes"] = result_memory
+        self.last_search_stats["bytes_per_result"] = result_memory / len(results) if results else 0
+        print(f"검색 완료: {len(results)}건, {total_files}개 파일, {elapsed_time:.2f}초")
+        
+        return results
+    
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """검색 간에 재사용하는 프로세스 풀 (최초 사용 시 생성)"""
+        if self._process_pool is None:
+            # GUI/검색 스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용
+            self._process_pool = ProcessPoolExecutor(max_workers=self.process_workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+        return self._process_pool
+    
+    def _dispatch_batches(self, executor, submit_batch, scheduler: FileScheduler, ctx: ScanContext,
+                          workers: int, results: ResultStore, progress_callback, result_callback,
+                          file_callback=None):
+        """스케줄러에서 배치를 필요할 때마다 꺼내 실행기에 제출하고, 끝난 배치부터 결과를 전달
+        
+        실행 중인 배치를 워커 수의 두 배로 유지하여 워커가 쉬지 않도록 하고,
+        배치가 완료되는 즉시 결과 저장소에 추가한 뒤 result_callback으로 추가된 행을,
+        file_callback으로 매칭이 있는 파일의 요약을 보냅니다.
+        결과 저장소에는 이 스레드만 추가합니다.
+        탐색이 진행 중이면 progress_callback의 total은 지금까지 발견한 파일 수입니다.
+        최대 결과 수에 도달하면 ctx.stopped를 세우고 남은 배치를 취소합니다.
+        
+        Returns:
+            결과가 반영된 파일 수
+        """
+        in_flight = {}
+        files_done = 0
+        max_in_flight = workers * 2
+        aborted = False
+        last_file = ""
+        last_report = (-1, -1)
+        
+        def report_progress():
+            nonlocal last_report
+            if progress_callback and (files_done, scheduler.discovered) != last_report:
+                last_report = (files_done, scheduler.discovered)
+                progress_callback(files_done, scheduler.discovered, last_file)
+        
+        while True:
+            # 빈 자리만큼 다음 배치 제출
+            while not self.cancel_search and len(in_flight) < max_in_flight:
+                batch = scheduler.next_batch()
+                if not batch:
+                    break
+                submitted = submit_batch(executor, batch, ctx)
+                if submitted is None:
+                    # 인덱스로 배치 전체를 건너뜀
+                    files_done += len(batch)
+                    continue
+                in_flight[submitted[0]] = (batch, submitted[1])
             
-            for future in as_completed(future_to_chunk):
-                if self.cancel_search:
+            if not in_flight:
+                if scheduler.exhausted or self.cancel_search:
                     break
-                
+                # 탐색기가 다음 파일을 찾을 때까지 대기
+                scheduler.wait_for_files(DISCOVERY_POLL_INTERVAL)
+                report_progress()
+                continue
+            
+            # 빈 자리가 있고 탐색 중이면 새 파일을 가져갈 수 있도록 짧게 대기
+            timeout = None if scheduler.closed or len(in_flight) >= max_in_flight else DISCOVERY_POLL_INTERVAL
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                report_progress()
+                continue
+            
+            for future in done:
+                batch, convert = in_flight.pop(future)
+                files_done += len(batch)
+                last_file = str(batch[-1][0])
                 try:
-                    chunk_results = future.result()
-                    results.extend(chunk_results)
-                    
-                    # 실시간 결과 업데이트
-                    if result_callback and chunk_results:
-                        result_callback(chunk_results)
-                        
+                    file_matches = convert(future.result())
+                except BrokenProcessPool as e:
+                    # 워커가 비정상 종료되면 다음 검색에서 풀을 새로 생성
+                    print(f"프로세스 풀 오류: {e}")
+                    self._process_pool = None
+                    aborted = True
+                    break
                 except Exception as e:
-                    print(f"청크 처리 오류: {e}")
+                    print(f"배치 처리 오류: {e}")
                     continue
+                
+                start = len(results)
+                file_rows = []
+                for file_path, matches in file_matches:
+                    if ctx.max_results is not None:
+                        remaining = ctx.max_results - len(results)
+                        if len(matches) >= remaining:
+                            matches = matches[:remaining]
+                            ctx.stopped = True
+                    first_row = len(results)
+                    if results.add_file_matches(file_path, matches, self._content_digest(ctx, file_path)):
+                        file_rows.append(first_row)
+                    if ctx.stopped:
+                        break
+                report_progress()
+                
+                # 실시간 결과 업데이트 (배치 완료 즉시)
+                if len(results) > start:
+                    if "first_result_time" not in self.last_search_stats:
+                        self.last_search_stats["first_result_time"] = time.time() - self._search_start_time
+                    if result_callback:
+                        result_callback(results.rows(start))
+                    if file_callback:
+                        file_callback([results.file_summary(results.file_id(row)) for row in file_rows])
+                
+                # 최대 결과 수에 도달하면 함께 끝난 나머지 배치는 반영하지 않음
+                if ctx.stopped:
+                    break
+            
+            if self.cancel_search or aborted or ctx.stopped:
+                scheduler.cancel()
+                for pending in in_flight:
+                    pending.cancel()
+                break
         
-        # 성능 통계
-        elapsed_time = time.time() - start_time
-        print(f"검색 완료: {len(results)}건, {total_files}개 파일, {elapsed_time:.2f}초")
+        report_progress()
+        return files_done
+    
+    def _submit_thread_batch(self, executor, batch: List[ScheduledFile], ctx: ScanContext):
+        """스레드 풀에 배치 제출 (인덱스 확인은 워커 스레드에서 수행)"""
+        return executor.submit(self._process_file_chunk, batch, ctx), lambda file_matches: file_matches
+    
+    def _submit_process_batch(self, executor, batch: List[ScheduledFile], ctx: ScanContext):
+        """프로세스 풀에 배치 제출 (정규식 매칭이 GIL에 묶이지 않음)
         
-        return results
+        결과 캐시와 인덱스 확인은 메인 프로세스에서 하고, 워커에는 파일 경로 배치와 패턴 소스/플래그만 전달합니다.
+        배치 전체가 캐시에 있으면 이미 완료된 Future를 반환합니다.
+        """
+        items = []
+        file_stats = {}
+        found = {}
+        for file_path, stat in batch:
+            # 인덱스로 건너뛰는 파일은 결과 캐시에 저장되지 않으므로 캐시 조회보다 먼저 확인
+            skip, stale_stat = self._check_index(file_path, ctx, stat)
+            if skip:
+                continue
+            if ctx.result_cache is not None:
+                cached = ctx.result_cache.lookup(str(file_path), stat, ctx.dedupe is not None)
+                if cached is not None:
+                    found[str(file_path)] = cached[0]
+                    if ctx.dedupe is not None:
+                        ctx.dedupe.record(str(file_path), cached[1], cached[0])
+                    continue
+            file_stats[str(file_path)] = stat
+            items.append((str(file_path), stale_stat is not None))
+        
+        if not items and not found:
+            return None
+        
+        def convert(batch_output) -> List[FileMatches]:
+            batch_results, scan_stats, duplicate_stats = batch_output
+            self._add_scan_stats(scan_stats)
+            if ctx.dedupe is not None:
+                ctx.dedupe.add_duplicates(*duplicate_stats)
+            for file_path, matches, signature, digest in batch_results:
+                if matches is None:
+                    self._record_binary(file_path, file_stats[file_path])
+                    continue
+                if signature is not None:
+                    self._store_signature(ctx, file_path, file_stats[file_path], signature)
+                if digest is not None:
+                    ctx.dedupe.record(file_path, digest)
+                if ctx.result_cache is not None:
+                    ctx.result_cache.store(file_path, file_stats[file_path], matches, digest)
+                found[file_path] = matches
+            # 캐시에서 가져온 파일과 새로 검색한 파일을 배치 순서대로 반환
+            return [(str(file_path), found[str(file_path)]) for file_path, _ in batch if found.get(str(file_path))]
+        
+        if not items:
+            future = Future()
+            future.set_result(([], (0, 0, 0), (0, 0)))
+            return future, convert
+        future = executor.submit(scan_file_batch, items, ctx.pattern.pattern, ctx.pattern.flags,
+                                 ctx.file_encoding, ctx.buffer_mode, ctx.multiline, ctx.skip_binary, ctx.literal,
+                                 ctx.prefilter, ctx.dedupe_token, ctx.result_cache is not None)
+        return future, convert
     
-    def _process_file_chunk(self, file_chunk: List[Path], pattern: re.Pattern, 
-                           file_encoding: str, progress_callback, total_files: int) -> List[SearchResult]:
-        """파일 청크를 처리하는 워커 함수"""
+    def _process_file_chunk(self, file_chunk: List[ScheduledFile], ctx: ScanContext) -> List[FileMatches]:
+        """파일 배치를 처리하는 워커 함수 (매칭이 있는 파일만 반환)"""
         chunk_results = []
         
-        for file_path in file_chunk:
-            if self.cancel_search:
+        for file_path, stat in file_chunk:
+            if self.cancel_search or ctx.stopped:
                 break
             
-            if progress_callback:
-                progress_callback(len(chunk_results), total_files, str(file_path))
-            
             # 단일 파일 검색
-            file_results = self._search_single_file(file_path, pattern, file_encoding)
-            chunk_results.extend(file_results)
+            matches = self._search_single_file(file_path, ctx, stat)
+            if matches:
+                chunk_results.append((str(file_path), matches))
         
         return chunk_results
     
+    def search_keywords(self, search_dir: str, keywords: List[str], **kwargs) -> ResultStore:
+        """키워드 목록을 한 번의 파일 스캔으로 검색합니다. (각 결과의 keyword에 매칭된 키워드 기록)"""
+        return self.search(search_dir, "", keywords=keywords, **kwargs)
+    
     def search_async(self, *args, **kwargs):
         """비동기 검색 실행 (최적화된 버전)"""
         if self.is_searching:
@@ -300,8 +777,14 @@ class SearchEngine:
             self.search_thread.join(timeout=1.0)
         self.is_searching = False
     
-    def export_to_excel(self, results: List[SearchResult], output_file: str) -> bool:
-        """검색 결과를 Excel 파일로 내보내기 (최적화된 버전)"""
+    def export_to_excel(self, results: Sequence[SearchResult], output_file: str,
+                        progress_callback: Optional[ExportProgressCallback] = None) -> bool:
+        """검색 결과를 Excel 파일로 내보내기 (openpyxl 쓰기 전용 모드로 스트리밍 저장)
+        
+        시트 행 제한(1,048,576행)을 넘으면 export_split에 따라 번호 붙은 통합 문서나 여러 시트로 나누며,
+        통합 문서가 여러 개면 프로세스 풀에서 동시에 저장합니다. 저장한 파일은 last_export_files에 기록합니다.
+        """
+        self.last_export_files = []
         try:
             if not results:
                 print("내보낼 검색 결과가 없습니다.")
@@ -309,71 +792,68 @@ class SearchEngine:
             
             print(f"Excel 내보내기 시작: {len(results)}건의 결과를 {output_file}에 저장")
             
-            # 중복되지 않는 파일명 생성
-            unique_output_file = self._generate_unique_filename(output_file)
-            
-            # 메모리 효율적인 데이터 변환 (청크 단위로 처리)
-            chunk_size = 1000  # 한 번에 처리할 행 수
-            total_rows = len(results)
+            # 행 제한에 맞춰 분할하고, 분할된 통합 문서마다 중복되지 않는 파일명 생성
+            shards = plan_excel_shards(len(results), self.export_split)
+            output_files = self._generate_unique_filenames(output_file, len(shards))
+            unique_output_file = output_files[0]
+            if len(shards) > 1:
+                print(f"Excel 행 제한을 넘어 {len(shards)}개 통합 문서로 나누어 저장합니다.")
             
-            print(f"데이터 변환 시작: 총 {total_rows}행을 {chunk_size}행씩 처리")
+            # 결과 저장소에서 한 행씩 바로 파일로 기록 (DataFrame/전체 행 목록을 만들지 않음)
+            written = write_excel(results, output_files, shards, progress_callback, workers=self.process_workers)
+            self.last_export_files = output_files
             
-            # 청크 단위로 데이터 처리하여 메모리 사용량 최적화
-            all_data = []
-            for i in range(0, total_rows, chunk_size):
-                chunk_end = min(i + chunk_size, total_rows)
-                chunk_results = results[i:chunk_end]
-                
-                # 청크 데이터 변환
-                chunk_data = [
-                    [result.file_path, result.file_name, result.line_number, 
-                     result.content[:500], result.match_text]  # 내용 길이 제한으로 메모리 절약
-                    for result in chunk_results
-                ]
-                all_data.extend(chunk_data)
-                
-                print(f"청크 처리 완료: {i+1}~{chunk_end}/{total_rows}")
-                
-                # 메모리 정리
-                del chunk_data
-                del chunk_results
+            print(f"Excel 파일 저장 완료: {', '.join(output_files)} ({written}행)")
             
-            print(f"데이터 변환 완료: {len(all_data)}행")
-            
-            # DataFrame 생성 (메모리 효율적)
-            df = pd.DataFrame(all_data, columns=["File Path", "File Name", "Line", "Content", "Match"])
+            # 실제 저장된 파일 경로 반환을 위해 output_file 업데이트
+            if unique_output_file != output_file:
+                print(f"파일명이 중복되어 자동으로 변경되었습니다: {Path(output_file).name} → {Path(unique_output_file).name}")
             
-            print(f"DataFrame 생성 완료: {df.shape}")
+            return True
             
-            # 메모리 정리
-            del all_data
+        except ImportError as e:
+            print(f"필요한 패키지가 설치되지 않았습니다: {e}")
+            print("openpyxl을 설치해주세요: pip install openpyxl")
+            return False
+        except MemoryError as e:
+            print(f"메모리 부족 오류: {e}")
+            print("검색 결과가 너무 많습니다. 더 작은 단위로 나누어 내보내기를 시도해주세요.")
+            return False
+        except Exception as e:
+            print(f"Excel 내보내기 오류: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    def export_results(self, results: Sequence[SearchResult], output_file: str,
+                       progress_callback: Optional[ExportProgressCallback] = None,
+                       export_format: Optional[str] = None) -> bool:
+        """검색 결과를 형식별로 내보내기 (export_format이 없으면 출력 파일 확장자로 결정)
+        
+        .xlsx는 export_to_excel로, .csv/.jsonl/.parquet은 결과를 한 행씩 바로 파일로 씁니다.
+        """
+        self.last_export_files = []
+        try:
+            export_format = export_format or export_format_for(output_file)
+            if export_format == EXPORT_FORMAT_EXCEL:
+                return self.export_to_excel(results, output_file, progress_callback)
+            writer = EXPORT_WRITERS.get(export_format)
+            if writer is None:
+                raise ValueError(f"지원하지 않는 내보내기 형식입니다: {export_format}")
             
-            # Excel 파일로 저장 (메모리 효율적)
-            with pd.ExcelWriter(unique_output_file, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Search Results')
-                
-                # 워크시트 최적화
-                worksheet = writer.sheets['Search Results']
-                
-                # 컬럼 너비 자동 조정
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)  # 최대 50자로 제한
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+            if not results:
+                print("내보낼 검색 결과가 없습니다.")
+                return False
             
-            print(f"Excel 파일 저장 완료: {unique_output_file}")
+            label = EXPORT_FORMAT_LABELS[export_format]
+            print(f"{label} 내보내기 시작: {len(results)}건의 결과를 {output_file}에 저장")
             
-            # DataFrame 메모리 정리
-            del df
+            # 중복되지 않는 파일명 생성
+            unique_output_file = self._generate_unique_filename(output_file)
+            written = writer(results, unique_output_file, progress_callback)
+            self.last_export_files = [unique_output_file]
             
-            # 실제 저장된 파일 경로 반환을 위해 output_file 업데이트
+            print(f"{label} 파일 저장 완료: {unique_output_file} ({written}행)")
             if unique_output_file != output_file:
                 print(f"파일명이 중복되어 자동으로 변경되었습니다: {Path(output_file).name} → {Path(unique_output_file).name}")
             
@@ -381,31 +861,130 @@ class SearchEngine:
             
         except ImportError as e:
             print(f"필요한 패키지가 설치되지 않았습니다: {e}")
-            print("pandas와 openpyxl을 설치해주세요: pip install pandas openpyxl")
+            print("Parquet 내보내기에는 pyarrow가 필요합니다: pip install pyarrow")
             return False
-        except MemoryError as e:
-            print(f"메모리 부족 오류: {e}")
-            print("검색 결과가 너무 많습니다. 더 작은 단위로 나누어 내보내기를 시도해주세요.")
+        except ValueError as e:
+            print(f"내보내기 오류: {e}")
             return False
         except Exception as e:
-            print(f"Excel 내보내기 오류: {e}")
+            print(f"내보내기 오류: {e}")
             import traceback
             traceback.print_exc()
             return False
     
+    def export_to_csv(self, results: Sequence[SearchResult], output_file: str,
+                      progress_callback: Optional[ExportProgressCallback] = None) -> bool:
+        """검색 결과를 CSV(UTF-8) 파일로 내보내기"""
+        return self.export_results(results, output_file, progress_callback, EXPORT_FORMAT_CSV)
+    
+    def export_to_jsonl(self, results: Sequence[SearchResult], output_file: str,
+                        progress_callback: Optional[ExportProgressCallback] = None) -> bool:
+        """검색 결과를 JSON Lines 파일로 내보내기"""
+        return self.export_results(results, output_file, progress_callback, EXPORT_FORMAT_JSONL)
+    
+    def export_to_parquet(self, results: Sequence[SearchResult], output_file: str,
+                          progress_callback: Optional[ExportProgressCallback] = None) -> bool:
+        """검색 결과를 Parquet 파일로 내보내기 (pyarrow 필요)"""
+        return self.export_results(results, output_file, progress_callback, EXPORT_FORMAT_PARQUET)
+    
+    def preload(self, search_dir: str, file_extensions: tuple = (".java", ".xml", ".properties"),
+                exclude_patterns: List[str] = None, use_index: bool = True) -> int:
+        """검색 디렉토리의 인덱스와 디렉토리 목록 캐시를 미리 메모리에 로드 (대상 파일 수 반환)
+        
+        같은 엔진으로 이어서 검색하면 디스크에서 다시 로드하지 않고 바뀐 디렉토리만 다시 읽습니다.
+        """
+        search_path = Path(search_dir)
+        if not search_path.is_dir():
+            raise ValueError(f"경로 {search_dir} 가 존재하지 않습니다.")
+        if use_index:
+            self._get_index(search_path)
+        file_paths = self._collect_target_files_optimized(search_path, file_extensions,
+                                                          ExcludeMatcher(exclude_patterns))
+        return len(file_paths)
+    
     def get_performance_stats(self) -> Dict[str, Any]:
         """성능 통계 정보 반환"""
         return {
             "max_workers": self.max_workers,
+            "backend": self.backend,
+            "process_workers": self.process_workers,
+            "process_pool_active": self._process_pool is not None,
             "pattern_cache_size": len(self.pattern_cache),
-            "cache_size_limit": self.cache_size_limit
+            "cache_size_limit": self.cache_size_limit,
+            "indexed_files": sum(len(index) for index in self.indexes.values()),
+            "binary_cached_files": len(self.binary_cache),
+            "listing_cached_dirs": sum(len(cache) for cache in self.listing_caches.values()),
+            "listing_reused_dirs": self.last_search_stats.get("listing_reused_dirs", 0),
+            "listing_relisted_dirs": self.last_search_stats.get("listing_relisted_dirs", 0),
+            "result_cache_bytes": self.result_cache.disk_usage(),
+            "result_cache_memory_bytes": self.result_cache.memory_usage(),
+            "result_cache_limit_bytes": self.result_cache.max_bytes,
+            "result_cache_hits": self.result_cache.hits,
+            "result_cache_misses": self.result_cache.misses,
+            "result_cache_hit_rate": self.result_cache.hit_rate,
+            "last_search": dict(self.last_search_stats)
         }
     
     def clear_pattern_cache(self):
         """정규식 패턴 캐시 정리"""
         self.pattern_cache.clear()
     
+    def clear_index(self, search_dir: str = None):
+        """트라이그램 인덱스 삭제 (search_dir이 없으면 로드된 모든 인덱스)"""
+        if search_dir:
+            self._get_index(Path(search_dir)).clear()
+        else:
+            for index in self.indexes.values():
+                index.clear()
+    
+    def clear_listing_cache(self, search_dir: str = None):
+        """디렉토리 목록 캐시 삭제 (search_dir이 없으면 로드된 모든 캐시)"""
+        root = os.path.abspath(search_dir) if search_dir else None
+        for key, cache in self.listing_caches.items():
+            if root is None or key[0] == root:
+                cache.clear()
+    
+    def clear_result_cache(self) -> int:
+        """파일별 결과 캐시 삭제 (삭제한 바이트 수 반환)"""
+        return self.result_cache.clear()
+    
+    def set_result_cache_size(self, size_mb: int):
+        """결과 캐시 최대 크기 설정 (MB, 0이면 결과 캐시 사용 안 함)"""
+        if size_mb < 0:
+            raise ValueError("결과 캐시 크기는 0 이상이어야 합니다.")
+        self.use_result_cache = size_mb > 0
+        if self.use_result_cache:
+            self.result_cache.max_bytes = size_mb * 1024 * 1024
+            self.result_cache.evict()
+    
     def set_max_workers(self, max_workers: int):
         """최대 워커 수 설정"""
         self.max_workers = max(1, max_workers)
+    
+    def set_export_split(self, split: str):
+        """Excel 행 제한을 넘는 내보내기의 분할 방식 설정 (file: 번호 붙은 통합 문서, sheet: 여러 시트)"""
+        if split not in EXPORT_SPLIT_MODES:
+            raise ValueError(f"지원하지 않는 내보내기 분할 방식입니다: {split}")
+        self.export_split = split
+    
+    def set_backend(self, backend: str):
+        """검색 백엔드 설정 (thread: 스레드 풀, process: 프로세스 풀)"""
+        if backend not in SEARCH_BACKENDS:
+            raise ValueError(f"지원하지 않는 검색 백엔드입니다: {backend}")
+        self.backend = backend
+        if backend != BACKEND_PROCESS:
+            # 실행 중인 프로세스에서 백엔드만 바꾸는 경우라 풀 종료를 기다리지 않음
+            self.shutdown(wait=False)
+    
+    def shutdown(self, wait: bool = True):
+        """프로세스 풀 등 검색 간에 유지하는 리소스 정리
+
+        Args:
+            wait: 프로세스 풀이 종료될 때까지 대기 (인터프리터 종료 직전에 기다리지 않으면
+                  concurrent.futures의 종료 처리에서 풀의 wakeup 파이프 오류가 출력됨)
+        """
+        pool = getattr(self, "_process_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+            self._process_pool = None
 
@@ -0,0 +1,161 @@
+import os
+import re
+import pickle
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# 파일별 트라이그램 시그니처 비트 수 (파일당 512바이트)
+SIGNATURE_BITS = 4096
+INDEX_VERSION = 2
+DEFAULT_INDEX_DIR = Path.home() / ".java_search" / "index"
+# 트라이그램을 추출할 ASCII 단어 토큰 (소문자 변환 후 적용)
+TOKEN_PATTERN = re.compile(rb"[a-z0-9_]{3,}")
+# 대소문자 무시 정규식이 ASCII 문자와 같게 취급하는 비ASCII 문자의 인코딩별 바이트열 → 접은 ASCII 문자
+# (İ, ı → i, ſ → s, 켈빈 기호 → k / UTF-8과 EUC-KR·CP949)
+CASE_FOLD_BYTES = (
+    (b"\xc4\xb0", b"i"), (b"\xc4\xb1", b"i"), (b"\xc5\xbf", b"s"), (b"\xe2\x84\xaa", b"k"),
+    (b"\xa9\xa5", b"i"),
+)
+
+
+def _trigram_bit(a: int, b: int, c: int) -> int:
+    """트라이그램을 시그니처 비트 위치로 변환"""
+    return (((a << 16) | (b << 8) | c) * 2654435761 >> 7) & (SIGNATURE_BITS - 1)
+
+
+def build_signature(data: bytes) -> bytes:
+    """파일 내용(bytes)에서 트라이그램 시그니처 생성
+
+    소문자로 접은 ASCII 단어 토큰 내부의 트라이그램만 해시하여 고정 크기 비트맵에 기록합니다.
+    고유 토큰 단위로 처리하므로 파일 전체를 문자 단위로 순회하지 않으며, ASCII 호환 인코딩이면 인코딩과 무관합니다.
+    İ, ı, ſ, 켈빈 기호가 있으면 ASCII 문자로 접은 내용의 토큰도 추가합니다.
+    (대소문자 무시 검색에서 "string"이 "ſtring"에 매칭되는 파일을 후보에서 빼지 않도록, 비트를 더하기만 함)
+    """
+    bitmap = bytearray(SIGNATURE_BITS // 8)
+    trigrams = set()
+    lowered = data.lower()
+    tokens = set(TOKEN_PATTERN.findall(lowered))
+    if not lowered.isascii():
+        folded = lowered
+        for encoded, letter in CASE_FOLD_BYTES:
+            folded = folded.replace(encoded, letter)
+        if folded != lowered:
+            tokens.update(TOKEN_PATTERN.findall(folded))
+    for token in tokens:
+        trigrams.update(zip(token, token[1:], token[2:]))
+    for a, b, c in trigrams:
+        bit = _trigram_bit(a, b, c)
+        bitmap[bit >> 3] |= 1 << (bit & 7)
+    return bytes(bitmap)
+
+
+def query_bits(literals: Iterable[str]) -> List[int]:
+    """필수 리터럴 목록에서 조회할 비트 위치 목록 생성 (사용할 트라이그램이 없으면 빈 리스트)"""
+    bits = set()
+    for literal in literals:
+        # 비ASCII 문자는 인코딩/대소문자 접기에 따라 달라지므로 토큰 경계로 취급
+        data = literal.lower().encode("ascii", errors="replace")
+        for token in TOKEN_PATTERN.findall(data):
+            for a, b, c in zip(token, token[1:], token[2:]):
+                bits.add(_trigram_bit(a, b, c))
+    return sorted(bits)
+
+
+class TrigramIndex:
+    """검색 디렉토리별 디스크 트라이그램 인덱스
+
+    파일 경로마다 (mtime_ns, size, 시그니처)를 저장하고, mtime/size가 바뀐 파일만
+    다시 시그니처를 계산하여 점진적으로 갱신합니다. 시그니처는 블룸 필터처럼 동작하므로
+    후보 축소에만 사용하고 실제 매칭은 항상 정규식 검색으로 확인합니다.
+    """
+
+    def __init__(self, root: str, index_dir: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.index_dir = Path(index_dir) if index_dir else DEFAULT_INDEX_DIR
+        root_hash = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:16]
+        self.index_file = self.index_dir / f"{root_hash}.idx"
+        self.entries: Dict[str, Tuple[int, int, bytes]] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """디스크에서 인덱스를 로드합니다."""
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, "rb") as f:
+                data = pickle.load(f)
+            if data.get("version") == INDEX_VERSION and data.get("root") == self.root:
+                self.entries = data["entries"]
+        except Exception as e:
+            print(f"인덱스 로드 오류: {self.index_file} ({e})")
+            self.entries = {}
+
+    def save(self) -> bool:
+        """변경된 경우에만 인덱스를 디스크에 저장합니다."""
+        if not self.dirty:
+            return True
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_suffix(".tmp")
+            with self._lock:
+                data = {"version": INDEX_VERSION, "root": self.root, "entries": dict(self.entries)}
+                self.dirty = False
+            with open(temp_file, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, self.index_file)
+            return True
+        except Exception as e:
+            print(f"인덱스 저장 오류: {self.index_file} ({e})")
+            return False
+
+    def lookup(self, file_path: str, mtime_ns: int, size: int) -> Optional[bytes]:
+        """파일이 변경되지 않았으면 시그니처를, 변경되었거나 없으면 None 반환"""
+        entry = self.entries.get(file_path)
+        if entry and entry[0] == mtime_ns and entry[1] == size:
+            return entry[2]
+        return None
+
+    @staticmethod
+    def may_contain(signature: bytes, bits: List[int]) -> bool:
+        """시그니처에 조회 비트가 모두 있는지 확인 (False면 매칭 불가능)"""
+        for bit in bits:
+            if not signature[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def update(self, file_path: str, mtime_ns: int, size: int, data: bytes):
+        """파일 내용으로 시그니처를 갱신합니다."""
+        self.store(file_path, mtime_ns, size, build_signature(data))
+
+    def store(self, file_path: str, mtime_ns: int, size: int, signature: bytes):
+        """미리 계산된 시그니처를 저장합니다. (프로세스 워커 결과 반영용)"""
+        with self._lock:
+            self.entries[file_path] = (mtime_ns, size, signature)
+            self.dirty = True
+
+    def prune(self, seen_paths: set):
+        """이번 검색에서 보지 못했고 더 이상 존재하지 않는 파일 항목 제거"""
+        with self._lock:
+            removed = [p for p in self.entries if p not in seen_paths and not os.path.exists(p)]
+            for file_path in removed:
+                del self.entries[file_path]
+            if removed:
+                self.dirty = True
+
+    def clear(self):
+        """인덱스 항목과 디스크 파일을 삭제합니다."""
+        with self._lock:
+            self.entries.clear()
+            self.dirty = False
+        try:
+            self.index_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -6,6 +6,17 @@ import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox
 
+from ..core.multi_keyword import load_keywords
+from ..core.result_feed import ResultFeed
+from ..core.search_daemon import DaemonClient
+from ..core.result_export import EXPORT_EXTENSIONS, EXPORT_FORMAT_LABELS
+
+
+# 검색 결과/진행률을 GUI에 반영하는 주기 (밀리초, 초당 최대 20회)
+FEED_INTERVAL_MS = 50
+# 한 번에 반영할 최대 결과 행 수 (가상 목록은 행 수만 갱신하므로 위젯 비용과 무관)
+FEED_MAX_ROWS = 1000000
+
 
 class SearchEventHandler:
     """검색 관련 이벤트 핸들러"""
@@ -15,6 +26,12 @@ class SearchEventHandler:
         self.search_panel = search_panel
         self.results_panel = results_panel
         self.is_searching = False
+        # 진행 중인 검색의 결과 전달 큐 (취소하거나 새 검색을 시작하면 교체)
+        self.feed = None
+        # 실행 중인 검색 워커 스레드 (취소 후에도 끝날 때까지 새 검색을 시작하지 않음)
+        self.search_thread = None
+        # 마지막 검색을 실행한 엔진 (검색 데몬 클라이언트 또는 이 프로세스의 검색 엔진)
+        self.searcher = None
         self.bind_events()
     
     def bind_events(self):
@@ -22,7 +39,9 @@ class SearchEventHandler:
         self.search_panel.search_btn.configure(command=self.start_search)
         self.search_panel.cancel_btn.configure(command=self.cancel_search)
         self.search_panel.clear_btn.configure(command=self.clear_results)
+        self.search_panel.clear_cache_btn.configure(command=self.clear_result_cache)
         self.search_panel.browse_btn.configure(command=self.browse_directory)
+        self.search_panel.keyword_file_btn.configure(command=self.load_keyword_file)
         self.search_panel.recent_dir_combo.configure(command=self.on_recent_dir_selected)
         self.search_panel.recent_search_combo.configure(command=self.on_recent_search_selected)
         self.search_panel.keyword_entry.bind("<Return>", lambda e: self.start_search())
@@ -34,6 +53,29 @@ class SearchEventHandler:
             self.search_panel.dir_entry.delete(0, tk.END)
             self.search_panel.dir_entry.insert(0, directory)
     
+    def load_keyword_file(self):
+        """키워드 파일을 불러와 다중 키워드로 설정"""
+        file_path = filedialog.askopenfilename(
+            title="키워드 파일을 선택하세요 (한 줄에 하나)",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
+        
+        try:
+            keywords = load_keywords(file_path, self.search_panel.encoding_combo.get())
+        except Exception as e:
+            messagebox.showerror("오류", f"키워드 파일을 읽을 수 없습니다:\n{e}")
+            return
+        
+        if not keywords:
+            messagebox.showwarning("경고", "키워드 파일에 키워드가 없습니다.")
+            return
+        
+        self.search_panel.keyword_entry.delete(0, tk.END)
+        self.search_panel.keyword_entry.insert(0, ", ".join(keywords))
+        self.search_panel.multi_keyword_var.set(True)
+    
     def on_recent_dir_selected(self, selection):
         """최근 디렉토리 선택"""
         if selection and selection != "최근 디렉토리":
@@ -48,7 +90,7 @@ class SearchEventHandler:
     
     def start_search(self):
         """검색 시작"""
-        if self.is_searching:
+        if self.is_searching or self._worker_running():
             return
         
         # 입력 검증
@@ -89,35 +131,97 @@ class SearchEventHandler:
         self.main_app.config_manager.add_recent_directory(search_dir)
         self.main_app.update_recent_combos()
         
-        # 비동기 검색 시작
+        # 비동기 검색 시작 (결과와 진행률은 전달 큐를 거쳐 메인 루프에서 반영)
+        self.feed = ResultFeed()
         search_thread = threading.Thread(
             target=self._search_worker,
-            args=(search_dir, keyword, extensions, exclude_patterns, config)
+            args=(search_dir, keyword, extensions, exclude_patterns, config, self.feed)
         )
         search_thread.daemon = True
+        self.search_thread = search_thread
         search_thread.start()
+        self.main_app.root.after(FEED_INTERVAL_MS, self._drain_feed, self.feed)
+    
+    def _worker_running(self) -> bool:
+        """이전 검색 워커 스레드가 아직 실행 중인지 확인 (취소 직후에는 종료될 때까지 잠시 실행됨)"""
+        return self.search_thread is not None and self.search_thread.is_alive()
+    
+    def _enable_search_when_idle(self):
+        """취소된 검색 워커가 끝나면 검색 버튼 활성화 (같은 엔진의 취소 플래그를 새 검색이 초기화하지 않도록)"""
+        if self.is_searching:
+            return
+        if self._worker_running():
+            self.main_app.root.after(FEED_INTERVAL_MS, self._enable_search_when_idle)
+            return
+        self.search_panel.search_btn.configure(state="normal")
+    
+    def _get_searcher(self, config):
+        """검색을 실행할 엔진 (검색 데몬이 실행 중이면 데몬 클라이언트, 아니면 이 프로세스의 검색 엔진)"""
+        if config['use_daemon']:
+            client = DaemonClient.discover()
+            if client is not None:
+                return client
+        return self.main_app.search_engine
     
-    def _search_worker(self, search_dir, keyword, extensions, exclude_patterns, config):
-        """검색 워커 스레드"""
+    def _search_worker(self, search_dir, keyword, extensions, exclude_patterns, config, feed):
+        """검색 워커 스레드 (위젯에 직접 접근하지 않고 feed에만 기록)"""
         try:
-            results = self.main_app.search_engine.search(
+            searcher = self._get_searcher(config)
+            self.searcher = searcher
+            results = searcher.search(
                 search_dir=search_dir,
                 keyword=keyword,
                 use_regex=config['use_regex'],
                 case_sensitive=config['case_sensitive'],
                 whole_word=config['whole_word'],
+                keywords=config['keywords'] or None,
+                result_store=self.results_panel.result_store,
+                max_results=config['max_results'],
+                # 하위 디렉토리 검색을 끄면 검색 디렉토리만 탐색
+                max_depth=config['max_depth'] if config['recursive_search'] else 0,
+                include_binary=config['include_binary'],
+                dedupe_content=config['dedupe_content'],
+                # 0 이하면 파일 크기 제한 없음
+                max_file_size=int(config['max_file_size_mb'] * 1024 * 1024) if config['max_file_size_mb'] > 0 else None,
                 file_extensions=tuple(extensions),
                 exclude_patterns=exclude_patterns,
                 file_encoding=config['encoding'],
-                progress_callback=self.results_panel.update_progress,
-                result_callback=self.results_panel.add_result_batch
+                progress_callback=feed.push_progress,
+                result_callback=feed.push_results,
+                file_callback=feed.push_files
             )
             
             # 검색 완료
-            self.main_app.root.after(0, self._search_completed, results)
+            feed.finish(results)
             
         except Exception as e:
-            self.main_app.root.after(0, self._search_error, str(e))
+            feed.fail(str(e))
+    
+    def _drain_feed(self, feed):
+        """전달 큐에 쌓인 결과와 진행률을 반영 (메인 루프 타이머, FEED_INTERVAL_MS마다)"""
+        if feed is not self.feed:
+            # 취소되었거나 새 검색으로 교체된 큐
+            return
+        
+        update = feed.drain(FEED_MAX_ROWS)
+        if update.progress is not None:
+            self.results_panel.update_progress(*update.progress)
+        # 결과를 지운 뒤 이전 저장소에 들어온 행은 표시하지 않음
+        if update.store is self.results_panel.result_store:
+            if update.row_count:
+                self.results_panel.show_result_count(update.stop)
+            if update.files:
+                self.results_panel.add_file_summaries(update.files)
+        
+        if not update.finished:
+            self.main_app.root.after(FEED_INTERVAL_MS, self._drain_feed, feed)
+            return
+        
+        self.feed = None
+        if update.error is not None:
+            self._search_error(update.error)
+        else:
+            self._search_completed(update.results)
     
     def _search_completed(self, results):
         """검색 완료"""
@@ -125,10 +229,27 @@ class SearchEventHandler:
         self.search_panel.search_btn.configure(state="normal")
         self.search_panel.cancel_btn.configure(state="disabled")
         self.results_panel.hide_progress()
+        self.results_panel.refresh_sort()
         
         if results:
             self.search_panel.export_btn.configure(state="normal", text=f"📊 Excel 내보내기 ({len(results)}건)")
-            messagebox.showinfo("검색 완료", f"검색이 완료되었습니다.\n총 {len(results)}건의 결과를 찾았습니다.\n\nExcel 내보내기 버튼을 클릭하여 결과를 저장할 수 있습니다.")
+            truncated_message = ""
+            if results.truncated:
+                truncated_message = (f"\n\n⚠️ 최대 결과 수에 도달하여 검색을 중단했습니다."
+                                     f"\n(검색하지 않은 파일 {results.unscanned_files}개)")
+            stats = self.searcher.last_search_stats
+            cache_hits = stats.get("result_cache_hits", 0)
+            cache_lookups = cache_hits + stats.get("result_cache_misses", 0)
+            cache_message = ""
+            if cache_lookups:
+                cache_message = (f"\n결과 캐시 적중률: {cache_hits / cache_lookups:.0%}"
+                                 f" ({cache_hits}/{cache_lookups}개 파일)")
+            if stats.get("duplicate_skipped_files"):
+                cache_message += (f"\n동일 내용으로 검색을 생략한 파일: {stats['duplicate_skipped_files']}개"
+                                  f" ({stats['duplicate_skipped_bytes'] / (1024 * 1024):.1f} MB)")
+            if stats.get("daemon"):
+                cache_message += f"\n검색 데몬 사용: 왕복 {stats['round_trip_time']:.2f}초"
+            messagebox.showinfo("검색 완료", f"검색이 완료되었습니다.\n총 {len(results)}건의 결과를 찾았습니다.{cache_message}{truncated_message}\n\nExcel 내보내기 버튼을 클릭하여 결과를 저장할 수 있습니다.")
         else:
             self.search_panel.export_btn.configure(state="disabled", text="📊 Excel 내보내기")
             messagebox.showinfo("검색 완료", "검색 결과가 없습니다.")
@@ -145,15 +266,38 @@ class SearchEventHandler:
     def cancel_search(self):
         """검색 취소"""
         self.main_app.search_engine.cancel_current_search()
+        if self.searcher is not None and self.searcher is not self.main_app.search_engine:
+            self.searcher.cancel_current_search()
+        self.feed = None
         self.is_searching = False
-        self.search_panel.search_btn.configure(state="normal")
+        self.search_panel.search_btn.configure(state="disabled")
         self.search_panel.cancel_btn.configure(state="disabled")
         self.results_panel.hide_progress()
+        self._enable_search_when_idle()
     
     def clear_results(self):
         """결과 지우기"""
         self.results_panel.clear_results()
         self.search_panel.export_btn.configure(state="disabled", text="📊 Excel 내보내기")
+    
+    def clear_result_cache(self):
+        """파일별 결과 캐시 비우기 (다음 검색은 모든 파일을 다시 읽음)"""
+        if self.is_searching or self._worker_running():
+            messagebox.showwarning("경고", "검색 중에는 캐시를 비울 수 없습니다.")
+            return
+        # 검색 데몬을 사용 중이면 데몬이 메모리에 유지하는 캐시도 함께 비움
+        searcher = self._get_searcher(self.search_panel.get_search_config())
+        daemon_message = ""
+        freed = 0
+        if searcher is not self.main_app.search_engine:
+            try:
+                freed += searcher.clear_result_cache()
+                daemon_message = " (검색 데몬 포함)"
+            except (OSError, ValueError) as e:
+                messagebox.showerror("오류", f"검색 데몬의 결과 캐시를 비울 수 없습니다:\n{e}")
+                return
+        freed += self.main_app.search_engine.clear_result_cache()
+        messagebox.showinfo("캐시 비우기", f"결과 캐시를 비웠습니다{daemon_message}. ({freed / (1024 * 1024):.1f} MB)")
 
 
 class ExportEventHandler:
@@ -164,6 +308,10 @@ class ExportEventHandler:
         self.search_panel = search_panel
         self.results_panel = results_panel
         self.is_exporting = False
+        # 내보내기 스레드가 기록하는 최신 진행률 (쓴 행 수, 전체 행 수)
+        self.export_progress = None
+        # 진행 중인 내보내기 형식 이름 (Excel, CSV 등)
+        self.export_label = "Excel"
         self.export_tooltip = None
         self.bind_events()
     
@@ -174,7 +322,7 @@ class ExportEventHandler:
         self.search_panel.export_btn.bind("<Leave>", self.hide_export_tooltip)
     
     def export_results(self):
-        """Excel로 내보내기"""
+        """Excel/CSV/JSON Lines/Parquet로 내보내기 (형식은 파일 확장자로 결정)"""
         if not self.results_panel.get_all_results():
             messagebox.showwarning("경고", "내보낼 결과가 없습니다.")
             return
@@ -189,18 +337,26 @@ class ExportEventHandler:
         output_file = self.search_panel.output_entry.get().strip()
         if not output_file:
             output_file = default_filename
-        elif not output_file.endswith('.xlsx'):
+        elif Path(output_file).suffix.lower() not in EXPORT_EXTENSIONS:
             output_file += '.xlsx'
         
-        # 파일 저장 대화상자
+        # 파일 저장 대화상자 (출력 파일 확장자의 형식을 먼저 표시)
+        filetypes = [("Excel files", "*.xlsx"), ("CSV files", "*.csv"), ("JSON Lines files", "*.jsonl"),
+                     ("Parquet files", "*.parquet")]
+        suffix = Path(output_file).suffix.lower()
+        filetypes.sort(key=lambda filetype: filetype[1] != f"*{suffix}")
         file_path = filedialog.asksaveasfilename(
-            defaultextension=".xlsx",
-            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            defaultextension=suffix,
+            filetypes=filetypes + [("All files", "*.*")],
             initialfile=output_file,
-            title="Excel 파일로 저장 (중복 시 자동으로 _1, _2 추가)",
+            title="결과 파일로 저장 (.xlsx/.csv/.jsonl/.parquet, 중복 시 자동으로 _1, _2 추가)",
             confirmoverwrite=False
         )
         
+        if file_path and Path(file_path).suffix.lower() not in EXPORT_EXTENSIONS:
+            messagebox.showerror("오류", "지원하지 않는 파일 형식입니다.\n.xlsx, .csv, .jsonl, .parquet 중 하나로 저장해주세요.")
+            return
+        
         if file_path:
             # 파일명 중복 확인 및 사용자 안내
             if Path(file_path).exists():
@@ -221,22 +377,27 @@ class ExportEventHandler:
             self.search_panel.export_btn.configure(state="disabled", text="📊 내보내기 중...")
             
             # 진행률 표시
+            self.export_progress = None
+            self.export_label = EXPORT_FORMAT_LABELS[EXPORT_EXTENSIONS[Path(file_path).suffix.lower()]]
             self.results_panel.show_progress()
+            self.results_panel.update_export_progress(0, self.results_panel.get_results_count(), self.export_label)
             
-            # 비동기로 Excel 내보내기 실행
+            # 비동기로 내보내기 실행
             export_thread = threading.Thread(
                 target=self._export_worker,
                 args=(file_path, output_file),
                 daemon=True
             )
             export_thread.start()
+            self.main_app.root.after(FEED_INTERVAL_MS, self._poll_export_progress)
     
     def _export_worker(self, file_path, output_file):
-        """Excel 내보내기 워커 스레드"""
+        """내보내기 워커 스레드"""
         try:
-            # 검색 엔진을 통해 Excel 내보내기 실행
-            success = self.main_app.search_engine.export_to_excel(
-                self.results_panel.get_all_results(), file_path
+            # 검색 엔진을 통해 내보내기 실행 (형식은 파일 확장자로 결정)
+            success = self.main_app.search_engine.export_results(
+                self.results_panel.get_all_results(), file_path,
+                progress_callback=self._set_export_progress
             )
             
             # UI 업데이트는 메인 스레드에서 실행
@@ -246,18 +407,38 @@ class ExportEventHandler:
             # 오류 발생 시 UI 업데이트
             self.main_app.root.after(0, self._export_error, str(e))
     
+    def _set_export_progress(self, written, total):
+        """progress_callback: 최신 진행률만 기록 (내보내기 스레드에서 호출)"""
+        self.export_progress = (written, total)
+    
+    def _poll_export_progress(self):
+        """내보내기 진행률 반영 (메인 루프 타이머, 내보내기가 끝날 때까지)"""
+        if not self.is_exporting:
+            return
+        if self.export_progress is not None:
+            self.results_panel.update_export_progress(*self.export_progress, self.export_label)
+        self.main_app.root.after(FEED_INTERVAL_MS, self._poll_export_progress)
+    
     def _export_completed(self, success, file_path, output_file):
-        """Excel 내보내기 완료 처리"""
+        """내보내기 완료 처리"""
         try:
             # 진행률 숨김
             self.results_panel.hide_progress()
             
             if success:
-                # 실제 저장된 파일 경로 확인
-                actual_file_path = self._get_actual_saved_file_path(file_path)
+                # 실제 저장된 파일 경로 확인 (행 제한을 넘으면 여러 통합 문서로 나뉨)
+                saved_files = self.main_app.search_engine.last_export_files
+                actual_file_path = saved_files[0] if saved_files else self._get_actual_saved_file_path(file_path)
                 original_filename = Path(file_path).name
                 
-                if actual_file_path != file_path:
+                if len(saved_files) > 1:
+                    file_list = "\n".join(f"  • {Path(saved_file).name}" for saved_file in saved_files)
+                    messagebox.showinfo("내보내기 완료",
+                        f"✅ {self.export_label} 내보내기가 완료되었습니다!\n\n"
+                        f"📊 총 {self.results_panel.get_results_count()}건이 Excel 행 제한을 넘어 "
+                        f"{len(saved_files)}개 파일로 나누어 저장되었습니다:\n{file_list}\n\n"
+                        f"💾 저장 위치: {Path(actual_file_path).parent}")
+                elif actual_file_path != file_path:
                     messagebox.showinfo("내보내기 완료", 
                         f"📁 파일명이 중복되어 자동으로 변경되었습니다:\n\n"
                         f"📝 원본 파일명: {original_filename}\n"
@@ -266,7 +447,7 @@ class ExportEventHandler:
                         f"💡 기존 파일은 그대로 유지되며, 새로운 파일이 생성되었습니다.")
                 else:
                     messagebox.showinfo("내보내기 완료", 
-                        f"✅ Excel 내보내기가 완료되었습니다!\n\n"
+                        f"✅ {self.export_label} 내보내기가 완료되었습니다!\n\n"
                         f"📁 저장 위치: {file_path}\n"
                         f"📊 총 {self.results_panel.get_results_count()}건의 검색 결과가 저장되었습니다.")
                 
@@ -279,7 +460,7 @@ class ExportEventHandler:
                 self.main_app.root.after(2000, lambda: self.search_panel.export_btn.configure(text=f"📊 Excel 내보내기 ({self.results_panel.get_results_count()}건)"))
                 
             else:
-                messagebox.showerror("오류", "Excel 파일 저장 중 오류가 발생했습니다.")
+                messagebox.showerror("오류", f"{self.export_label} 파일 저장 중 오류가 발생했습니다.")
                 self.search_panel.export_btn.configure(state="normal", text=f"📊 Excel 내보내기 ({self.results_panel.get_results_count()}건)")
                 
         except Exception as e:
@@ -291,13 +472,13 @@ class ExportEventHandler:
             self.search_panel.export_btn.configure(state="normal")
     
     def _export_error(self, error_message):
-        """Excel 내보내기 오류 처리"""
+        """내보내기 오류 처리"""
         try:
             # 진행률 숨김
             self.results_panel.hide_progress()
             
-            messagebox.showerror("오류", f"Excel 내보내기 중 오류가 발생했습니다:\n{error_message}")
-            print(f"Excel 내보내기 오류 상세: {error_message}")
+            messagebox.showerror("오류", f"{self.export_label} 내보내기 중 오류가 발생했습니다:\n{error_message}")
+            print(f"{self.export_label} 내보내기 오류 상세: {error_message}")
             
         except Exception as e:
             print(f"오류 처리 중 추가 오류: {e}")
@@ -336,7 +517,7 @@ class ExportEventHandler:
         if self.search_panel.export_btn.cget("state") == "disabled":
             tooltip_text = "검색 결과가 없습니다. 먼저 검색을 실행해주세요."
         else:
-            tooltip_text = f"검색 결과 {self.results_panel.get_results_count()}건을 Excel 파일로 내보냅니다.\n\n💡 파일명이 중복되면 자동으로 _1, _2를 붙여서 새 파일을 생성합니다."
+            tooltip_text = f"검색 결과 {self.results_panel.get_results_count()}건을 Excel 파일로 내보냅니다.\n출력 파일 확장자를 .csv, .jsonl, .parquet으로 바꾸면 해당 형식으로 저장합니다.\n\n💡 파일명이 중복되면 자동으로 _1, _2를 붙여서 새 파일을 생성합니다."
         
         # 툴팁 위치 계산
         x = self.search_panel.export_btn.winfo_rootx() + self.search_panel.export_btn.winfo_width() // 2
@@ -387,8 +568,11 @@ class FileEventHandler:
         self.results_panel.context_menu.entryconfig("경로 복사", command=self.copy_selected_path)
     
     def open_selected_file(self, event=None):
-        """선택된 파일 열기"""
-        result = self.results_panel.get_selected_result()
+        """선택된 파일 열기 (더블클릭이면 클릭한 행)"""
+        if event is not None:
+            result = self.results_panel.select_row_at(event)
+        else:
+            result = self.results_panel.get_selected_result()
         if not result:
             return
         
@@ -430,7 +614,10 @@ class FileEventHandler:
         messagebox.showinfo("복사 완료", "파일 경로가 클립보드에 복사되었습니다.")
     
     def show_context_menu(self, event):
-        """컨텍스트 메뉴 표시"""
+        """컨텍스트 메뉴 표시 (우클릭한 행을 먼저 선택하여 메뉴 동작이 그 행에 적용되도록 함)"""
+        if self.results_panel.select_row_at(event) is None:
+            return
+        
         try:
             self.results_panel.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
@@ -0,0 +1,140 @@
+from itertools import islice
+from tkinter import ttk
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from ..core.result_store import FileSummary, ResultStore
+
+
+# 파일 노드를 펼칠 때 한 번에 만드는 최대 매칭 행 수 (나머지는 "더 보기" 항목으로)
+CHILD_BATCH_ROWS = 1000
+# 항목 ID 접두사 (매칭 행 항목 ID는 결과 행 인덱스 문자열)
+FILE_PREFIX = "file:"
+PLACEHOLDER_PREFIX = "placeholder:"
+MORE_PREFIX = "more:"
+
+
+class GroupedResultsTree:
+    """파일별로 매칭을 묶어 보여주는 트리 (Eclipse 검색 뷰 방식)
+
+    검색 중에는 파일 요약(파일 이름, 매칭 수)만 파일 노드로 추가하고, 매칭 라인은 사용자가
+    노드를 펼칠 때 결과 저장소에서 읽어 만듭니다. 매칭이 많은 파일은 CHILD_BATCH_ROWS개씩 나눠 만듭니다.
+    매칭 행 항목 ID는 평면 목록과 같이 결과 행 인덱스 문자열입니다.
+    """
+
+    def __init__(self, parent, columns: Sequence[str], row_values: Callable[[int], Tuple], **tree_options):
+        self.row_values = row_values
+        self.tree = ttk.Treeview(parent, columns=columns, show="tree headings", selectmode="browse", **tree_options)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.scrollbar.set)
+        self.store: Optional[ResultStore] = None
+        self.file_count = 0
+        # 같은 내용의 파일을 대표 파일 노드 하나로 접을지 여부
+        self.collapse_duplicates = False
+
+        self.tree.bind("<<TreeviewOpen>>", self._on_open)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+    def reset(self, store: Optional[ResultStore]):
+        """모든 파일 노드 제거"""
+        self.tree.delete(*self.tree.get_children())
+        self.store = store
+        self.file_count = 0
+
+    def add_files(self, summaries: List[FileSummary]):
+        """파일 요약을 파일 노드로 추가 (매칭 라인은 펼칠 때 생성)"""
+        for summary in summaries:
+            owner = self.store.content_owner(summary.file_id) if self.collapse_duplicates else summary.file_id
+            if owner != summary.file_id:
+                # 같은 내용의 파일은 노드를 만들지 않고 대표 파일 노드의 동일 파일 수만 갱신
+                owner_node = f"{FILE_PREFIX}{owner}"
+                if self.tree.exists(owner_node):
+                    self.tree.item(owner_node, text=self._node_text(self.store.file_summary(owner)))
+                continue
+            node = f"{FILE_PREFIX}{summary.file_id}"
+            text = self._node_text(summary)
+            if self.tree.exists(node):
+                self.tree.item(node, text=text)
+                continue
+            self.tree.insert("", "end", iid=node, text=text, values=("", summary.file_path, ""))
+            # 펼침 표시를 위한 자리 표시 항목
+            self.tree.insert(node, "end", iid=f"{PLACEHOLDER_PREFIX}{summary.file_id}")
+            self.file_count += 1
+
+    def _node_text(self, summary: FileSummary) -> str:
+        text = f"{summary.file_name} ({summary.hit_count}건)"
+        if self.collapse_duplicates:
+            duplicates = self.store.duplicate_count(summary.file_id)
+            if duplicates:
+                text += f" [동일 파일 {duplicates}개 더]"
+        return text
+
+    def _on_open(self, event):
+        node = self.tree.focus()
+        if not node.startswith(FILE_PREFIX):
+            return
+        file_id = int(node[len(FILE_PREFIX):])
+        placeholder = f"{PLACEHOLDER_PREFIX}{file_id}"
+        if self.tree.exists(placeholder):
+            self.tree.delete(placeholder)
+            self._load_children(node, file_id, 0)
+
+    def _load_children(self, node: str, file_id: int, offset: int):
+        """파일 노드 아래에 매칭 행을 offset부터 CHILD_BATCH_ROWS개 생성"""
+        rows = list(islice(self.store.file_rows(file_id), offset, offset + CHILD_BATCH_ROWS + 1))
+        for index in rows[:CHILD_BATCH_ROWS]:
+            self.tree.insert(node, "end", iid=str(index), text="", values=self.row_values(index))
+        if len(rows) > CHILD_BATCH_ROWS:
+            remaining = self.store.file_hit_count(file_id) - offset - CHILD_BATCH_ROWS
+            self.tree.insert(node, "end", iid=f"{MORE_PREFIX}{file_id}:{offset + CHILD_BATCH_ROWS}",
+                             text=f"... {remaining}건 더 보기")
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if not selection or not selection[0].startswith(MORE_PREFIX):
+            return
+        # "더 보기" 항목을 선택하면 다음 묶음을 만들고 첫 행을 선택
+        item = selection[0]
+        file_id, offset = (int(part) for part in item[len(MORE_PREFIX):].split(":"))
+        self.tree.delete(item)
+        self._load_children(f"{FILE_PREFIX}{file_id}", file_id, offset)
+        first = next(islice(self.store.file_rows(file_id), offset, None))
+        self.tree.selection_set(str(first))
+        self.tree.see(str(first))
+
+    def index_of(self, item: str) -> Optional[int]:
+        """항목의 결과 행 인덱스 (파일 노드는 첫 매칭, 그 밖의 항목은 None)"""
+        if item.isdigit():
+            return int(item)
+        if item.startswith(FILE_PREFIX) and self.store is not None:
+            return self.store.file_row_ranges(int(item[len(FILE_PREFIX):]))[0][0]
+        return None
+
+    @property
+    def selected_index(self) -> Optional[int]:
+        selection = self.tree.selection()
+        return self.index_of(selection[0]) if selection else None
+
+    def select_at(self, y: int) -> Optional[int]:
+        """마우스 y 좌표의 항목을 선택하고 행 인덱스 반환 (행이 없으면 None)"""
+        item = self.tree.identify_row(y)
+        if not item:
+            return None
+        self.tree.selection_set(item)
+        self.tree.focus(item)
+        return self.index_of(item)
+
+    def select_adjacent_file(self, step: int):
+        """다음(step=1)/이전(step=-1) 파일 노드 선택"""
+        selection = self.tree.selection()
+        if not selection:
+            nodes = self.tree.get_children()
+            target = nodes[0] if nodes else ""
+        else:
+            node = selection[0]
+            parent = self.tree.parent(node)
+            node = parent or node
+            target = self.tree.next(node) if step > 0 else self.tree.prev(node)
+        if target:
+            self.tree.selection_set(target)
+            self.tree.focus(target)
+            self.tree.see(target)
@@ -57,8 +57,10 @@ class JavaSearchApp:
             pass
         
         # 컴포넌트 초기화
-        self.search_engine = SearchEngine()
         self.config_manager = ConfigManager()
+        self.search_engine = SearchEngine(backend=self.config_manager.get("search_backend", "thread"))
+        self.search_engine.set_export_split(self.config_manager.get("export_split", "file"))
+        self.search_engine.set_result_cache_size(self.config_manager.get("result_cache_mb", 256))
         self.ui_settings_manager = UISettingsManager(self.config_manager)
         
         # UI 구성
@@ -133,6 +135,7 @@ class JavaSearchApp:
             self.search_handler.cancel_search()
         
         self.save_settings()
+        self.search_engine.shutdown()
         self.root.destroy()
     
     def run(self):
@@ -3,13 +3,36 @@ import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
 
+from ..core.result_store import ResultStore
+from .virtual_tree import VirtualTreeview
+from .grouped_tree import GroupedResultsTree
+
+
+# 결과 목록 컬럼 (정렬 기준과 같은 이름)과 제목 (파일별 그룹 보기는 파일을 트리 컬럼에 표시)
+RESULT_COLUMNS = ("file", "line", "content", "match")
+GROUPED_COLUMNS = RESULT_COLUMNS[1:]
+COLUMN_HEADINGS = {"file": "파일", "line": "라인", "content": "내용", "match": "매칭"}
+# 목록에 표시할 최대 내용 길이
+CONTENT_PREVIEW_LENGTH = 100
+
 
 class ResultsPanel:
     """검색 결과 표시 패널 UI 컴포넌트"""
     
     def __init__(self, parent):
         self.parent = parent
-        self.search_results = []
+        # 검색 엔진이 직접 채우는 결과 저장소 (복사하지 않고 공유)
+        self.result_store = ResultStore()
+        # 현재 정렬 (컬럼, 내림차순 여부), 검색 중 추가된 행이 있으면 완료 후 다시 정렬
+        self.sort_column = None
+        self.sort_descending = False
+        self.sort_stale = False
+        # 평면 목록에 반영한 결과 저장소 행 수 (중복 파일을 접으면 표시 행 수보다 많을 수 있음)
+        self.shown_rows = 0
+        # 파일별 그룹 보기 여부
+        self.group_by_file_var = ctk.BooleanVar(value=False)
+        # 같은 내용의 중복 파일 접기 여부 (동일 내용 파일 한 번만 검색한 결과에서 사용)
+        self.collapse_duplicates_var = ctk.BooleanVar(value=False)
         self.setup_ui()
     
     def setup_ui(self):
@@ -41,6 +64,15 @@ class ResultsPanel:
         
         self.count_label = ctk.CTkLabel(header_frame, text="0건")
         self.count_label.pack(side="right", padx=10)
+        
+        self.group_check = ctk.CTkCheckBox(header_frame, text="파일별 그룹", variable=self.group_by_file_var,
+                                           command=self.toggle_grouping)
+        self.group_check.pack(side="right", padx=10)
+        
+        self.collapse_check = ctk.CTkCheckBox(header_frame, text="중복 파일 접기",
+                                              variable=self.collapse_duplicates_var,
+                                              command=self.toggle_collapse)
+        self.collapse_check.pack(side="right", padx=10)
     
     def setup_progress_frame(self):
         """진행률 표시 프레임"""
@@ -58,6 +90,10 @@ class ResultsPanel:
         """결과 트리뷰 프레임"""
         tree_frame = ctk.CTkFrame(self.results_frame)
         tree_frame.pack(fill="both", expand=True, padx=10, pady=(5,10))
+        self.tree_frame = tree_frame
+        # 평면 목록과 파일별 그룹 트리는 각자의 프레임에 두고 보기 전환 시 프레임만 바꿈
+        self.flat_frame = ttk.Frame(tree_frame)
+        self.grouped_frame = ttk.Frame(tree_frame)
         
         # Treeview 스타일 설정
         style = ttk.Style()
@@ -68,31 +104,52 @@ class ResultsPanel:
                        borderwidth=1)
         style.map("Treeview", background=[("selected", "#1f538d")])
         
-        # 트리뷰 생성
-        columns = ("file", "line", "content", "match")
-        self.results_tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=15)
+        # 가상 트리뷰 생성 (보이는 행만 결과 저장소에서 읽어 그림)
+        self.results_view = VirtualTreeview(self.flat_frame, RESULT_COLUMNS, self.get_row_values, height=15)
+        self.results_tree = self.results_view.tree
         
-        # 컬럼 설정
-        self.results_tree.heading("file", text="파일")
-        self.results_tree.heading("line", text="라인")
-        self.results_tree.heading("content", text="내용")
-        self.results_tree.heading("match", text="매칭")
+        # 컬럼 설정 (제목 클릭 시 정렬)
+        for column in RESULT_COLUMNS:
+            self.results_tree.heading(column, text=COLUMN_HEADINGS[column],
+                                      command=lambda c=column: self.sort_results(c))
         
         # 반응형 컬럼 너비 설정
         self.setup_responsive_columns()
         
-        # 스크롤바
-        scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical", command=self.results_tree.yview)
-        scrollbar_x = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.results_tree.xview)
-        self.results_tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        # 스크롤바 (세로 스크롤은 가상 트리뷰가 직접 관리)
+        scrollbar_y = self.results_view.scrollbar
+        scrollbar_x = ttk.Scrollbar(self.flat_frame, orient="horizontal", command=self.results_tree.xview)
+        self.results_tree.configure(xscrollcommand=scrollbar_x.set)
         
         # 패킹
         self.results_tree.pack(side="left", fill="both", expand=True)
         scrollbar_y.pack(side="right", fill="y")
         scrollbar_x.pack(side="bottom", fill="x")
+        self.flat_frame.pack(fill="both", expand=True)
+        
+        # 파일별 그룹 트리 (파일 노드만 먼저 만들고 매칭 라인은 펼칠 때 생성)
+        self.grouped_view = GroupedResultsTree(self.grouped_frame, GROUPED_COLUMNS,
+                                               lambda index: self.get_row_values(index)[1:], height=15)
+        self.grouped_tree = self.grouped_view.tree
+        self.grouped_tree.heading("#0", text=COLUMN_HEADINGS["file"])
+        for column in GROUPED_COLUMNS:
+            self.grouped_tree.heading(column, text=COLUMN_HEADINGS[column])
+            self.grouped_tree.column(column, width=self.base_column_widths[column],
+                                     anchor=self.results_tree.column(column, "anchor"))
+        self.grouped_tree.column("#0", width=self.base_column_widths["file"], minwidth=200)
+        grouped_scrollbar_x = ttk.Scrollbar(self.grouped_frame, orient="horizontal", command=self.grouped_tree.xview)
+        self.grouped_tree.configure(xscrollcommand=grouped_scrollbar_x.set)
+        self.grouped_tree.pack(side="left", fill="both", expand=True)
+        self.grouped_view.scrollbar.pack(side="right", fill="y")
+        grouped_scrollbar_x.pack(side="bottom", fill="x")
         
         # 트리뷰 크기 변경 이벤트 바인딩
         tree_frame.bind("<Configure>", self.on_tree_resize)
+        
+        # Ctrl+↑/↓: 이전/다음 파일의 매칭으로 이동
+        for tree in (self.results_tree, self.grouped_tree):
+            tree.bind("<Control-Down>", lambda e: self.select_adjacent_file(1))
+            tree.bind("<Control-Up>", lambda e: self.select_adjacent_file(-1))
     
     def setup_responsive_columns(self):
         """반응형 컬럼 너비 설정"""
@@ -115,25 +172,29 @@ class ResultsPanel:
     
     def on_tree_resize(self, event):
         """트리뷰 크기 변경 시 컬럼 너비 조정"""
-        if event.widget == self.results_tree.master:
+        if event.widget == self.tree_frame:
             # 새로운 너비 계산
             new_width = event.width - 20  # 스크롤바 공간 고려
             
             # 파일 컬럼: 전체의 30%
             file_width = max(200, int(new_width * 0.3))
             self.results_tree.column("file", width=file_width)
+            self.grouped_tree.column("#0", width=file_width)
             
             # 라인 컬럼: 고정 너비
             line_width = 60
             self.results_tree.column("line", width=line_width)
+            self.grouped_tree.column("line", width=line_width)
             
             # 내용 컬럼: 전체의 50%
             content_width = max(300, int(new_width * 0.5))
             self.results_tree.column("content", width=content_width)
+            self.grouped_tree.column("content", width=content_width)
             
             # 매칭 컬럼: 전체의 20%
             match_width = max(100, new_width - file_width - line_width - content_width)
             self.results_tree.column("match", width=match_width)
+            self.grouped_tree.column("match", width=match_width)
     
     def setup_context_menu(self):
         """컨텍스트 메뉴 설정"""
@@ -152,59 +213,204 @@ class ResultsPanel:
         self.progress_frame.pack_forget()
     
     def update_progress(self, current, total, current_file):
-        """진행률 업데이트"""
+        """진행률 업데이트 (total은 탐색 중에 계속 늘어나는 발견 파일 수)"""
         if total > 0:
             progress = current / total
             self.progress_bar.set(progress)
-            self.progress_label.configure(text=f"검색 중... ({current}/{total}) {Path(current_file).name}")
+            file_name = Path(current_file).name if current_file else ""
+            self.progress_label.configure(text=f"검색 중... (검색 {current} / 발견 {total}) {file_name}")
+    
+    def update_export_progress(self, written, total, format_label="Excel"):
+        """내보내기 진행률 업데이트"""
+        if total > 0:
+            self.progress_bar.set(written / total)
+            self.progress_label.configure(text=f"{format_label} 내보내기 중... ({written:,} / {total:,}행)")
+    
+    def get_row_values(self, index):
+        """가상 트리뷰에 표시할 행 값"""
+        result = self.result_store[index]
+        content = result.content
+        if len(content) > CONTENT_PREVIEW_LENGTH:
+            content = content[:CONTENT_PREVIEW_LENGTH] + "..."
+        return (result.file_name, result.line_number, content, result.keyword or result.match_text)
     
     def add_result_batch(self, results):
-        """결과 배치 추가"""
-        for result in results:
-            self.results_tree.insert("", "end", values=(
-                result.file_name,
-                result.line_number,
-                result.content[:100] + "..." if len(result.content) > 100 else result.content,
-                result.match_text
-            ))
-            self.search_results.append(result)
-        
-        self.count_label.configure(text=f"{len(self.search_results)}건")
+        """결과 배치 추가 (결과는 이미 result_store에 들어 있으므로 표시할 행 수만 갱신)"""
+        self.show_result_count(len(self.result_store))
+    
+    @property
+    def grouped(self):
+        """파일별 그룹 보기 중인지 여부"""
+        return self.group_by_file_var.get()
+    
+    @property
+    def collapsed(self):
+        """같은 내용의 중복 파일을 접어 보는 중인지 여부"""
+        return self.collapse_duplicates_var.get()
+    
+    def toggle_grouping(self):
+        """평면 목록 ↔ 파일별 그룹 보기 전환 (그룹 트리는 지금까지의 파일 요약으로 다시 만듦)"""
+        if self.grouped:
+            self.flat_frame.pack_forget()
+            self.rebuild_grouped()
+            self.grouped_frame.pack(fill="both", expand=True)
+        else:
+            self.grouped_frame.pack_forget()
+            self.grouped_view.reset(None)
+            self.flat_frame.pack(fill="both", expand=True)
+    
+    def rebuild_grouped(self):
+        """그룹 트리를 지금까지의 파일 요약으로 다시 만듦"""
+        store = self.result_store
+        self.grouped_view.collapse_duplicates = self.collapsed
+        self.grouped_view.reset(store)
+        self.grouped_view.add_files([store.file_summary(file_id) for file_id in range(store.file_count)])
+    
+    def toggle_collapse(self):
+        """중복 파일 접기/펼치기 (접으면 같은 내용의 파일 중 대표 파일의 매칭만 표시)"""
+        self.apply_view_order()
+        if self.grouped:
+            self.rebuild_grouped()
+    
+    def add_file_summaries(self, summaries):
+        """검색이 끝난 파일 요약 추가 (그룹 보기일 때만 파일 노드 생성)"""
+        if self.grouped:
+            self.grouped_view.add_files(summaries)
+    
+    def show_result_count(self, row_count):
+        """표시할 행 수 갱신 (위젯 비용은 보이는 행 수에만 비례)"""
+        if self.sort_column is not None and row_count > self.shown_rows:
+            self.sort_stale = True
+        if self.collapsed:
+            # 새 행 중 대표 파일의 행만 순서 끝에 추가
+            order = self.results_view.order
+            order.extend(self.result_store.unique_rows(range(self.shown_rows, row_count)))
+            self.results_view.set_row_count(len(order))
+        else:
+            self.results_view.set_row_count(row_count)
+        self.shown_rows = row_count
+        self.update_count_label()
+    
+    def update_count_label(self):
+        """결과 수 표시 (중복 파일을 접었으면 표시 중인 행 수도 함께)"""
+        text = f"{self.shown_rows}건"
+        if self.collapsed:
+            text += f" (중복 접음: {self.results_view.row_count}건 표시)"
+        self.count_label.configure(text=text)
+    
+    def sort_results(self, column):
+        """컬럼 제목 클릭: 같은 컬럼이면 정렬 방향을 바꿈"""
+        if column == self.sort_column and not self.sort_stale:
+            self.sort_descending = not self.sort_descending
+        elif column != self.sort_column:
+            self.sort_descending = False
+        self.sort_column = column
+        self.apply_sort()
+    
+    def apply_sort(self):
+        """현재 정렬 기준으로 표시 중인 행 다시 정렬"""
+        if self.sort_column is None:
+            return
+        for column in RESULT_COLUMNS:
+            arrow = (" ▼" if self.sort_descending else " ▲") if column == self.sort_column else ""
+            self.results_tree.heading(column, text=COLUMN_HEADINGS[column] + arrow)
+        self.apply_view_order()
+    
+    def apply_view_order(self):
+        """정렬과 중복 파일 접기에 따라 평면 목록의 행 순서를 다시 계산"""
+        store = self.result_store
+        order = None
+        if self.sort_column is not None:
+            # 지금까지 표시된 행만 정렬 (이후 들어오는 행은 뒤에 추가)
+            order = store.sorted_indices(self.sort_column, self.sort_descending, self.shown_rows)
+            self.sort_stale = False
+        if self.collapsed:
+            order = store.unique_rows(order if order is not None else range(self.shown_rows))
+        self.results_view.set_order(order, self.shown_rows if order is None else len(order))
+        self.update_count_label()
+    
+    def refresh_sort(self):
+        """검색 중 정렬 후 추가된 행이 있으면 다시 정렬 (검색 완료 시 호출)"""
+        if self.sort_stale:
+            self.apply_sort()
     
     def clear_results(self):
-        """결과 지우기"""
-        self.results_tree.delete(*self.results_tree.get_children())
-        self.search_results.clear()
-        self.count_label.configure(text="0건")
+        """결과 지우기 (위젯에는 보이는 행만 있으므로 결과 수와 무관하게 즉시 완료)"""
+        # 진행 중인 검색이 이전 저장소에 추가하더라도 새 결과와 섞이지 않도록 교체
+        self.result_store = ResultStore()
+        self.results_view.reset()
+        self.grouped_view.reset(self.result_store)
+        self.sort_column = None
+        self.sort_descending = False
+        self.sort_stale = False
+        self.shown_rows = 0
+        for column in RESULT_COLUMNS:
+            self.results_tree.heading(column, text=COLUMN_HEADINGS[column])
+        # 중복 파일을 접은 상태면 빈 순서로 시작해 새 행을 걸러 추가
+        self.apply_view_order()
     
     def get_selected_result(self):
         """선택된 결과 반환"""
-        selection = self.results_tree.selection()
-        if not selection:
+        view = self.grouped_view if self.grouped else self.results_view
+        index = view.selected_index
+        if index is None or index >= len(self.result_store):
             return None
+        return self.result_store[index]
+    
+    def select_row_at(self, event):
+        """마우스 이벤트 위치의 행을 선택하고 결과 반환 (행이 없으면 None)"""
+        view = self.grouped_view if self.grouped else self.results_view
+        index = view.select_at(event.y)
+        if index is None:
+            return None
+        return self.result_store[index]
+    
+    def select_adjacent_file(self, step):
+        """선택된 행 기준으로 다음(step=1)/이전(step=-1) 파일의 첫 매칭 선택"""
+        if self.grouped:
+            self.grouped_view.select_adjacent_file(step)
+            return "break"
         
-        item = self.results_tree.item(selection[0])
-        file_name = item["values"][0]
+        view = self.results_view
+        if view.selected_position is None or not view.row_count:
+            return "break"
         
-        # 전체 경로 찾기
-        for result in self.search_results:
-            if result.file_name == file_name:
-                return result
+        store = self.result_store
+        if view.order is None:
+            # 추가된 순서에서는 파일 행이 연속이므로 파일별 행 구간으로 바로 이동
+            start, stop = store.file_range_at(view.selected_index)
+            position = stop if step > 0 else start - 1
+            if step < 0 and position >= 0:
+                position = store.file_range_at(position)[0]
+        else:
+            # 정렬된 순서에서는 파일이 바뀌는 위치까지 이동
+            file_id = store.file_id(view.selected_index)
+            position = view.selected_position + step
+            while 0 <= position < view.row_count and store.file_id(view.index_at(position)) == file_id:
+                position += step
+            if step < 0 and 0 <= position:
+                previous_id = store.file_id(view.index_at(position))
+                while position > 0 and store.file_id(view.index_at(position - 1)) == previous_id:
+                    position -= 1
         
-        return None
+        if 0 <= position < view.row_count:
+            view.select_position(position)
+        return "break"
     
     def bind_double_click(self, callback):
-        """더블클릭 이벤트 바인딩"""
+        """더블클릭 이벤트 바인딩 (평면 목록과 그룹 트리 모두)"""
         self.results_tree.bind("<Double-1>", callback)
+        self.grouped_tree.bind("<Double-1>", callback)
     
     def bind_right_click(self, callback):
-        """우클릭 이벤트 바인딩"""
+        """우클릭 이벤트 바인딩 (평면 목록과 그룹 트리 모두)"""
         self.results_tree.bind("<Button-3>", callback)
+        self.grouped_tree.bind("<Button-3>", callback)
     
     def get_results_count(self):
         """결과 개수 반환"""
-        return len(self.search_results)
+        return len(self.result_store)
     
     def get_all_results(self):
-        """모든 결과 반환"""
-        return self.search_results.copy()
+        """모든 결과 반환 (복사 없이 결과 저장소 그대로)"""
+        return self.result_store
@@ -89,6 +89,10 @@ class SearchPanel:
         self.keyword_entry = ctk.CTkEntry(keyword_input_frame, placeholder_text="검색할 키워드를 입력하세요...")
         self.keyword_entry.pack(side="left", fill="x", expand=True, padx=(5,5))
         
+        # 키워드 파일 불러오기 (한 줄에 하나)
+        self.keyword_file_btn = ctk.CTkButton(keyword_input_frame, text="키워드 파일", width=100)
+        self.keyword_file_btn.pack(side="right", padx=(5,5))
+        
         # 최근 검색어 콤보박스
         self.recent_search_combo = ctk.CTkComboBox(keyword_input_frame, width=120,
                                                   values=["최근 검색"])
@@ -123,6 +127,11 @@ class SearchPanel:
         self.word_check = ctk.CTkCheckBox(first_row, text="단어 단위 검색", variable=self.word_var)
         self.word_check.pack(side="left", padx=10)
         
+        self.multi_keyword_var = ctk.BooleanVar(value=False)
+        self.multi_keyword_check = ctk.CTkCheckBox(first_row, text="다중 키워드 (쉼표 구분)",
+                                                   variable=self.multi_keyword_var)
+        self.multi_keyword_check.pack(side="left", padx=10)
+        
         # 두 번째 줄 (반응형으로 추가)
         second_row = ctk.CTkFrame(checkbox_frame)
         second_row.pack(fill="x", pady=2)
@@ -134,6 +143,14 @@ class SearchPanel:
         self.binary_var = ctk.BooleanVar(value=False)
         self.binary_check = ctk.CTkCheckBox(second_row, text="바이너리 파일 포함", variable=self.binary_var)
         self.binary_check.pack(side="left", padx=10)
+        
+        self.dedupe_var = ctk.BooleanVar(value=False)
+        self.dedupe_check = ctk.CTkCheckBox(second_row, text="동일 내용 파일 한 번만 검색", variable=self.dedupe_var)
+        self.dedupe_check.pack(side="left", padx=10)
+        
+        self.daemon_var = ctk.BooleanVar(value=True)
+        self.daemon_check = ctk.CTkCheckBox(second_row, text="검색 데몬 사용 (실행 중이면)", variable=self.daemon_var)
+        self.daemon_check.pack(side="left", padx=10)
     
     def setup_extensions_frame(self, parent):
         """파일 확장자 프레임"""
@@ -193,6 +210,10 @@ class SearchPanel:
         ctk.CTkLabel(second_adv_row, text="검색 깊이:").pack(side="left", padx=(10,5))
         self.max_depth_entry = ctk.CTkEntry(second_adv_row, width=100, placeholder_text="10")
         self.max_depth_entry.pack(side="left", padx=(5,10))
+        
+        ctk.CTkLabel(second_adv_row, text="최대 파일 크기(MB):").pack(side="left", padx=(10,5))
+        self.max_file_size_entry = ctk.CTkEntry(second_adv_row, width=100, placeholder_text="20")
+        self.max_file_size_entry.pack(side="left", padx=(5,10))
     
     def setup_button_frame(self):
         """버튼 프레임"""
@@ -219,6 +240,10 @@ class SearchPanel:
         self.clear_btn = ctk.CTkButton(button_frame, text="🗑️ 결과 지우기", 
                                       height=40)
         self.clear_btn.pack(side="right", padx=5)
+        
+        self.clear_cache_btn = ctk.CTkButton(button_frame, text="🧹 캐시 비우기", 
+                                            height=40)
+        self.clear_cache_btn.pack(side="right", padx=5)
     
     def get_search_config(self):
         """검색 설정 반환"""
@@ -228,16 +253,27 @@ class SearchPanel:
             'use_regex': self.regex_var.get(),
             'case_sensitive': self.case_var.get(),
             'whole_word': self.word_var.get(),
+            'multi_keyword': self.multi_keyword_var.get(),
+            'keywords': self.get_keywords(),
             'recursive_search': self.recursive_var.get(),
             'include_binary': self.binary_var.get(),
+            'dedupe_content': self.dedupe_var.get(),
+            'use_daemon': self.daemon_var.get(),
             'extensions': [ext.strip() for ext in self.extensions_entry.get().split(",") if ext.strip()],
             'exclude_patterns': [pattern.strip() for pattern in self.exclude_entry.get().split(",") if pattern.strip()],
             'encoding': self.encoding_combo.get(),
             'output_file': self.output_entry.get().strip(),
             'max_results': int(self.max_results_entry.get()) if self.max_results_entry.get().strip() else 1000,
-            'max_depth': int(self.max_depth_entry.get()) if self.max_depth_entry.get().strip() else 10
+            'max_depth': int(self.max_depth_entry.get()) if self.max_depth_entry.get().strip() else 10,
+            'max_file_size_mb': float(self.max_file_size_entry.get()) if self.max_file_size_entry.get().strip() else 20
         }
     
+    def get_keywords(self):
+        """다중 키워드 목록 반환 (다중 키워드 모드가 아니면 빈 리스트)"""
+        if not self.multi_keyword_var.get():
+            return []
+        return [keyword.strip() for keyword in self.keyword_entry.get().split(",") if keyword.strip()]
+    
     def set_search_config(self, config):
         """검색 설정 설정"""
         self.dir_entry.delete(0, tk.END)
@@ -251,6 +287,8 @@ class SearchPanel:
         self.word_var.set(config.get('whole_word', False))
         self.recursive_var.set(config.get('recursive_search', True))
         self.binary_var.set(config.get('include_binary', False))
+        self.dedupe_var.set(config.get('dedupe_content', False))
+        self.daemon_var.set(config.get('use_daemon', True))
         
         extensions = config.get('file_extensions', [".java", ".xml", ".properties"])
         self.extensions_entry.delete(0, tk.END)
@@ -269,6 +307,9 @@ class SearchPanel:
         
         self.max_depth_entry.delete(0, tk.END)
         self.max_depth_entry.insert(0, str(config.get('max_depth', 10)))
+        
+        self.max_file_size_entry.delete(0, tk.END)
+        self.max_file_size_entry.insert(0, str(config.get('max_file_size_mb', 20)))
     
     def update_recent_combos(self, recent_searches, recent_directories):
         """최근 검색 콤보박스 업데이트"""
@@ -19,6 +19,10 @@ class UISettingsManager:
             'file_extensions': self.config_manager.get("file_extensions", [".java", ".xml", ".properties"]),
             'exclude_patterns': self.config_manager.get("exclude_patterns", []),
             'file_encoding': self.config_manager.get("file_encoding", "utf-8"),
+            'include_binary': self.config_manager.get("include_binary", False),
+            'dedupe_content': self.config_manager.get("dedupe_content", False),
+            'use_daemon': self.config_manager.get("use_daemon", True),
+            'max_file_size_mb': self.config_manager.get("max_file_size_mb", 20),
             'output_file': self.config_manager.get("output_file", "search_results.xlsx")
         }
         
@@ -40,6 +44,10 @@ class UISettingsManager:
         self.config_manager.set("file_extensions", config['extensions'])
         self.config_manager.set("exclude_patterns", config['exclude_patterns'])
         self.config_manager.set("file_encoding", config['encoding'])
+        self.config_manager.set("include_binary", config['include_binary'])
+        self.config_manager.set("dedupe_content", config['dedupe_content'])
+        self.config_manager.set("use_daemon", config['use_daemon'])
+        self.config_manager.set("max_file_size_mb", config['max_file_size_mb'])
         self.config_manager.set("output_file", config['output_file'])
         self.config_manager.set("window_geometry", root.geometry())
         
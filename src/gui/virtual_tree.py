@@ -0,0 +1,195 @@
+from tkinter import ttk
+from typing import Callable, Optional, Sequence, Tuple
+
+
+# 행 높이/헤더 높이 기본값 (첫 행을 그린 뒤 실제 크기로 갱신)
+DEFAULT_ROW_HEIGHT = 20
+DEFAULT_HEADING_HEIGHT = 24
+# 마우스 휠 한 칸에 스크롤할 행 수
+WHEEL_SCROLL_ROWS = 3
+
+
+class VirtualTreeview:
+    """보이는 구간의 행만 그리는 가상 Treeview
+
+    전체 행은 위젯에 넣지 않고 row_values(행 인덱스)로 필요할 때만 값을 가져옵니다.
+    화면에 보이는 행 수만큼의 항목만 유지하므로 결과가 수백만 건이어도 위젯 비용과 메모리가 일정하고,
+    행 추가는 행 수만 바꾸면 됩니다. 항목 ID는 결과 행 인덱스 문자열입니다.
+    정렬은 행 인덱스 순서 배열(order)로 표현하며 세로 스크롤바는 직접 관리합니다.
+    """
+
+    def __init__(self, parent, columns: Sequence[str], row_values: Callable[[int], Tuple], **tree_options):
+        self.row_values = row_values
+        self.tree = ttk.Treeview(parent, columns=columns, show="headings", selectmode="browse", **tree_options)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.yview)
+        self.row_count = 0
+        # 화면 첫 행의 위치 (정렬 순서 기준)
+        self.top = 0
+        self.visible_rows = 1
+        # 정렬 순서 (위치 → 행 인덱스, None이면 추가된 순서)
+        self.order = None
+        # 선택된 행 인덱스와 화면상 위치 (화면 밖으로 스크롤되어도 유지)
+        self.selected_index: Optional[int] = None
+        self.selected_position: Optional[int] = None
+        self._row_height = DEFAULT_ROW_HEIGHT
+        self._heading_height = DEFAULT_HEADING_HEIGHT
+        self._measured = False
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda e: self._scroll_rows(-WHEEL_SCROLL_ROWS))
+        self.tree.bind("<Button-5>", lambda e: self._scroll_rows(WHEEL_SCROLL_ROWS))
+        for key, delta in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda e, d=delta: self.move_selection(d))
+        self.tree.bind("<Prior>", lambda e: self.move_selection(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self.move_selection(self.visible_rows))
+        self.tree.bind("<Home>", lambda e: self.move_selection(-self.row_count))
+        self.tree.bind("<End>", lambda e: self.move_selection(self.row_count))
+
+    def index_at(self, position: int) -> int:
+        """화면상 위치의 행 인덱스"""
+        return self.order[position] if self.order is not None else position
+
+    def set_row_count(self, row_count: int):
+        """행 수 변경 (새 행은 정렬 순서의 끝에 추가)"""
+        if row_count == self.row_count:
+            return
+        old_count = self.row_count
+        self.row_count = row_count
+        if self.order is not None and row_count > len(self.order):
+            self.order.extend(range(len(self.order), row_count))
+        # 보이는 구간이 바뀌는 경우에만 다시 그림
+        if old_count < self.top + self.visible_rows or row_count < old_count:
+            self.render()
+        else:
+            self._update_scrollbar()
+
+    def set_order(self, order, row_count: Optional[int] = None):
+        """정렬 순서 설정 (None이면 추가된 순서), 선택된 행은 유지
+
+        row_count가 있으면 행 수도 함께 바꿉니다. (중복 파일 접기처럼 순서에서 행이 빠지는 경우)
+        """
+        self.order = order
+        if row_count is not None:
+            self.row_count = row_count
+        if self.selected_index is not None:
+            try:
+                self.selected_position = (self.selected_index if order is None
+                                          else order.index(self.selected_index))
+                self._scroll_to(self.selected_position)
+            except ValueError:
+                # 선택된 행이 순서에서 빠지면 선택 해제
+                self.selected_index = self.selected_position = None
+        self.render()
+
+    def reset(self):
+        """모든 행 제거"""
+        self.row_count = 0
+        self.top = 0
+        self.order = None
+        self.selected_index = None
+        self.selected_position = None
+        self.render()
+
+    def render(self):
+        """보이는 구간의 행만 다시 그림"""
+        self.top = max(0, min(self.top, self.row_count - self.visible_rows))
+        stop = min(self.row_count, self.top + self.visible_rows)
+        self.tree.delete(*self.tree.get_children())
+        for position in range(self.top, stop):
+            index = self.index_at(position)
+            self.tree.insert("", "end", iid=str(index), values=self.row_values(index))
+
+        if self.selected_index is not None and self.tree.exists(str(self.selected_index)):
+            self.tree.selection_set(str(self.selected_index))
+            self.tree.focus(str(self.selected_index))
+        self._update_scrollbar()
+        if not self._measured and stop > self.top:
+            self._measure()
+
+    def _measure(self):
+        """그려진 첫 행으로 실제 행/헤더 높이 측정"""
+        bbox = self.tree.bbox(self.tree.get_children()[0])
+        if bbox:
+            self._heading_height, self._row_height = bbox[1], max(1, bbox[3])
+            self._measured = True
+            self._update_visible_rows(self.tree.winfo_height())
+
+    def _update_visible_rows(self, height: int):
+        visible_rows = max(1, (height - self._heading_height) // self._row_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.render()
+
+    def _update_scrollbar(self):
+        if self.row_count <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / self.row_count, (self.top + self.visible_rows) / self.row_count)
+
+    def _on_configure(self, event):
+        self._update_visible_rows(event.height)
+
+    def _on_select(self, event):
+        # 다시 그리면서 항목이 지워질 때의 빈 선택은 무시
+        selection = self.tree.selection()
+        if selection:
+            self.selected_index = int(selection[0])
+            self.selected_position = self.top + self.tree.index(selection[0])
+
+    def _on_mouse_wheel(self, event):
+        # Windows는 한 칸에 120, macOS는 1 단위
+        steps = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self._scroll_rows(-steps * WHEEL_SCROLL_ROWS)
+        return "break"
+
+    def _scroll_rows(self, rows: int):
+        self._scroll_to_top(self.top + rows)
+        return "break"
+
+    def _scroll_to_top(self, top: int):
+        top = max(0, min(top, self.row_count - self.visible_rows))
+        if top != self.top:
+            self.top = top
+            self.render()
+
+    def _scroll_to(self, position: int):
+        """위치가 화면에 보이도록 스크롤 (다시 그리지는 않음)"""
+        if position < self.top:
+            self.top = position
+        elif position >= self.top + self.visible_rows:
+            self.top = position - self.visible_rows + 1
+
+    def yview(self, *args):
+        """스크롤바 명령 처리 (moveto 비율 / scroll n units|pages)"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._scroll_to_top(int(float(args[1]) * self.row_count))
+        elif args[0] == "scroll":
+            rows = int(args[1]) * (self.visible_rows if args[2] == "pages" else 1)
+            self._scroll_rows(rows)
+
+    def move_selection(self, delta: int):
+        """키보드로 선택 이동 (화면 밖이면 스크롤)"""
+        if not self.row_count:
+            return "break"
+        position = self.top if self.selected_position is None else self.selected_position + delta
+        self.select_position(max(0, min(position, self.row_count - 1)))
+        return "break"
+
+    def select_at(self, y: int) -> Optional[int]:
+        """마우스 y 좌표의 행을 선택하고 행 인덱스 반환 (행이 없으면 None)"""
+        item = self.tree.identify_row(y)
+        if not item:
+            return None
+        self.select_position(self.top + self.tree.index(item))
+        return self.selected_index
+
+    def select_position(self, position: int):
+        """위치의 행을 선택하고 화면에 보이게 함"""
+        self.selected_position = position
+        self.selected_index = self.index_at(position)
+        self._scroll_to(position)
+        self.render()